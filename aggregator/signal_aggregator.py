@@ -102,7 +102,7 @@ class SignalAggregator:
         combined_signal["signal"] = sum(df * weight for df, weight in zip(signal_dfs, weights))
         
         # Add binary signal based on threshold
-        combined_signal["binary_signal"] = (combined_signal["signal"] > self.threshold).astype(int)
+        combined_signal["binary_signal"] = (combined_signal["signal"] > self.threshold).astype(np.int8)
         
         # Add metadata
         self.metadata = {
@@ -132,7 +132,7 @@ class SignalAggregator:
             if "binary_signal" not in signals.columns:
                 if "signal" in signals.columns:
                     # Convert continuous signal to binary using threshold
-                    binary_signal = (signals["signal"] > 0.5).astype(int)
+                    binary_signal = (signals["signal"] > 0.5).astype(np.int8)
                 else:
                     logger.warning(f"DataFrame missing signal columns, skipping")
                     continue
@@ -158,7 +158,7 @@ class SignalAggregator:
         combined_signal["signal"] = sum(bs * weight for bs, weight in zip(binary_signals, weights))
         
         # Add binary signal based on threshold (default 0.5 for majority)
-        combined_signal["binary_signal"] = (combined_signal["signal"] > self.threshold).astype(int)
+        combined_signal["binary_signal"] = (combined_signal["signal"] > self.threshold).astype(np.int8)
         
         # Add metadata
         self.metadata = {
@@ -187,7 +187,7 @@ class SignalAggregator:
             if "binary_signal" not in signals.columns:
                 if "signal" in signals.columns:
                     # Convert continuous signal to binary using threshold
-                    binary_signal = (signals["signal"] > 0.5).astype(int)
+                    binary_signal = (signals["signal"] > 0.5).astype(np.int8)
                 else:
                     logger.warning(f"DataFrame missing signal columns, skipping")
                     continue
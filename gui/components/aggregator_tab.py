@@ -20,6 +20,7 @@ class AggregatorTab(QWidget):
     def __init__(self, config_controller):
         super().__init__()
         self.config_controller = config_controller
+        self.dirty = False
         self.init_ui()
     
     def init_ui(self):
@@ -59,6 +60,14 @@ class AggregatorTab(QWidget):
         
         # Initialize with current method
         self.on_method_changed(self.method_combo.currentText())
+        
+        # Track edits so the configuration is only rebuilt when needed
+        self.method_combo.currentTextChanged.connect(self.mark_dirty)
+        self.threshold_spin.valueChanged.connect(self.mark_dirty)
+    
+    def mark_dirty(self, *args):
+        """Flag that the UI has changes not yet written to the configuration"""
+        self.dirty = True
     
     def on_method_changed(self, method):
         """Handle aggregation method change"""
@@ -89,6 +98,9 @@ class AggregatorTab(QWidget):
         
         # Set threshold
         self.threshold_spin.setValue(aggregator_config.get("threshold", 0.5))
+        
+        # The UI now mirrors the configuration
+        self.dirty = False
     
     def update_config(self):
         """Update configuration from UI"""
@@ -98,4 +110,5 @@ class AggregatorTab(QWidget):
         }
         
         # Update configuration
-        self.config_controller.set_aggregator_config(aggregator_config)
\ No newline at end of file
+        self.config_controller.set_aggregator_config(aggregator_config)
+        self.dirty = False
\ No newline at end of file
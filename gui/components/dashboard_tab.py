@@ -32,6 +32,15 @@ from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as Navigatio
 logger = logging.getLogger(__name__)
 
 
+def _signal_changes(signal):
+    """Mask of bars where the signal changes, like signal.diff().fillna(0) != 0"""
+    values = signal.to_numpy(dtype=np.float64)
+    changes = np.zeros(len(values), dtype=bool)
+    steps = np.diff(values)
+    changes[1:] = (steps != 0) & ~np.isnan(steps)
+    return changes
+
+
 class MplCanvas(FigureCanvas):
     """Matplotlib canvas for interactive charts"""
     
@@ -781,6 +790,8 @@ class DashboardTab(QWidget):
             QMessageBox.information(self, "No Data", "No analysis results available. Run an analysis to see performance metrics.")
             return
         
+        from reports.performance_metrics import calculate_sharpe_ratio, calculate_max_drawdown
+        
         # Calculate performance metrics if market data is available
         market_data = results.get('market_data')
         signals_df = results.get('signals')
@@ -793,45 +804,32 @@ class DashboardTab(QWidget):
             market_returns = market_data['returns']
             market_cum_returns = (1 + market_returns).cumprod() - 1
             
-            # Process each strategy
-            for column in signals_df.columns:
-                # Use signals to determine position
-                signals = signals_df[column].fillna(0)
-                position = signals.shift(1).fillna(0)
-                
-                # Calculate strategy returns
-                strategy_return = position * market_returns
-                strategy_cum_return = (1 + strategy_return).cumprod() - 1
-                
-                # Calculate metrics
-                total_return = strategy_cum_return.iloc[-1] * 100 if len(strategy_cum_return) > 0 else 0
-                
-                # Calculate Sharpe ratio (annualized)
-                if strategy_return.std() > 0:
-                    sharpe = np.sqrt(252) * strategy_return.mean() / strategy_return.std()
-                else:
-                    sharpe = 0
-                
-                # Calculate max drawdown
-                peak = np.maximum.accumulate(1 + strategy_cum_return)
-                drawdown = (1 + strategy_cum_return) / peak - 1
-                max_drawdown = drawdown.min() * 100
-                
-                # Calculate win rate
-                if len(strategy_return) > 0:
-                    win_rate = (strategy_return > 0).sum() / len(strategy_return) * 100
-                else:
-                    win_rate = 0
-                
-                # Store metrics for this strategy
-                if not hasattr(self, 'strategy_metrics'):
-                    self.strategy_metrics = {}
-                
+            # Position matrix (time x strategies): yesterday's signal, flat when missing
+            positions = signals_df.fillna(0).shift(1).fillna(0).to_numpy(dtype=np.float64)
+            strategy_returns = positions * market_returns.to_numpy(dtype=np.float64)[:, np.newaxis]
+            num_periods = strategy_returns.shape[0]
+            
+            # Evaluate all strategies at once along the time axis
+            sharpe = np.sqrt(252) * calculate_sharpe_ratio(strategy_returns, axis=0)
+            sharpe = np.where(np.isfinite(sharpe), sharpe, 0)
+            max_drawdown = calculate_max_drawdown(strategy_returns, axis=0) * 100
+            if num_periods > 0:
+                total_return = (np.nancumprod(1 + strategy_returns, axis=0)[-1] - 1) * 100
+                win_rate = (strategy_returns > 0).sum(axis=0) / num_periods * 100
+            else:
+                total_return = np.zeros(strategy_returns.shape[1])
+                win_rate = np.zeros(strategy_returns.shape[1])
+            
+            # Store metrics for each strategy
+            if not hasattr(self, 'strategy_metrics'):
+                self.strategy_metrics = {}
+            
+            for i, column in enumerate(signals_df.columns):
                 self.strategy_metrics[column] = {
-                    'total_return': total_return,
-                    'sharpe_ratio': sharpe,
-                    'max_drawdown': max_drawdown,
-                    'win_rate': win_rate
+                    'total_return': total_return[i],
+                    'sharpe_ratio': sharpe[i],
+                    'max_drawdown': max_drawdown[i],
+                    'win_rate': win_rate[i]
                 }
             
             # Update the dashboard with the latest data
@@ -867,8 +865,7 @@ class DashboardTab(QWidget):
             
             for strategy_name, strategy_data in strategy_groups:
                 # Calculate basic metrics
-                signal_changes = strategy_data['signal'].diff().fillna(0)
-                num_trades = (signal_changes != 0).sum()
+                num_trades = int(np.count_nonzero(_signal_changes(strategy_data['signal'])))
                 
                 # Calculate win rate if we have performance data
                 win_rate = 0
@@ -1149,8 +1146,7 @@ class DashboardTab(QWidget):
             price_changes = signals_df['close'].pct_change() * 100
             
             # Filter for trades (where signal changes)
-            signal_changes = signals_df['signal'].diff().fillna(0)
-            trades = price_changes[signal_changes != 0]
+            trades = price_changes[_signal_changes(signals_df['signal'])]
             
             # Plot histogram of trade returns
             if not trades.empty:
@@ -23,6 +23,7 @@ class DataTab(QWidget):
     def __init__(self, config_controller):
         super().__init__()
         self.config_controller = config_controller
+        self.dirty = False
         self.init_ui()
     
     def init_ui(self):
@@ -105,6 +106,19 @@ class DataTab(QWidget):
         main_layout.addStretch(1)
         
         self.setLayout(main_layout)
+        
+        # Track edits so the configuration is only rebuilt when needed
+        self.source_type_combo.currentTextChanged.connect(self.mark_dirty)
+        self.symbol_edit.textChanged.connect(self.mark_dirty)
+        self.timeframe_combo.currentTextChanged.connect(self.mark_dirty)
+        self.start_date_edit.dateChanged.connect(self.mark_dirty)
+        self.end_date_edit.dateChanged.connect(self.mark_dirty)
+        self.csv_path_edit.textChanged.connect(self.mark_dirty)
+        self.api_key_edit.textChanged.connect(self.mark_dirty)
+    
+    def mark_dirty(self, *args):
+        """Flag that the UI has changes not yet written to the configuration"""
+        self.dirty = True
     
     def on_source_type_changed(self, source_type):
         """Handle source type change"""
@@ -154,6 +168,9 @@ class DataTab(QWidget):
         # Set Alpha Vantage API key
         if source_type == "alpha_vantage":
             self.api_key_edit.setText(data_config.get("api_key", ""))
+        
+        # The UI now mirrors the configuration
+        self.dirty = False
     
     def update_config(self):
         """Update configuration from UI"""
@@ -181,4 +198,5 @@ class DataTab(QWidget):
             data_config["api_key"] = self.api_key_edit.text()
         
         # Update configuration
-        self.config_controller.set_data_source_config(data_config)
\ No newline at end of file
+        self.config_controller.set_data_source_config(data_config)
+        self.dirty = False
\ No newline at end of file
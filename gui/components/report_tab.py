@@ -22,6 +22,7 @@ class ReportTab(QWidget):
     def __init__(self, config_controller):
         super().__init__()
         self.config_controller = config_controller
+        self.dirty = False
         self.init_ui()
     
     def init_ui(self):
@@ -64,6 +65,15 @@ class ReportTab(QWidget):
         main_layout.addStretch(1)
         
         self.setLayout(main_layout)
+        
+        # Track edits so the configuration is only rebuilt when needed
+        self.format_combo.currentTextChanged.connect(self.mark_dirty)
+        self.include_plots_check.stateChanged.connect(self.mark_dirty)
+        self.output_dir_edit.textChanged.connect(self.mark_dirty)
+    
+    def mark_dirty(self, *args):
+        """Flag that the UI has changes not yet written to the configuration"""
+        self.dirty = True
     
     def browse_output_dir(self):
         """Open directory dialog to select output directory"""
@@ -87,6 +97,9 @@ class ReportTab(QWidget):
         
         # Set output directory
         self.output_dir_edit.setText(report_config.get("output_dir", "reports/output"))
+        
+        # The UI now mirrors the configuration
+        self.dirty = False
     
     def update_config(self):
         """Update configuration from UI"""
@@ -97,4 +110,5 @@ class ReportTab(QWidget):
         }
         
         # Update configuration
-        self.config_controller.set_report_config(report_config)
\ No newline at end of file
+        self.config_controller.set_report_config(report_config)
+        self.dirty = False
\ No newline at end of file
@@ -24,6 +24,7 @@ class StrategyTab(QWidget):
         super().__init__()
         self.config_controller = config_controller
         self.strategies = []
+        self.dirty = False
         self.init_ui()
     
     def init_ui(self):
@@ -287,6 +288,7 @@ class StrategyTab(QWidget):
         
         # Add to strategies list
         self.strategies.append(strategy)
+        self.dirty = True
         
         # Update table
         self.update_strategies_table()
@@ -332,6 +334,7 @@ class StrategyTab(QWidget):
         
         # Delete the strategy (will be re-added when saved)
         self.strategies.pop(row)
+        self.dirty = True
         self.update_strategies_table()
     
     def remove_strategy(self):
@@ -348,6 +351,7 @@ class StrategyTab(QWidget):
         
         if reply == QMessageBox.Yes:
             self.strategies.pop(row)
+            self.dirty = True
             self.update_strategies_table()
     
     def save_strategy(self):
@@ -397,6 +401,7 @@ class StrategyTab(QWidget):
         
         # Add to strategies list
         self.strategies.append(strategy)
+        self.dirty = True
         
         # Update table
         self.update_strategies_table()
@@ -405,6 +410,7 @@ class StrategyTab(QWidget):
         """Update UI from configuration"""
         # Get strategies from configuration
         self.strategies = self.config_controller.get_strategies_config()
+        self.dirty = False
         
         # Update table
         self.update_strategies_table()
@@ -412,4 +418,5 @@ class StrategyTab(QWidget):
     def update_config(self):
         """Update configuration from UI"""
         # Update configuration with current strategies
-        self.config_controller.set_strategies_config(self.strategies)
\ No newline at end of file
+        self.config_controller.set_strategies_config(self.strategies)
+        self.dirty = False
\ No newline at end of file
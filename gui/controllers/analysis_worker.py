@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Analysis Worker for the Trading Strategy Aggregation System GUI
+
+This module runs the analysis pipeline on a background thread so the main
+window stays responsive while data is loaded and strategies are processed.
+"""
+
+import logging
+from PyQt5.QtCore import QObject, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+class AnalysisWorker(QObject):
+    """Worker object that executes an analysis run inside a QThread"""
+    
+    # Emitted with (success, message) when the run is over
+    finished = pyqtSignal(bool, str)
+    # Emitted with (completed, total) after each strategy is processed
+    strategy_done = pyqtSignal(int, int)
+    
+    def __init__(self, execution_controller):
+        """Initialize the worker"""
+        super().__init__()
+        self.execution_controller = execution_controller
+    
+    def run(self):
+        """Run the analysis and report the outcome"""
+        logger.info("Starting analysis on worker thread")
+        success, message = self.execution_controller.run_analysis(
+            progress_callback=self.strategy_done.emit
+        )
+        self.finished.emit(success, message)
@@ -8,11 +8,12 @@ This module handles loading, saving, and managing the application configuration.
 """
 
 import os
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, Tuple, List
 
+from utils import fast_json
+
 logger = logging.getLogger(__name__)
 
 class ConfigController:
@@ -80,8 +81,8 @@ class ConfigController:
         """Load configuration from JSON file"""
         try:
             if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    self.config = json.load(f)
+                with open(config_path, 'rb') as f:
+                    self.config = fast_json.loads(f.read())
                 self.config_path = config_path
                 self.dirty = False
                 logger.info(f"Configuration loaded from {config_path}")
@@ -97,8 +98,8 @@ class ConfigController:
         """Save configuration to a JSON file"""
         try:
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
-            with open(config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            with open(config_path, 'wb') as f:
+                f.write(fast_json.dumps(self.config, indent=True))
             self.config_path = config_path
             self.dirty = False
             logger.info(f"Configuration saved to {config_path}")
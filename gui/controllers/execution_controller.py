@@ -9,96 +9,241 @@ processing of the results.
 """
 
 import os
+import copy
+import glob
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Callable
 
-# Import core functionality
-from strategies.strategy_factory import StrategyFactory
-from strategies.moving_average_crossover import MovingAverageCrossover
-from strategies.rsi_strategy import RSIStrategy
-from strategies.macd_strategy import MACDStrategy
-from aggregator.signal_aggregator import SignalAggregator
-from reports.report_generator import ReportGenerator
-from data.data_loader import DataLoader
+from utils.paths import ensure_directories
+from utils import fast_json
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of strategy outputs kept in the in-memory signal cache
+SIGNAL_CACHE_SIZE = 16
+
+# Maximum number of sig_*.pkl files kept in the cache directory; the least
+# recently used are deleted first, including files left by older cache versions
+SIGNAL_DISK_CACHE_SIZE = 64
+
+# Part of every signal cache key; bump when the cached entry layout changes
+SIGNAL_CACHE_VERSION = 2
+
+# Columns that may be narrowed to float32 through the data source "dtype" option;
+# volume and any other numeric columns always stay float64
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+# Maximum number of strategies configurations whose resolved pipelines are kept
+PIPELINE_CACHE_SIZE = 32
+
+# Pipeline spec -> (strategy class, name, parameters, weight) per strategy, for specs
+# whose strategies all resolved. Holds no instances, so runs never share state.
+_resolved_pipelines = OrderedDict()
+_resolved_pipelines_lock = threading.Lock()
+
+def resolve_pipeline(strategy_spec: Tuple[Tuple[str, bytes, float], ...]) -> Tuple[Optional[Tuple[type, str, Dict[str, Any], float]], ...]:
+    """Resolve a strategies configuration to strategy classes and decoded parameters
+    
+    The result is memoized on the hashable spec, so re-running an unchanged
+    configuration skips registering, importing and validating every strategy
+    again. Specs with a strategy that could not be created are not memoized,
+    so a later run retries them.
+    
+    Args:
+        strategy_spec: One (name, JSON-encoded parameters, weight) tuple per strategy
+        
+    Returns:
+        Tuple aligned with the spec holding each strategy's (class, name,
+        parameters, weight), or None where the strategy could not be created
+    """
+    with _resolved_pipelines_lock:
+        resolved = _resolved_pipelines.get(strategy_spec)
+        if resolved is not None:
+            _resolved_pipelines.move_to_end(strategy_spec)
+            return resolved
+    
+    from strategies.strategy_factory import StrategyFactory
+    from strategies.moving_average_crossover import MovingAverageCrossover
+    from strategies.rsi_strategy import RSIStrategy
+    from strategies.macd_strategy import MACDStrategy
+    
+    strategy_factory = StrategyFactory()
+    strategy_factory.register_strategy("MovingAverageCrossover", MovingAverageCrossover)
+    strategy_factory.register_strategy("RSIStrategy", RSIStrategy)
+    strategy_factory.register_strategy("MACDStrategy", MACDStrategy)
+    
+    resolved = []
+    for strategy_name, strategy_params, strategy_weight in strategy_spec:
+        parameters = fast_json.loads(strategy_params)
+        # Creating one instance validates the parameters and resolves the class
+        strategy = strategy_factory.create_strategy(strategy_name, copy.deepcopy(parameters))
+        if strategy:
+            resolved.append((type(strategy), strategy_name, parameters, strategy_weight))
+        else:
+            logger.warning("Failed to initialize strategy: %s", strategy_name)
+            resolved.append(None)
+    resolved = tuple(resolved)
+    
+    if all(entry is not None for entry in resolved):
+        with _resolved_pipelines_lock:
+            _resolved_pipelines[strategy_spec] = resolved
+            _resolved_pipelines.move_to_end(strategy_spec)
+            while len(_resolved_pipelines) > PIPELINE_CACHE_SIZE:
+                _resolved_pipelines.popitem(last=False)
+    return resolved
+
+
+def build_pipeline(strategy_spec: Tuple[Tuple[str, bytes, float], ...]) -> Tuple[Optional[Any], ...]:
+    """Build fresh strategy instances for a strategies configuration
+    
+    Instances hold per-run state (signals, metadata), so every call
+    constructs new ones from the memoized resolve_pipeline result.
+    
+    Args:
+        strategy_spec: One (name, JSON-encoded parameters, weight) tuple per strategy
+        
+    Returns:
+        Tuple aligned with the spec holding each strategy, or None where
+        the strategy could not be created
+    """
+    pipeline = []
+    for entry in resolve_pipeline(strategy_spec):
+        if entry is None:
+            pipeline.append(None)
+            continue
+        strategy_class, strategy_name, parameters, strategy_weight = entry
+        strategy = strategy_class(strategy_name, copy.deepcopy(parameters))
+        strategy.set_weight(strategy_weight)
+        logger.info("Initialized strategy: %s with weight %s", strategy_name, strategy_weight)
+        pipeline.append(strategy)
+    
+    return tuple(pipeline)
+
+
+@lru_cache(maxsize=None)
+def _strategies_code_version() -> str:
+    """Hash the strategy sources so cached signals from older code are never served
+    
+    Covers every module of the strategies package, so a change to a strategy,
+    one of its compiled kernels or the shared interface invalidates the cache.
+    
+    Returns:
+        Hex digest of the package's source files
+    """
+    import strategies.strategy_interface
+    
+    digest = hashlib.sha1()
+    package_dir = os.path.dirname(strategies.strategy_interface.__file__)
+    for path in sorted(glob.glob(os.path.join(package_dir, "*.py"))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
 class ExecutionController:
     """Controller for executing trading strategy analysis"""
     
-    def __init__(self, config_controller):
+    def __init__(self, config_controller, cache_dir: str = "data/_cache"):
         """Initialize the execution controller"""
         self.config_controller = config_controller
+        self.cache_dir = cache_dir
         self.market_data = None
         self.strategy_signals = []
         self.strategy_metadata = []
         self.aggregated_signal = None
         self.report_path = None
+        self._combined_signals = None
+        self._signal_cache = OrderedDict()
     
-    def run_analysis(self) -> Tuple[bool, str]:
-        """Run the trading strategy analysis"""
+    def run_analysis(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, str]:
+        """Run the trading strategy analysis
+        
+        Args:
+            progress_callback: Optional callable invoked with (completed, total)
+                after each strategy has produced its signals
+        """
         try:
+            # Core modules are imported on first use to keep GUI startup fast;
+            # inside the try so an import failure is logged and reported like any other error
+            from aggregator.signal_aggregator import SignalAggregator
+            from reports.report_generator import ReportGenerator
+            from data.data_loader import DataLoader
+            
             # Get configuration
             config = self.config_controller.get_config()
             
             # Create necessary directories
-            self._create_directories()
+            ensure_directories()
             
             # Load market data
             logger.info("Loading market data...")
             data_loader = DataLoader(config.get("data_source", {}))
             self.market_data = data_loader.load_data()
-            logger.info(f"Loaded {len(self.market_data)} data points")
+            logger.info("Loaded %d data points", len(self.market_data))
             
             if self.market_data.empty:
                 return False, "Failed to load market data"
             
-            # Initialize strategy factory and register strategies
-            strategy_factory = StrategyFactory()
-            strategy_factory.register_strategy("MovingAverageCrossover", MovingAverageCrossover)
-            strategy_factory.register_strategy("RSIStrategy", RSIStrategy)
-            strategy_factory.register_strategy("MACDStrategy", MACDStrategy)
+            # Apply the price dtype option once; every strategy reads the same frame
+            price_dtype = np.dtype(config.get("data_source", {}).get("dtype", "float64"))
+            strategy_data = self._prepare_strategy_data(self.market_data, price_dtype)
             
             # Initialize strategies
             strategies = []
+            cache_keys = []
+            data_key = self._compute_data_key(self.market_data, price_dtype)
             strategy_configs = config.get("strategies", [])
             
             if not strategy_configs:
                 logger.warning("No strategies configured")
                 return False, "No strategies configured"
             
-            for strategy_config in strategy_configs:
-                strategy_name = strategy_config.get("name")
-                strategy_params = strategy_config.get("parameters", {})
-                strategy_weight = strategy_config.get("weight", 1.0)
-                
-                strategy = strategy_factory.create_strategy(strategy_name, strategy_params)
+            pipeline = build_pipeline(self._pipeline_spec(strategy_configs))
+            for strategy_config, strategy in zip(strategy_configs, pipeline):
                 if strategy:
-                    strategy.set_weight(strategy_weight)
                     strategies.append(strategy)
-                    logger.info(f"Initialized strategy: {strategy_name} with weight {strategy_weight}")
-                else:
-                    logger.warning(f"Failed to initialize strategy: {strategy_name}")
+                    cache_keys.append(self._compute_signal_key(data_key, strategy_config))
             
             if not strategies:
                 logger.error("No strategies were initialized")
                 return False, "No strategies were initialized"
             
-            # Process data through each strategy to get signals
-            self.strategy_signals = []
-            self.strategy_metadata = []
+            # Process data through each strategy to get signals; the result
+            # lists are sized up front and filled by position
+            num_strategies = len(strategies)
+            strategy_signals = [None] * num_strategies
+            strategy_metadata = [None] * num_strategies
+            self._combined_signals = None
+            
+            for i, (strategy, sig_key) in enumerate(zip(strategies, cache_keys)):
+                cached = self._get_cached_signals(sig_key)
+                if cached is not None:
+                    signals, metadata = cached
+                    logger.info("Using cached signals for strategy: %s", strategy.get_name())
+                else:
+                    signals = strategy.process_data(strategy_data)
+                    metadata = dict(strategy.get_metadata())
+                    self._store_cached_signals(sig_key, signals, metadata)
+                    logger.info("Processed data through strategy: %s", strategy.get_name())
+                strategy_signals[i] = signals
+                strategy_metadata[i] = metadata
+                if progress_callback is not None:
+                    progress_callback(i + 1, num_strategies)
             
-            for strategy in strategies:
-                signals = strategy.process_data(self.market_data)
-                self.strategy_signals.append(signals)
-                self.strategy_metadata.append(strategy.get_metadata())
-                logger.info(f"Processed data through strategy: {strategy.get_name()}")
+            self.strategy_signals = strategy_signals
+            self.strategy_metadata = strategy_metadata
             
             # Aggregate signals
             aggregator = SignalAggregator(config.get("aggregator", {}))
             self.aggregated_signal = aggregator.aggregate(self.strategy_signals)
-            logger.info(f"Aggregated signals using method: {aggregator.method}")
+            logger.info("Aggregated signals using method: %s", aggregator.method)
             
             # Generate report
             report_generator = ReportGenerator(config.get("report", {}))
@@ -110,30 +255,140 @@ class ExecutionController:
             )
             
             if self.report_path:
-                logger.info(f"Report generated successfully: {self.report_path}")
+                logger.info("Report generated successfully: %s", self.report_path)
                 return True, f"Report generated successfully: {os.path.abspath(self.report_path)}"
             else:
                 logger.error("Failed to generate report")
                 return False, "Failed to generate report"
             
         except Exception as e:
-            logger.error(f"An error occurred during analysis: {e}", exc_info=True)
+            logger.error("An error occurred during analysis: %s", e, exc_info=True)
             return False, f"An error occurred: {str(e)}"
     
-    def _create_directories(self) -> None:
-        """Create necessary directories if they don't exist"""
-        directories = [
-            "data",
-            "strategies",
-            "aggregator",
-            "reports",
-            "config",
-            "logs",
-            "reports/output",
-            "reports/output/plots"
-        ]
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+    @staticmethod
+    def _pipeline_spec(strategy_configs: List[Dict[str, Any]]) -> Tuple[Tuple[str, bytes, float], ...]:
+        """Turn the strategies configuration into a hashable pipeline spec"""
+        return tuple(
+            (
+                strategy_config.get("name"),
+                fast_json.dumps(strategy_config.get("parameters", {}), default=str),
+                strategy_config.get("weight", 1.0)
+            )
+            for strategy_config in strategy_configs
+        )
+    
+    @staticmethod
+    def _prepare_strategy_data(market_data: pd.DataFrame,
+                               price_dtype: np.dtype = np.float64) -> pd.DataFrame:
+        """Cast the numeric price columns of the market data to the configured dtype
+        
+        Args:
+            market_data: Market data with OHLCV columns
+            price_dtype: dtype for the price columns. float32 halves the memory
+                traffic on long series and keeps about 7 significant digits,
+                enough for indicator math but not for exact price comparisons.
+                
+        Returns:
+            The market data itself when no column changes dtype, otherwise a
+            frame with the price columns cast; other columns are kept as they are
+        """
+        casts = {
+            column: price_dtype
+            for column in PRICE_COLUMNS
+            if column in market_data.columns
+            and market_data[column].dtype.kind in "fi"
+            and market_data[column].dtype != price_dtype
+        }
+        return market_data.astype(casts) if casts else market_data
+    
+    @staticmethod
+    def _compute_data_key(market_data: pd.DataFrame, price_dtype: np.dtype = np.float64) -> str:
+        """Hash the market data (values, index, column names and price dtype) into a cache key"""
+        digest = hashlib.sha1(",".join(map(str, market_data.columns)).encode())
+        digest.update(np.dtype(price_dtype).name.encode())
+        digest.update(pd.util.hash_pandas_object(market_data, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _compute_signal_key(data_key: str, strategy_config: Dict[str, Any]) -> str:
+        """Combine the data key with a strategy's name, parameters and weight and the code version"""
+        payload = fast_json.dumps({
+            "name": strategy_config.get("name"),
+            "params": strategy_config.get("parameters", {}),
+            "weight": strategy_config.get("weight", 1.0),
+            "cache_version": SIGNAL_CACHE_VERSION,
+            "code_version": _strategies_code_version()
+        }, default=str)
+        return hashlib.sha1(data_key.encode() + payload).hexdigest()
+    
+    def _get_cached_signals(self, sig_key: str) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """Look up strategy output in the memory cache, then on disk
+        
+        Returns a copy of the entry, so callers may modify it freely.
+        """
+        if sig_key in self._signal_cache:
+            self._signal_cache.move_to_end(sig_key)
+            return self._copy_entry(self._signal_cache[sig_key])
+        
+        cache_path = os.path.join(self.cache_dir, f"sig_{sig_key}.pkl")
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            entry = pd.read_pickle(cache_path)
+            # Mark the file as recently used so pruning keeps it
+            os.utime(cache_path)
+        except Exception as e:
+            logger.warning("Ignoring unreadable signal cache file %s: %s", cache_path, e)
+            return None
+        
+        self._remember_signals(sig_key, entry)
+        return self._copy_entry(entry)
+    
+    def _store_cached_signals(self, sig_key: str, signals: pd.DataFrame, metadata: Dict[str, Any]) -> None:
+        """Keep a copy of strategy output in the memory cache and persist it to disk"""
+        entry = self._copy_entry((signals, metadata))
+        self._remember_signals(sig_key, entry)
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            pd.to_pickle(entry, os.path.join(self.cache_dir, f"sig_{sig_key}.pkl"))
+        except Exception as e:
+            logger.warning("Failed to persist signal cache entry %s: %s", sig_key, e)
+            return
+        
+        self._prune_disk_cache()
+    
+    def _prune_disk_cache(self) -> None:
+        """Delete the least recently used signal cache files beyond SIGNAL_DISK_CACHE_SIZE"""
+        paths = glob.glob(os.path.join(self.cache_dir, "sig_*.pkl"))
+        if len(paths) <= SIGNAL_DISK_CACHE_SIZE:
+            return
+        
+        def mtime(path):
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0.0
+        
+        for path in sorted(paths, key=mtime)[:len(paths) - SIGNAL_DISK_CACHE_SIZE]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning("Failed to remove signal cache file %s: %s", path, e)
+    
+    @staticmethod
+    def _copy_entry(entry: Tuple[pd.DataFrame, Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Copy a cache entry so the cached signals and metadata cannot be changed through it"""
+        signals, metadata = entry
+        return signals.copy(), copy.deepcopy(metadata)
+    
+    def _remember_signals(self, sig_key: str, entry: Tuple[pd.DataFrame, Dict[str, Any]]) -> None:
+        """Insert an entry into the LRU-bounded memory cache"""
+        self._signal_cache[sig_key] = entry
+        self._signal_cache.move_to_end(sig_key)
+        while len(self._signal_cache) > SIGNAL_CACHE_SIZE:
+            self._signal_cache.popitem(last=False)
     
     def get_market_data(self) -> pd.DataFrame:
         """Get the market data"""
@@ -155,6 +410,28 @@ class ExecutionController:
         """Get the path to the generated report"""
         return self.report_path
     
+    def _combine_signals(self) -> pd.DataFrame:
+        """Combine the signal column of every strategy into one DataFrame"""
+        index = self.market_data.index if self.market_data is not None else None
+        columns = []
+        names = []
+        
+        for i, signals_df in enumerate(self.strategy_signals):
+            if not signals_df.empty and 'signal' in signals_df.columns:
+                strategy_name = f"Strategy_{i+1}"
+                if self.strategy_metadata and i < len(self.strategy_metadata):
+                    strategy_name = self.strategy_metadata[i].get('name', strategy_name)
+                columns.append(signals_df['signal'])
+                names.append(strategy_name)
+        
+        if not columns:
+            return pd.DataFrame(index=index)
+        
+        all_signals = pd.concat(columns, axis=1, keys=names)
+        if index is not None:
+            all_signals = all_signals.reindex(index)
+        return all_signals
+    
     def get_results(self) -> Dict[str, Any]:
         """Get all analysis results in a dictionary format
         
@@ -167,17 +444,9 @@ class ExecutionController:
             results['market_data'] = self.market_data
         
         if self.strategy_signals and len(self.strategy_signals) > 0:
-            # Combine all strategy signals into one DataFrame
-            all_signals = pd.DataFrame(index=self.market_data.index if self.market_data is not None else None)
-            
-            for i, signals_df in enumerate(self.strategy_signals):
-                if not signals_df.empty and 'signal' in signals_df.columns:
-                    strategy_name = f"Strategy_{i+1}"
-                    if self.strategy_metadata and i < len(self.strategy_metadata):
-                        strategy_name = self.strategy_metadata[i].get('name', strategy_name)
-                    all_signals[strategy_name] = signals_df['signal']
-            
-            results['signals'] = all_signals
+            if self._combined_signals is None:
+                self._combined_signals = self._combine_signals()
+            results['signals'] = self._combined_signals
         
         if self.aggregated_signal is not None and not self.aggregated_signal.empty:
             results['aggregated_signal'] = self.aggregated_signal
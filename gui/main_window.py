@@ -11,8 +11,8 @@ the primary interface for users to interact with the trading strategy system.
 import os
 import logging
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QMessageBox, QAction,
-                             QFileDialog, QVBoxLayout, QWidget)
-from PyQt5.QtCore import Qt
+                             QFileDialog, QVBoxLayout, QWidget, QProgressBar)
+from PyQt5.QtCore import Qt, QThread
 from PyQt5.QtGui import QIcon
 
 # Import GUI components
@@ -26,6 +26,7 @@ from gui.components.dashboard_tab import DashboardTab
 # Import core functionality
 from gui.controllers.config_controller import ConfigController
 from gui.controllers.execution_controller import ExecutionController
+from gui.controllers.analysis_worker import AnalysisWorker
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,10 @@ class MainWindow(QMainWindow):
         self.config_controller = ConfigController()
         self.execution_controller = ExecutionController(self.config_controller)
         
+        # Background analysis state
+        self.analysis_thread = None
+        self.analysis_worker = None
+        
         # Set up the UI
         self.init_ui()
         
@@ -69,6 +74,10 @@ class MainWindow(QMainWindow):
         self.results_tab = ResultsTab(self.execution_controller)
         self.dashboard_tab = DashboardTab(self.execution_controller)
         
+        # Tabs whose settings are written back into the configuration
+        self.config_tabs = (self.data_tab, self.strategy_tab,
+                            self.aggregator_tab, self.report_tab)
+        
         # Add tabs to tab widget
         self.tabs.addTab(self.data_tab, "Data Source")
         self.tabs.addTab(self.strategy_tab, "Strategies")
@@ -85,6 +94,12 @@ class MainWindow(QMainWindow):
         
         # Set status bar
         self.statusBar().showMessage("Ready")
+        
+        # Progress bar shown while an analysis is running
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.setVisible(False)
+        self.statusBar().addPermanentWidget(self.progress_bar)
     
     def create_menu_bar(self):
         """Create the menu bar"""
@@ -125,11 +140,11 @@ class MainWindow(QMainWindow):
         run_menu = self.menuBar().addMenu("&Run")
         
         # Run analysis action
-        run_action = QAction("&Run Analysis", self)
-        run_action.setShortcut("F5")
-        run_action.setStatusTip("Run the trading strategy analysis")
-        run_action.triggered.connect(self.run_analysis)
-        run_menu.addAction(run_action)
+        self.run_action = QAction("&Run Analysis", self)
+        self.run_action.setShortcut("F5")
+        self.run_action.setStatusTip("Run the trading strategy analysis")
+        self.run_action.triggered.connect(self.run_analysis)
+        run_menu.addAction(self.run_action)
         
         # Help menu
         help_menu = self.menuBar().addMenu("&Help")
@@ -142,7 +157,7 @@ class MainWindow(QMainWindow):
     
     def new_config(self):
         """Create a new configuration"""
-        if self.config_controller.is_dirty():
+        if self.has_unsaved_changes():
             reply = QMessageBox.question(self, "New Configuration",
                                         "You have unsaved changes. Are you sure you want to create a new configuration? "
                                         "All unsaved changes will be lost.",
@@ -155,7 +170,7 @@ class MainWindow(QMainWindow):
     
     def load_config(self):
         """Load configuration from file"""
-        if self.config_controller.is_dirty():
+        if self.has_unsaved_changes():
             reply = QMessageBox.question(self, "Load Configuration",
                                         "You have unsaved changes. Are you sure you want to load a new configuration? "
                                         "All unsaved changes will be lost.",
@@ -177,10 +192,7 @@ class MainWindow(QMainWindow):
     def save_config(self):
         """Save configuration to file"""
         # Update configuration from UI before saving
-        self.data_tab.update_config()
-        self.strategy_tab.update_config()
-        self.aggregator_tab.update_config()
-        self.report_tab.update_config()
+        self.update_config_from_ui()
 
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Configuration",
                                                 "config/config.json", "JSON Files (*.json)")
@@ -205,18 +217,55 @@ class MainWindow(QMainWindow):
         self.aggregator_tab.update_from_config()
         self.report_tab.update_from_config()
     
+    def update_config_from_ui(self):
+        """Write back the settings of tabs that changed since the last sync"""
+        for tab in self.config_tabs:
+            if tab.dirty:
+                tab.update_config()
+    
+    def has_unsaved_changes(self):
+        """Check for configuration or tab edits that have not been saved"""
+        return self.config_controller.is_dirty() or any(tab.dirty for tab in self.config_tabs)
+    
     def run_analysis(self):
-        """Run the trading strategy analysis"""
+        """Run the trading strategy analysis on a background thread"""
+        if self.analysis_thread is not None:
+            return
+        
         self.statusBar().showMessage("Running analysis...")
         
         # Update configuration from UI
-        self.data_tab.update_config()
-        self.strategy_tab.update_config()
-        self.aggregator_tab.update_config()
-        self.report_tab.update_config()
+        self.update_config_from_ui()
+        
+        # Block re-entry and show progress while the worker runs
+        self.run_action.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        
+        self.analysis_thread = QThread(self)
+        self.analysis_worker = AnalysisWorker(self.execution_controller)
+        self.analysis_worker.moveToThread(self.analysis_thread)
         
-        # Run the analysis
-        success, message = self.execution_controller.run_analysis()
+        self.analysis_thread.started.connect(self.analysis_worker.run)
+        self.analysis_worker.strategy_done.connect(self.on_strategy_done)
+        self.analysis_worker.finished.connect(self.on_analysis_finished)
+        self.analysis_worker.finished.connect(self.analysis_thread.quit)
+        self.analysis_worker.finished.connect(self.analysis_worker.deleteLater)
+        self.analysis_thread.finished.connect(self.analysis_thread.deleteLater)
+        
+        self.analysis_thread.start()
+    
+    def on_strategy_done(self, completed, total):
+        """Update the progress bar after a strategy has been processed"""
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(completed)
+    
+    def on_analysis_finished(self, success, message):
+        """Handle the end of a background analysis run"""
+        self.analysis_thread = None
+        self.analysis_worker = None
+        self.run_action.setEnabled(True)
+        self.progress_bar.setVisible(False)
         
         if success:
             self.statusBar().showMessage("Analysis completed successfully")
@@ -236,15 +285,18 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event"""
-        if self.config_controller.is_dirty():
+        if self.has_unsaved_changes():
             reply = QMessageBox.question(self, "Exit",
                                         "You have unsaved changes. Are you sure you want to exit?",
                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                event.accept()
-                logger.info("Application closed")
-            else:
+            if reply != QMessageBox.Yes:
                 event.ignore()
-        else:
-            event.accept()
-            logger.info("Application closed")
\ No newline at end of file
+                return
+        
+        # Let a running analysis finish before the window goes away
+        if self.analysis_thread is not None:
+            self.analysis_thread.quit()
+            self.analysis_thread.wait()
+        
+        event.accept()
+        logger.info("Application closed")
\ No newline at end of file
@@ -27,7 +27,6 @@ logger = logging.getLogger(__name__)
 
 try:
     from PyQt5.QtWidgets import QApplication
-    from gui.main_window import MainWindow
 except ImportError:
     logger.error("PyQt5 is not installed. Please install it with: pip install PyQt5")
     print("Error: PyQt5 is not installed. Please install it with: pip install PyQt5")
@@ -41,6 +40,15 @@ def main():
         app = QApplication(sys.argv)
         app.setApplicationName("Trading Strategy Aggregation System")
         
+        # Report plots are rendered on the analysis worker thread, so pyplot
+        # must use a non-interactive backend rather than a Qt one
+        import matplotlib
+        matplotlib.use("Agg")
+        
+        # Import the main window only once the application exists, so the
+        # heavy GUI, pandas and matplotlib imports are not paid before startup
+        from gui.main_window import MainWindow
+        
         # Create and show the main window
         main_window = MainWindow()
         main_window.show()
@@ -9,7 +9,6 @@ from multiple trading strategies and generates a unified report.
 """
 
 import os
-import json
 import logging
 from datetime import datetime, timedelta
 import argparse
@@ -20,6 +19,8 @@ from strategies.strategy_factory import StrategyFactory
 from aggregator.signal_aggregator import SignalAggregator
 from reports.report_generator import ReportGenerator
 from data.data_loader import DataLoader
+from utils.paths import ensure_directories
+from utils import fast_json
 
 # Import strategy implementations
 from strategies.moving_average_crossover import MovingAverageCrossover
@@ -43,13 +44,13 @@ def load_config(config_path="config/config.json"):
     """Load configuration from JSON file"""
     try:
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return fast_json.loads(f.read())
         else:
-            logger.warning(f"Configuration file not found: {config_path}, using default configuration")
+            logger.warning("Configuration file not found: %s, using default configuration", config_path)
             return create_default_config()
     except Exception as e:
-        logger.error(f"Error loading configuration: {e}")
+        logger.error("Error loading configuration: %s", e)
         return create_default_config()
 
 
@@ -104,31 +105,15 @@ def create_default_config():
     return config
 
 
-def create_directories():
-    """Create necessary directories if they don't exist"""
-    directories = [
-        "data",
-        "strategies",
-        "aggregator",
-        "reports",
-        "config",
-        "logs",
-        "reports/output",
-        "reports/output/plots"
-    ]
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
-
-
 def save_config(config, config_path="config/config.json"):
     """Save configuration to a JSON file"""
     try:
         os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=4)
-        logger.info(f"Configuration saved to {config_path}")
+        with open(config_path, 'wb') as f:
+            f.write(fast_json.dumps(config, indent=True))
+        logger.info("Configuration saved to %s", config_path)
     except Exception as e:
-        logger.error(f"Error saving configuration: {e}")
+        logger.error("Error saving configuration: %s", e)
 
 
 def main():
@@ -140,7 +125,7 @@ def main():
     args = parser.parse_args()
     
     # Create necessary directories
-    create_directories()
+    ensure_directories()
     
     # Load configuration
     config = load_config(args.config)
@@ -158,7 +143,7 @@ def main():
         logger.info("Loading market data...")
         data_loader = DataLoader(config.get("data_source", {}))
         market_data = data_loader.load_data()
-        logger.info(f"Loaded {len(market_data)} data points")
+        logger.info("Loaded %d data points", len(market_data))
         
         # Initialize strategy factory and register strategies
         strategy_factory = StrategyFactory()
@@ -183,28 +168,27 @@ def main():
             if strategy:
                 strategy.set_weight(strategy_weight)
                 strategies.append(strategy)
-                logger.info(f"Initialized strategy: {strategy_name} with weight {strategy_weight}")
+                logger.info("Initialized strategy: %s with weight %s", strategy_name, strategy_weight)
             else:
-                logger.warning(f"Failed to initialize strategy: {strategy_name}")
+                logger.warning("Failed to initialize strategy: %s", strategy_name)
         
         if not strategies:
             logger.error("No strategies were initialized. Exiting.")
             return
         
         # Process data through each strategy to get signals
-        strategy_signals = []
-        strategy_metadata = []
+        strategy_signals = [None] * len(strategies)
+        strategy_metadata = [None] * len(strategies)
         
-        for strategy in strategies:
-            signals = strategy.process_data(market_data)
-            strategy_signals.append(signals)
-            strategy_metadata.append(strategy.get_metadata())
-            logger.info(f"Processed data through strategy: {strategy.get_name()}")
+        for i, strategy in enumerate(strategies):
+            strategy_signals[i] = strategy.process_data(market_data)
+            strategy_metadata[i] = strategy.get_metadata()
+            logger.info("Processed data through strategy: %s", strategy.get_name())
         
         # Aggregate signals
         aggregator = SignalAggregator(config.get("aggregator", {}))
         aggregated_signal = aggregator.aggregate(strategy_signals)
-        logger.info(f"Aggregated signals using method: {aggregator.method}")
+        logger.info("Aggregated signals using method: %s", aggregator.method)
         
         # Generate report
         report_generator = ReportGenerator(config.get("report", {}))
@@ -216,13 +200,13 @@ def main():
         )
         
         if report_path:
-            logger.info(f"Report generated successfully: {report_path}")
+            logger.info("Report generated successfully: %s", report_path)
             print(f"\nReport generated successfully: {os.path.abspath(report_path)}")
         else:
             logger.error("Failed to generate report")
         
     except Exception as e:
-        logger.error(f"An error occurred: {e}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
 
 
 if __name__ == "__main__":
@@ -1,65 +1,234 @@
 import numpy as np
 import pandas as pd
 
-def calculate_sharpe_ratio(returns, risk_free_rate=0.0):
+from utils.jit import njit, NUMBA_AVAILABLE
+
+def _nan_mean_std(values):
+    """
+    Mean and sample standard deviation (ddof=1) along the last axis,
+    ignoring NaN like pandas does. The standard deviation is NaN when fewer
+    than two values are present.
+    """
+    valid = ~np.isnan(values)
+    # Counting in the input dtype keeps float32 inputs from being promoted
+    count = valid.sum(axis=-1, dtype=values.dtype)
+    mean = np.where(valid, values, 0.0).sum(axis=-1) / count
+    deviations = np.where(valid, values - mean[..., np.newaxis], 0.0)
+    variance = (deviations * deviations).sum(axis=-1) / (count - 1)
+    std = np.where(count > 1, np.sqrt(variance), np.nan)
+    return mean, std
+
+def _as_result(value):
+    """Return 0-d results as NumPy scalars and anything else unchanged."""
+    value = np.asarray(value)
+    return value[()] if value.ndim == 0 else value
+
+def _time_axis(returns, axis):
+    """Resolve the default time axis: the index for pandas input, the last axis otherwise."""
+    if axis is None:
+        return 0 if isinstance(returns, (pd.Series, pd.DataFrame)) else -1
+    return axis
+
+def calculate_sharpe_ratio(returns, risk_free_rate=0.0, axis=None, dtype=np.float64):
     """
     Calculate the Sharpe ratio.
 
+    A zero standard deviation gives +/-inf (NaN for a zero mean) without
+    raising or warning.
+
     Args:
-        returns: A pandas Series of returns.
+        returns: A pandas Series/DataFrame or array of returns.
         risk_free_rate: The risk-free rate of return.
+        axis: Time axis. Defaults to the index for pandas input (one ratio per
+            DataFrame column) and to the last axis for arrays, so a 2-D
+            (strategies, time) array gives one ratio per strategy.
+        dtype: Working precision. np.float32 halves memory traffic on long
+            series at the cost of roughly 7 significant digits in mean/std.
 
     Returns:
-        The Sharpe ratio.
+        The Sharpe ratio, or an array of ratios for multi-dimensional input.
     """
-    excess_returns = returns - risk_free_rate
-    return excess_returns.mean() / excess_returns.std()
+    excess_returns = np.moveaxis(np.asarray(returns, dtype=dtype), _time_axis(returns, axis), -1) - risk_free_rate
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean, std = _nan_mean_std(excess_returns)
+        return _as_result(mean / std)
 
-def calculate_sortino_ratio(returns, risk_free_rate=0.0):
+def calculate_sortino_ratio(returns, risk_free_rate=0.0, axis=None, dtype=np.float64):
     """
     Calculate the Sortino ratio.
 
     Args:
-        returns: A pandas Series of returns.
+        returns: A pandas Series/DataFrame or array of returns.
         risk_free_rate: The risk-free rate of return.
+        axis: Time axis. Defaults to the index for pandas input (one ratio per
+            DataFrame column) and to the last axis for arrays, so a 2-D
+            (strategies, time) array gives one ratio per strategy.
+        dtype: Working precision. np.float32 halves memory traffic on long
+            series at the cost of roughly 7 significant digits in mean/std.
 
     Returns:
-        The Sortino ratio.
+        The Sortino ratio (inf when the downside deviation is zero), or an
+        array of ratios for multi-dimensional input.
     """
-    excess_returns = returns - risk_free_rate
-    downside_returns = excess_returns[excess_returns < 0]
-    downside_std = downside_returns.std()
-    if downside_std == 0:
-        return np.inf
-    return excess_returns.mean() / downside_std
-
-def calculate_max_drawdown(returns):
+    excess_returns = np.moveaxis(np.asarray(returns, dtype=dtype), _time_axis(returns, axis), -1) - risk_free_rate
+    downside_returns = np.where(excess_returns < 0, excess_returns, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean, _ = _nan_mean_std(excess_returns)
+        _, downside_std = _nan_mean_std(downside_returns)
+        return _as_result(np.where(downside_std == 0, np.inf, mean / downside_std))
+
+def calculate_max_drawdown(returns, axis=None):
     """
     Calculate the maximum drawdown.
 
+    Always computed in float64: the cumulative product compounds rounding
+    error, which drifts noticeably in float32 over long series.
+
     Args:
-        returns: A pandas Series of returns.
+        returns: A pandas Series/DataFrame or array of returns.
+        axis: Time axis. Defaults to the index for pandas input (one drawdown per
+            DataFrame column) and to the last axis for arrays, so a 2-D
+            (strategies, time) array gives one drawdown per strategy.
 
     Returns:
-        The maximum drawdown.
+        The maximum drawdown, or an array of drawdowns for multi-dimensional input.
     """
-    cumulative_returns = (1 + returns).cumprod()
-    peak = cumulative_returns.expanding(min_periods=1).max()
-    drawdown = (cumulative_returns - peak) / peak
-    return drawdown.min()
+    r = np.moveaxis(np.asarray(returns, dtype=np.float64), _time_axis(returns, axis), -1)
+    if r.shape[-1] == 0:
+        return _as_result(np.full(r.shape[:-1], np.nan))
+
+    # NaN returns are skipped: the product carries over them, and like pandas'
+    # cumprod they have no cumulative value of their own, so the first peak is the
+    # first valid bar rather than the starting capital of 1 (leading NaNs included)
+    cumulative_returns = np.nancumprod(1.0 + r, axis=-1)
+    cumulative_returns[np.isnan(r)] = np.nan
+    peak = np.fmax.accumulate(cumulative_returns, axis=-1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        drawdown = (cumulative_returns - peak) / peak
+    return _as_result(np.fmin.reduce(drawdown, axis=-1))
 
-def calculate_profit_factor(returns):
+def calculate_profit_factor(returns, axis=None, dtype=np.float64):
     """
     Calculate the profit factor.
 
     Args:
-        returns: A pandas Series of returns.
+        returns: A pandas Series/DataFrame or array of returns.
+        axis: Time axis. Defaults to the index for pandas input (one value per
+            DataFrame column) and to the last axis for arrays, so a 2-D
+            (strategies, time) array gives one value per strategy.
+        dtype: Working precision for the gain/loss sums (see calculate_sharpe_ratio).
 
     Returns:
-        The profit factor.
+        The profit factor, or an array of values for multi-dimensional input.
+    """
+    # Masked sums instead of boolean indexing avoid two temporary copies
+    axis = _time_axis(returns, axis)
+    r = np.asarray(returns, dtype=dtype)
+    gross_profits = np.where(r > 0, r, 0.0).sum(axis=axis)
+    gross_losses = -np.where(r < 0, r, 0.0).sum(axis=axis)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _as_result(np.where(gross_losses == 0, np.inf, gross_profits / gross_losses))
+
+@njit(cache=True)
+def _safe_ratio(numerator, denominator):
+    """Divide like NumPy does, returning +/-inf or NaN instead of raising."""
+    if denominator == 0.0:
+        if numerator > 0.0:
+            return np.inf
+        if numerator < 0.0:
+            return -np.inf
+        return np.nan
+    return numerator / denominator
+
+@njit(cache=True)
+def _all_metrics_nb(returns, risk_free_rate):
+    """
+    Walk the returns once and compute every metric.
+
+    Means and variances use Welford's update so the single pass stays
+    numerically stable. NaN returns are skipped, matching pandas.
     """
-    gross_profits = returns[returns > 0].sum()
-    gross_losses = abs(returns[returns < 0].sum())
-    if gross_losses == 0:
-        return np.inf
-    return gross_profits / gross_losses
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    down_n = 0
+    down_mean = 0.0
+    down_m2 = 0.0
+    gross_profits = 0.0
+    gross_losses = 0.0
+    cumulative = 1.0
+    peak = np.nan
+    max_drawdown = np.nan
+
+    for i in range(returns.shape[0]):
+        r = returns[i]
+        if r != r:
+            continue
+
+        x = r - risk_free_rate
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        if x < 0.0:
+            down_n += 1
+            down_delta = x - down_mean
+            down_mean += down_delta / down_n
+            down_m2 += down_delta * (x - down_mean)
+
+        if r > 0.0:
+            gross_profits += r
+        elif r < 0.0:
+            gross_losses -= r
+
+        cumulative *= 1.0 + r
+        if peak != peak or cumulative > peak:
+            peak = cumulative
+        if peak != 0.0:
+            drawdown = (cumulative - peak) / peak
+            if max_drawdown != max_drawdown or drawdown < max_drawdown:
+                max_drawdown = drawdown
+
+    if n == 0:
+        mean = np.nan
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    down_std = np.sqrt(down_m2 / (down_n - 1)) if down_n > 1 else np.nan
+
+    sharpe = _safe_ratio(mean, std)
+    sortino = np.inf if down_std == 0.0 else mean / down_std
+    profit_factor = np.inf if gross_losses == 0.0 else gross_profits / gross_losses
+    return sharpe, sortino, max_drawdown, profit_factor
+
+def calculate_all_metrics(returns, risk_free_rate=0.0):
+    """
+    Calculate the Sharpe ratio, Sortino ratio, maximum drawdown and profit
+    factor together.
+
+    With Numba installed the returns are scanned once by a compiled kernel;
+    otherwise the individual metric functions are used.
+
+    Args:
+        returns: A pandas Series or 1-D array of returns.
+        risk_free_rate: The risk-free rate of return.
+
+    Returns:
+        Dictionary with 'sharpe_ratio', 'sortino_ratio', 'max_drawdown'
+        and 'profit_factor'.
+    """
+    if not NUMBA_AVAILABLE:
+        returns = pd.Series(returns)
+        return {
+            'sharpe_ratio': calculate_sharpe_ratio(returns, risk_free_rate),
+            'sortino_ratio': calculate_sortino_ratio(returns, risk_free_rate),
+            'max_drawdown': calculate_max_drawdown(returns),
+            'profit_factor': calculate_profit_factor(returns),
+        }
+
+    values = np.ascontiguousarray(returns, dtype=np.float64)
+    sharpe, sortino, max_drawdown, profit_factor = _all_metrics_nb(values, float(risk_free_rate))
+    return {
+        'sharpe_ratio': sharpe,
+        'sortino_ratio': sortino,
+        'max_drawdown': max_drawdown,
+        'profit_factor': profit_factor,
+    }
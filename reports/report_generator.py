@@ -3,14 +3,82 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import logging
 import os
+import hashlib
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Union, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Resolution of the saved report plots
+PLOT_DPI = 80
+
+# Number of plotted datasets whose files are remembered for reuse across report generators
+PLOT_CACHE_SIZE = 8
+
+# Plot content hash -> (base filename, plot paths) of plots already rendered.
+# Module level because callers build a new ReportGenerator for every run.
+_plot_cache = OrderedDict()
+_plot_cache_lock = threading.Lock()
+
+# Buffer size for report files, large enough to write most reports in one syscall
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Page layout of the HTML report; section placeholders are filled in by _generate_html_report
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<title>Trading Strategy Report</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 20px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+th {{ background-color: #f2f2f2; }}
+tr:nth-child(even) {{ background-color: #f9f9f9; }}
+h1, h2, h3 {{ color: #333; }}
+</style>
+</head>
+<body>
+<h1>Trading Strategy Report</h1>
+<p>Generated on: {generated_on}</p>
+<h2>Market Data Summary</h2>
+<table>
+<tr><th>Metric</th><th>Value</th></tr>
+<tr><td>Symbol</td><td>{symbol}</td></tr>
+<tr><td>Start Date</td><td>{start_date}</td></tr>
+<tr><td>End Date</td><td>{end_date}</td></tr>
+<tr><td>Number of Days</td><td>{num_days}</td></tr>
+<tr><td>Starting Price</td><td>{start_price:.2f}</td></tr>
+<tr><td>Ending Price</td><td>{end_price:.2f}</td></tr>
+<tr><td>Return</td><td>{total_return:.2f}%</td></tr>
+</table>
+<h2>Strategy Summary</h2>
+<table>
+<tr><th>Strategy</th><th>Type</th><th>Weight</th><th>Parameters</th><th>Trades</th></tr>
+{strategy_rows}</table>
+{aggregated_section}{plot_sections}</body>
+</html>"""
+
+AGGREGATED_TEMPLATE = """<h2>Aggregated Signal Summary</h2>
+<table>
+<tr><th>Metric</th><th>Value</th></tr>
+<tr><td>Total Buy Signals</td><td>{buy_signals}</td></tr>
+<tr><td>Total Sell Signals</td><td>{sell_signals}</td></tr>
+<tr><td>Average Signal Strength</td><td>{average_signal:.4f}</td></tr>
+</table>
+"""
+
+# HTML report heading and alt text for each plot, keyed by plot filename suffix
+PLOT_TITLES = {
+    "_price_signals.png": ("Price Chart with Signals", "Price Chart"),
+    "_strategy_signals.png": ("Strategy Signals Comparison", "Strategy Signals"),
+}
+
 class ReportGenerator:
     """
     Generates reports and visualizations for trading strategies and aggregated signals.
@@ -54,6 +122,7 @@ class ReportGenerator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_filename = f"trading_report_{timestamp}"
         
+        plot_paths = []
         if self.include_plots:
             # Generate plots
             plot_paths = self._generate_plots(market_data, strategy_signals, aggregated_signal, report_filename)
@@ -62,7 +131,7 @@ class ReportGenerator:
         if self.report_format.lower() == "html":
             report_path = self._generate_html_report(market_data, strategy_signals, 
                                                    aggregated_signal, strategy_metadata, 
-                                                   report_filename)
+                                                   report_filename, plot_paths)
         elif self.report_format.lower() == "csv":
             report_path = self._generate_csv_report(market_data, strategy_signals, 
                                                   aggregated_signal, strategy_metadata, 
@@ -71,7 +140,7 @@ class ReportGenerator:
             logger.warning(f"Unsupported report format: {self.report_format}, using HTML")
             report_path = self._generate_html_report(market_data, strategy_signals, 
                                                    aggregated_signal, strategy_metadata, 
-                                                   report_filename)
+                                                   report_filename, plot_paths)
         
         logger.info(f"Generated report: {report_path}")
         return report_path
@@ -99,76 +168,162 @@ class ReportGenerator:
         plots_dir = os.path.join(self.output_dir, "plots")
         os.makedirs(plots_dir, exist_ok=True)
         
-        # 1. Price chart with aggregated signals
+        # Identical data was already plotted: copy those files instead of redrawing
+        plot_key = self._compute_plot_key(market_data, strategy_signals, aggregated_signal)
+        with _plot_cache_lock:
+            cached = _plot_cache.get(plot_key)
+            if cached is not None:
+                _plot_cache.move_to_end(plot_key)
+        if cached is not None and all(os.path.exists(path) for path in cached[1]):
+            cached_filename, cached_paths = cached
+            for cached_path in cached_paths:
+                suffix = os.path.basename(cached_path)[len(cached_filename):]
+                plot_path = os.path.join(plots_dir, f"{base_filename}{suffix}")
+                if plot_path != cached_path:
+                    shutil.copyfile(cached_path, plot_path)
+                plot_paths.append(plot_path)
+            return plot_paths
+        
+        # Each chart is drawn on its own Figure, so the two can render in separate threads
+        price_plot_path = os.path.join(plots_dir, f"{base_filename}_price_signals.png")
+        signals_plot_path = os.path.join(plots_dir, f"{base_filename}_strategy_signals.png")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._plot_price_chart, market_data, aggregated_signal, price_plot_path),
+                executor.submit(self._plot_strategy_signals, strategy_signals, aggregated_signal, signals_plot_path)
+            ]
+            plot_paths = [path for path in (future.result() for future in futures) if path]
+        
+        # Only complete sets are reused; a failed chart is retried next time
+        if len(plot_paths) == len(futures):
+            with _plot_cache_lock:
+                _plot_cache[plot_key] = (base_filename, list(plot_paths))
+                _plot_cache.move_to_end(plot_key)
+                while len(_plot_cache) > PLOT_CACHE_SIZE:
+                    _plot_cache.popitem(last=False)
+        return plot_paths
+    
+    @staticmethod
+    def _plot_price_chart(market_data: pd.DataFrame, 
+                          aggregated_signal: pd.DataFrame, 
+                          plot_path: str) -> Optional[str]:
+        """
+        Plot the close price with the aggregated buy/sell signals.
+        
+        Uses its own Figure rather than pyplot so it can run in a worker thread.
+        
+        Args:
+            market_data: Original market data
+            aggregated_signal: DataFrame with aggregated signals
+            plot_path: Path of the PNG file to write
+            
+        Returns:
+            plot_path, or None if the chart could not be generated
+        """
+        # matplotlib is imported on first use so CSV-only and plot-free runs skip its import cost.
+        # Figures are created directly instead of through pyplot: they render with
+        # Agg without a GUI backend and can be drawn from worker threads.
+        from matplotlib.figure import Figure
+        
         try:
-            plt.figure(figsize=(12, 6))
-            plt.plot(market_data.index, market_data['close'], label='Close Price')
+            fig = Figure(figsize=(12, 6))
+            ax = fig.subplots()
+            ax.plot(market_data.index, market_data['close'], label='Close Price')
             
             # Plot buy signals
             if 'binary_signal' in aggregated_signal.columns:
-                buy_signals = aggregated_signal[aggregated_signal['binary_signal'] == 1]
-                plt.scatter(buy_signals.index, market_data.loc[buy_signals.index, 'close'], 
-                           marker='^', color='green', s=100, label='Buy Signal')
+                signal_dates = aggregated_signal.index
+                binary_signal = aggregated_signal['binary_signal'].to_numpy()
+                close = market_data['close'].reindex(signal_dates).to_numpy()
+                
+                buy_mask = binary_signal == 1
+                ax.scatter(signal_dates[buy_mask], close[buy_mask], 
+                           marker='^', color='green', s=100, label='Buy Signal', rasterized=True)
                 
-                # Plot sell signals
-                sell_signals = aggregated_signal[aggregated_signal['binary_signal'] == 0]
-                sell_signals = sell_signals[sell_signals.index.isin(buy_signals.index.shift(1))]
-                plt.scatter(sell_signals.index, market_data.loc[sell_signals.index, 'close'], 
-                           marker='v', color='red', s=100, label='Sell Signal')
+                # Plot sell signals on the bar where a buy drops back to 0
+                sell_mask = np.zeros_like(buy_mask)
+                sell_mask[1:] = buy_mask[:-1] & (binary_signal[1:] == 0)
+                ax.scatter(signal_dates[sell_mask], close[sell_mask], 
+                           marker='v', color='red', s=100, label='Sell Signal', rasterized=True)
             
-            plt.title('Price Chart with Aggregated Signals')
-            plt.xlabel('Date')
-            plt.ylabel('Price')
-            plt.legend()
-            plt.grid(True)
+            ax.set_title('Price Chart with Aggregated Signals')
+            ax.set_xlabel('Date')
+            ax.set_ylabel('Price')
+            ax.legend()
+            ax.grid(True)
             
-            # Save plot
-            price_plot_path = os.path.join(plots_dir, f"{base_filename}_price_signals.png")
-            plt.savefig(price_plot_path)
-            plt.close()
-            plot_paths.append(price_plot_path)
+            fig.savefig(plot_path, dpi=PLOT_DPI)
+            return plot_path
             
         except Exception as e:
             logger.error(f"Error generating price chart: {e}")
+            return None
+    
+    @staticmethod
+    def _plot_strategy_signals(strategy_signals: List[pd.DataFrame], 
+                               aggregated_signal: pd.DataFrame, 
+                               plot_path: str) -> Optional[str]:
+        """
+        Plot every strategy's signal against the aggregated signal.
+        
+        Uses its own Figure rather than pyplot so it can run in a worker thread.
+        
+        Args:
+            strategy_signals: List of signal DataFrames from individual strategies
+            aggregated_signal: DataFrame with aggregated signals
+            plot_path: Path of the PNG file to write
+            
+        Returns:
+            plot_path, or None if the chart could not be generated
+        """
+        from matplotlib.figure import Figure
         
-        # 2. Strategy signals comparison
         try:
-            plt.figure(figsize=(12, 6))
+            fig = Figure(figsize=(12, 6))
+            ax = fig.subplots()
             
             # Plot each strategy's signal
             for i, signals in enumerate(strategy_signals):
                 if 'signal' in signals.columns:
                     strategy_name = signals['strategy'].iloc[0] if 'strategy' in signals.columns else f"Strategy {i+1}"
-                    plt.plot(signals.index, signals['signal'], label=strategy_name)
+                    ax.plot(signals.index, signals['signal'], label=strategy_name)
             
             # Plot aggregated signal
             if 'signal' in aggregated_signal.columns:
-                plt.plot(aggregated_signal.index, aggregated_signal['signal'], 
-                         label='Aggregated Signal', linewidth=2, color='black')
+                ax.plot(aggregated_signal.index, aggregated_signal['signal'], 
+                        label='Aggregated Signal', linewidth=2, color='black')
             
-            plt.title('Strategy Signals Comparison')
-            plt.xlabel('Date')
-            plt.ylabel('Signal Value')
-            plt.legend()
-            plt.grid(True)
+            ax.set_title('Strategy Signals Comparison')
+            ax.set_xlabel('Date')
+            ax.set_ylabel('Signal Value')
+            ax.legend()
+            ax.grid(True)
             
-            # Save plot
-            signals_plot_path = os.path.join(plots_dir, f"{base_filename}_strategy_signals.png")
-            plt.savefig(signals_plot_path)
-            plt.close()
-            plot_paths.append(signals_plot_path)
+            fig.savefig(plot_path, dpi=PLOT_DPI)
+            return plot_path
             
         except Exception as e:
             logger.error(f"Error generating strategy signals comparison: {e}")
-        
-        return plot_paths
+            return None
+    
+    @staticmethod
+    def _compute_plot_key(market_data: pd.DataFrame, 
+                          strategy_signals: List[pd.DataFrame], 
+                          aggregated_signal: pd.DataFrame) -> str:
+        """Hash everything the plots are drawn from into a plot cache key"""
+        digest = hashlib.blake2b(digest_size=8)
+        for frame in (market_data, aggregated_signal, *strategy_signals):
+            digest.update(",".join(map(str, frame.columns)).encode())
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+        return digest.hexdigest()
     
     def _generate_html_report(self, 
                              market_data: pd.DataFrame, 
                              strategy_signals: List[pd.DataFrame], 
                              aggregated_signal: pd.DataFrame,
                              strategy_metadata: List[Dict[str, Any]],
-                             base_filename: str) -> str:
+                             base_filename: str,
+                             plot_paths: Optional[List[str]] = None) -> str:
         """
         Generate an HTML report.
         
@@ -178,53 +333,24 @@ class ReportGenerator:
             aggregated_signal: DataFrame with aggregated signals
             strategy_metadata: List of metadata dictionaries from strategies
             base_filename: Base filename for the report
+            plot_paths: Paths of the plots generated for this report
             
         Returns:
             Path to the generated HTML report
         """
         try:
-            # Create HTML content
-            html_content = []
-            html_content.append("<!DOCTYPE html>")
-            html_content.append("<html>")
-            html_content.append("<head>")
-            html_content.append("<title>Trading Strategy Report</title>")
-            html_content.append("<style>")
-            html_content.append("body { font-family: Arial, sans-serif; margin: 20px; }")
-            html_content.append("table { border-collapse: collapse; width: 100%; }")
-            html_content.append("th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }")
-            html_content.append("th { background-color: #f2f2f2; }")
-            html_content.append("tr:nth-child(even) { background-color: #f9f9f9; }")
-            html_content.append("h1, h2, h3 { color: #333; }")
-            html_content.append("</style>")
-            html_content.append("</head>")
-            html_content.append("<body>")
-            
-            # Report header
-            html_content.append(f"<h1>Trading Strategy Report</h1>")
-            html_content.append(f"<p>Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
-            
-            # Market data summary
-            html_content.append("<h2>Market Data Summary</h2>")
-            html_content.append("<table>")
-            html_content.append("<tr><th>Metric</th><th>Value</th></tr>")
-            html_content.append(f"<tr><td>Symbol</td><td>{market_data.index.name or 'Unknown'}</td></tr>")
-            html_content.append(f"<tr><td>Start Date</td><td>{market_data.index.min().strftime('%Y-%m-%d')}</td></tr>")
-            html_content.append(f"<tr><td>End Date</td><td>{market_data.index.max().strftime('%Y-%m-%d')}</td></tr>")
-            html_content.append(f"<tr><td>Number of Days</td><td>{len(market_data)}</td></tr>")
-            html_content.append(f"<tr><td>Starting Price</td><td>{market_data['close'].iloc[0]:.2f}</td></tr>")
-            html_content.append(f"<tr><td>Ending Price</td><td>{market_data['close'].iloc[-1]:.2f}</td></tr>")
-            html_content.append(f"<tr><td>Return</td><td>{(market_data['close'].iloc[-1] / market_data['close'].iloc[0] - 1) * 100:.2f}%</td></tr>")
-            html_content.append("</table>")
-            
-            # Strategy summary
-            html_content.append("<h2>Strategy Summary</h2>")
-            html_content.append("<table>")
-            html_content.append("<tr><th>Strategy</th><th>Type</th><th>Weight</th><th>Parameters</th><th>Trades</th></tr>")
-            
+            # Signal type per strategy name, for strategies that report one
+            type_by_name = {
+                signals['strategy'].iloc[0]: signals['signal_type'].iloc[0]
+                for signals in strategy_signals
+                if not signals.empty and 'strategy' in signals.columns and 'signal_type' in signals.columns
+            }
+            
+            # Strategy summary rows
+            strategy_rows = []
             for metadata in strategy_metadata:
                 strategy_name = metadata.get("strategy_name", "Unknown")
-                strategy_type = next((s['signal_type'].iloc[0] for s in strategy_signals if s['strategy'].iloc[0] == strategy_name), "Unknown")
+                strategy_type = type_by_name.get(strategy_name, "Unknown")
                 weight = metadata.get("weight", 1.0)
                 num_trades = metadata.get("num_trades", 0)
                 
@@ -232,45 +358,44 @@ class ReportGenerator:
                 params = ", ".join([f"{k}: {v}" for k, v in metadata.items() 
                                   if k not in ["strategy_name", "weight", "num_trades"]])
                 
-                html_content.append(f"<tr><td>{strategy_name}</td><td>{strategy_type}</td><td>{weight:.2f}</td><td>{params}</td><td>{num_trades}</td></tr>")
-            
-            html_content.append("</table>")
+                strategy_rows.append(f"<tr><td>{strategy_name}</td><td>{strategy_type}</td><td>{weight:.2f}</td><td>{params}</td><td>{num_trades}</td></tr>\n")
             
             # Aggregated signal summary
+            aggregated_section = ""
             if not aggregated_signal.empty:
-                html_content.append("<h2>Aggregated Signal Summary</h2>")
-                html_content.append("<table>")
-                html_content.append("<tr><th>Metric</th><th>Value</th></tr>")
-                
-                buy_signals = aggregated_signal[aggregated_signal['binary_signal'] == 1]
-                sell_signals = aggregated_signal[aggregated_signal['binary_signal'] == 0]
-                
-                html_content.append(f"<tr><td>Total Buy Signals</td><td>{len(buy_signals)}</td></tr>")
-                html_content.append(f"<tr><td>Total Sell Signals</td><td>{len(sell_signals)}</td></tr>")
-                html_content.append(f"<tr><td>Average Signal Strength</td><td>{aggregated_signal['signal'].mean():.4f}</td></tr>")
-                html_content.append("</table>")
-            
-            # Include plots if available
-            plots_dir = os.path.join(self.output_dir, "plots")
-            price_plot_path = os.path.join(plots_dir, f"{base_filename}_price_signals.png")
-            signals_plot_path = os.path.join(plots_dir, f"{base_filename}_strategy_signals.png")
-            
-            if os.path.exists(price_plot_path):
-                html_content.append("<h2>Price Chart with Signals</h2>")
-                html_content.append(f"<img src='plots/{os.path.basename(price_plot_path)}' alt='Price Chart' style='max-width:100%;'>")
-            
-            if os.path.exists(signals_plot_path):
-                html_content.append("<h2>Strategy Signals Comparison</h2>")
-                html_content.append(f"<img src='plots/{os.path.basename(signals_plot_path)}' alt='Strategy Signals' style='max-width:100%;'>")
-            
-            # Close HTML
-            html_content.append("</body>")
-            html_content.append("</html>")
+                binary_signal = aggregated_signal['binary_signal']
+                aggregated_section = AGGREGATED_TEMPLATE.format(
+                    buy_signals=int((binary_signal == 1).sum()),
+                    sell_signals=int((binary_signal == 0).sum()),
+                    average_signal=aggregated_signal['signal'].mean()
+                )
+            
+            # Include the plots generated for this report
+            plot_sections = []
+            for plot_path in plot_paths or []:
+                plot_name = os.path.basename(plot_path)
+                heading, alt_text = PLOT_TITLES[plot_name[len(base_filename):]]
+                plot_sections.append(f"<h2>{heading}</h2>\n<img src='plots/{plot_name}' alt='{alt_text}' style='max-width:100%;'>\n")
+            
+            close = market_data['close']
+            html = HTML_TEMPLATE.format(
+                generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                symbol=market_data.index.name or 'Unknown',
+                start_date=market_data.index.min().strftime('%Y-%m-%d'),
+                end_date=market_data.index.max().strftime('%Y-%m-%d'),
+                num_days=len(market_data),
+                start_price=close.iloc[0],
+                end_price=close.iloc[-1],
+                total_return=(close.iloc[-1] / close.iloc[0] - 1) * 100,
+                strategy_rows="".join(strategy_rows),
+                aggregated_section=aggregated_section,
+                plot_sections="".join(plot_sections)
+            )
             
             # Write HTML to file
             report_path = os.path.join(self.output_dir, f"{base_filename}.html")
-            with open(report_path, 'w') as f:
-                f.write("\n".join(html_content))
+            with open(report_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(html)
             
             return report_path
             
@@ -298,35 +423,54 @@ class ReportGenerator:
             Path to the main CSV report file
         """
         try:
-            # Create a combined DataFrame with market data and signals
-            combined_data = market_data.copy()
+            # Collect market data and signal columns, then build the combined DataFrame once
+            columns = {column: market_data[column] for column in market_data.columns}
             
             # Add individual strategy signals
             for i, signals in enumerate(strategy_signals):
                 strategy_name = signals['strategy'].iloc[0] if 'strategy' in signals.columns else f"Strategy_{i+1}"
                 if 'signal' in signals.columns:
-                    combined_data[f"{strategy_name}_signal"] = signals['signal']
+                    columns[f"{strategy_name}_signal"] = signals['signal']
                 if 'binary_signal' in signals.columns:
-                    combined_data[f"{strategy_name}_binary"] = signals['binary_signal']
+                    columns[f"{strategy_name}_binary"] = signals['binary_signal']
             
             # Add aggregated signals
             if not aggregated_signal.empty:
                 if 'signal' in aggregated_signal.columns:
-                    combined_data['aggregated_signal'] = aggregated_signal['signal']
+                    columns['aggregated_signal'] = aggregated_signal['signal']
                 if 'binary_signal' in aggregated_signal.columns:
-                    combined_data['aggregated_binary'] = aggregated_signal['binary_signal']
+                    columns['aggregated_binary'] = aggregated_signal['binary_signal']
+            
+            # Series are aligned on the market data index, as column assignment did
+            combined_data = pd.DataFrame(columns, index=market_data.index)
             
             # Save to CSV
             csv_path = os.path.join(self.output_dir, f"{base_filename}.csv")
-            combined_data.to_csv(csv_path)
+            self._write_csv(combined_data, csv_path)
             
             # Also save strategy metadata
             metadata_df = pd.DataFrame(strategy_metadata)
             metadata_csv_path = os.path.join(self.output_dir, f"{base_filename}_metadata.csv")
-            metadata_df.to_csv(metadata_csv_path, index=False)
+            with open(metadata_csv_path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+                metadata_df.to_csv(f, index=False)
             
             return csv_path
             
         except Exception as e:
             logger.error(f"Error generating CSV report: {e}")
-            return ""
\ No newline at end of file
+            return ""
+    
+    @staticmethod
+    def _write_csv(frame: pd.DataFrame, path: str) -> None:
+        """
+        Write a DataFrame and its index to CSV through a large buffer.
+        
+        The output is exactly DataFrame.to_csv's: a blank index header,
+        dates without a time part and pandas' number formatting.
+        
+        Args:
+            frame: DataFrame to write
+            path: Output CSV path
+        """
+        with open(path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+            frame.to_csv(f)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compiled kernels for the Ichimoku Cloud strategy.
+
+The rolling highs and lows behind the Tenkan-sen, Kijun-sen and Senkou Span B
+lines are tracked with monotonic deques in O(n) per window. The six
+(period, high/low) sweeps run serially with the GIL released, so they can
+overlap with other strategies on a thread pool (StrategyFactory.run_all).
+The kernel is not parallel=True: Numba's default workqueue threading layer
+aborts the process when parallel kernels are launched from several threads.
+NaN prices are skipped by the deques and make the whole window NaN, matching
+pandas rolling with the default min_periods. No fastmath: the NaN checks
+must survive compilation.
+"""
+
+import numpy as np
+
+from strategies._rolling_kernels import push_extreme
+from utils.jit import njit, signatures
+
+@njit(cache=True)
+def _rolling_extreme(values, window, take_max, out):
+    """Rolling max (or min) of values into out, NaN for short or NaN-holding windows."""
+    # Indices only grow, so a length-n buffer never wraps
+    deque = np.empty(values.shape[0], dtype=np.int64)
+    head = tail = 0
+    nans = 0
+    for i in range(values.shape[0]):
+        head, tail = push_extreme(values, i, window, deque, head, tail, take_max)
+        if values[i] != values[i]:
+            nans += 1
+        if i >= window and values[i - window] != values[i - window]:
+            nans -= 1
+        if i < window - 1 or nans > 0:
+            out[i] = np.nan
+        else:
+            out[i] = values[deque[head]]
+
+@njit(signatures("UniTuple(f8[:, ::1], 2)(f8[::1], f8[::1], i8[::1])"), nogil=True, cache=True)
+def ichimoku_extrema(high, low, periods):
+    """
+    Rolling highest high and lowest low for several windows.
+
+    Args:
+        high: float64 array of high prices
+        low: float64 array of low prices
+        periods: int64 array of window lengths
+
+    Returns:
+        Tuple of (maxes, mins), each a len(periods) x len(high) array
+    """
+    n = high.shape[0]
+    maxes = np.empty((periods.shape[0], n))
+    mins = np.empty((periods.shape[0], n))
+    for task in range(2 * periods.shape[0]):
+        p = task // 2
+        if task % 2 == 0:
+            _rolling_extreme(high, periods[p], True, maxes[p])
+        else:
+            _rolling_extreme(low, periods[p], False, mins[p])
+    return maxes, mins
+
+def _shift(values, periods):
+    """NaN-filled shift of a 1-D array, like Series.shift."""
+    shifted = np.full(values.shape[0], np.nan)
+    if periods >= 0:
+        if periods < values.shape[0]:
+            shifted[periods:] = values[:values.shape[0] - periods]
+    elif -periods < values.shape[0]:
+        shifted[:periods] = values[-periods:]
+    return shifted
+
+def ichimoku_lines(high, low, tenkan_period, kijun_period, senkou_b_period, displacement):
+    """
+    Compute the Tenkan-sen, Kijun-sen and both Senkou spans.
+
+    Args:
+        high: float64 array of high prices
+        low: float64 array of low prices
+        tenkan_period: Tenkan-sen window
+        kijun_period: Kijun-sen window
+        senkou_b_period: Senkou Span B window
+        displacement: Forward shift applied to both Senkou spans
+
+    Returns:
+        Tuple of (tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b) arrays
+    """
+    periods = np.array([tenkan_period, kijun_period, senkou_b_period], dtype=np.int64)
+    maxes, mins = ichimoku_extrema(high, low, periods)
+
+    # Midpoints of each window, computed in place on the maxes matrix
+    midpoints = np.add(maxes, mins, out=maxes)
+    midpoints /= 2
+    tenkan, kijun, senkou_b_line = midpoints
+
+    # Senkou spans are plotted displacement bars ahead
+    senkou_a = _shift((tenkan + kijun) / 2, displacement)
+    senkou_b = _shift(senkou_b_line, displacement)
+
+    return tenkan, kijun, senkou_a, senkou_b
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compiled moving-average crossover kernel.
+
+The fast and slow simple moving averages are maintained as running window
+sums in one loop over the close prices. The window bookkeeping mirrors
+pandas' rolling mean (Kahan-compensated add/remove, NaN skipping, sign and
+constant-run corrections), so the averages, and therefore the signals at
+the threshold, match the pandas implementation exactly.
+"""
+
+import math
+
+import numpy as np
+
+from utils.jit import njit, prange, signatures
+
+# Slots of a rolling-mean state array
+_NOBS, _SUM, _COMP_ADD, _COMP_REMOVE, _NEG_CT, _SAME_CT, _PREV = range(7)
+
+@njit(cache=True)
+def _mean_reset(state, first_value):
+    """Start an empty window."""
+    state[:] = 0.0
+    state[_PREV] = first_value
+
+@njit(cache=True)
+def _mean_add(state, value):
+    """Add a value entering the window."""
+    if value == value:
+        state[_NOBS] += 1.0
+        y = value - state[_COMP_ADD]
+        t = state[_SUM] + y
+        state[_COMP_ADD] = t - state[_SUM] - y
+        state[_SUM] = t
+        if math.copysign(1.0, value) < 0.0:
+            state[_NEG_CT] += 1.0
+        if value == state[_PREV]:
+            state[_SAME_CT] += 1.0
+        else:
+            state[_SAME_CT] = 1.0
+        state[_PREV] = value
+
+@njit(cache=True)
+def _mean_remove(state, value):
+    """Remove a value leaving the window."""
+    if value == value:
+        state[_NOBS] -= 1.0
+        y = -value - state[_COMP_REMOVE]
+        t = state[_SUM] + y
+        state[_COMP_REMOVE] = t - state[_SUM] - y
+        state[_SUM] = t
+        if math.copysign(1.0, value) < 0.0:
+            state[_NEG_CT] -= 1.0
+
+@njit(cache=True)
+def _mean_value(state, window):
+    """Mean of a full window, or NaN while it holds fewer than window values."""
+    nobs = state[_NOBS]
+    if nobs < window or nobs <= 0.0:
+        return np.nan
+    if state[_SAME_CT] >= nobs:
+        return state[_PREV]
+    result = state[_SUM] / nobs
+    if state[_NEG_CT] == 0.0 and result < 0.0:
+        return 0.0
+    if state[_NEG_CT] == nobs and result > 0.0:
+        return 0.0
+    return result
+
+@njit(cache=True)
+def _mean_step(state, close, i, window):
+    """Slide a window to end at bar i and return its mean."""
+    start = i - window + 1
+    if i == 0 or start >= i:
+        # Windows that no longer overlap the previous one are rebuilt
+        _mean_reset(state, close[max(start, 0)])
+        for j in range(max(start, 0), i + 1):
+            _mean_add(state, close[j])
+    else:
+        if start > 0:
+            _mean_remove(state, close[start - 1])
+        _mean_add(state, close[i])
+    return _mean_value(state, window)
+
+@njit(signatures("Tuple((f8[::1], i1[::1]))(f8[::1], i8, i8, f8)"), nogil=True, cache=True)
+def ma_crossover_diff(close, fast_period, slow_period, signal_threshold):
+    """
+    Fast-minus-slow moving average difference and crossover signal in one pass.
+
+    Args:
+        close: float64 array of close prices
+        fast_period: Fast moving average window
+        slow_period: Slow moving average window
+        signal_threshold: Difference above which the signal is a buy
+
+    Returns:
+        Tuple of (ma_diff float64 array, signal int8 array of 1/-1)
+    """
+    n = close.shape[0]
+    ma_diff = np.empty(n)
+    signal = np.empty(n, dtype=np.int8)
+    fast_state = np.zeros(7)
+    slow_state = np.zeros(7)
+
+    for i in range(n):
+        fast_ma = _mean_step(fast_state, close, i, fast_period)
+        slow_ma = _mean_step(slow_state, close, i, slow_period)
+        ma_diff[i] = fast_ma - slow_ma
+        signal[i] = 1 if ma_diff[i] > signal_threshold else -1
+
+    return ma_diff, signal
+
+@njit(signatures("i1[:, ::1](f8[:, ::1], i8, i8, f8)"), parallel=True, nogil=True, cache=True)
+def ma_crossover_batch(closes, fast_period, slow_period, signal_threshold):
+    """
+    Crossover signals for several symbols at once, one symbol per parallel task.
+
+    Args:
+        closes: C-contiguous float64 array of shape (symbols, bars)
+        fast_period: Fast moving average window
+        slow_period: Slow moving average window
+        signal_threshold: Difference above which the signal is a buy
+
+    Returns:
+        int8 array of 1/-1 signals with the same shape as closes
+    """
+    signals = np.empty(closes.shape, dtype=np.int8)
+    for j in prange(closes.shape[0]):
+        signals[j] = ma_crossover_diff(closes[j], fast_period, slow_period, signal_threshold)[1]
+    return signals
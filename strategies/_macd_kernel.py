@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compiled MACD kernel.
+
+The fast, slow and signal EWMAs are carried as running state in one loop
+over the close prices. Each update follows pandas' ewm(adjust=False).mean()
+recurrence, including how NaN gaps decay the previous weight, so the lines
+match the pandas implementation. (pandas weights the value after a NaN gap
+differently when alpha is exactly 0.5, i.e. span=3; gap-free series match
+for every span.)
+"""
+
+import numpy as np
+
+from utils.jit import njit, prange, signatures
+
+@njit(cache=True)
+def _span_alpha(span):
+    """Smoothing factor for a span, derived via the centre of mass as pandas does."""
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+@njit(cache=True)
+def _ewm_step(weighted, old_wt, value, alpha):
+    """Advance an adjust=False EWMA by one value; returns (weighted, old_wt)."""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if value == value:
+            if weighted != value:
+                weighted = (old_wt * weighted + alpha * value) / (old_wt + alpha)
+            old_wt = 1.0
+    elif value == value:
+        weighted = value
+        old_wt = 1.0
+    return weighted, old_wt
+
+@njit(signatures("UniTuple(f8[::1], 3)(f8[::1], i8, i8, i8)"), nogil=True, cache=True)
+def macd(close, fast_period, slow_period, signal_period):
+    """
+    MACD line, signal line and histogram in one pass.
+
+    Args:
+        close: float64 array of close prices
+        fast_period: Fast EMA span
+        slow_period: Slow EMA span
+        signal_period: Signal line EMA span
+
+    Returns:
+        Tuple of (macd_line, signal_line, histogram) arrays
+    """
+    n = close.shape[0]
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    histogram = np.empty(n)
+
+    fast_alpha = _span_alpha(fast_period)
+    slow_alpha = _span_alpha(slow_period)
+    signal_alpha = _span_alpha(signal_period)
+    fast = slow = signal = np.nan
+    fast_wt = slow_wt = signal_wt = 1.0
+
+    for i in range(n):
+        fast, fast_wt = _ewm_step(fast, fast_wt, close[i], fast_alpha)
+        slow, slow_wt = _ewm_step(slow, slow_wt, close[i], slow_alpha)
+        line = fast - slow
+        signal, signal_wt = _ewm_step(signal, signal_wt, line, signal_alpha)
+        macd_line[i] = line
+        signal_line[i] = signal
+        histogram[i] = line - signal
+
+    return macd_line, signal_line, histogram
+
+@njit(signatures("UniTuple(f8[:, ::1], 2)(f8[:, ::1], i8, i8, i8)"), parallel=True, nogil=True, cache=True)
+def macd_batch(closes, fast_period, slow_period, signal_period):
+    """
+    MACD and signal lines for several symbols at once, one symbol per parallel task.
+
+    Args:
+        closes: C-contiguous float64 array of shape (symbols, bars)
+        fast_period: Fast EMA span
+        slow_period: Slow EMA span
+        signal_period: Signal line EMA span
+
+    Returns:
+        Tuple of (macd_line, signal_line) arrays with the same shape as closes
+    """
+    macd_lines = np.empty(closes.shape)
+    signal_lines = np.empty(closes.shape)
+    for j in prange(closes.shape[0]):
+        macd_line, signal_line, _ = macd(closes[j], fast_period, slow_period, signal_period)
+        macd_lines[j] = macd_line
+        signal_lines[j] = signal_line
+    return macd_lines, signal_lines
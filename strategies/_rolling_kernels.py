@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compiled building blocks shared by the rolling-window strategy kernels.
+
+push_extreme maintains a monotonic deque of bar indices whose head is the
+rolling maximum (or minimum) of a trailing window, in amortised O(1) per
+bar, the same structure pandas uses for rolling max/min. NaN prices are
+never pushed, so the head skips them.
+"""
+
+from utils.jit import njit
+
+@njit(cache=True)
+def push_extreme(values, i, window, deque, head, tail, take_max):
+    """Push bar i into a monotonic deque and drop indices that left the window."""
+    x = values[i]
+    if x == x:
+        if take_max:
+            while tail > head and values[deque[tail - 1]] <= x:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= x:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+    while tail > head and deque[head] <= i - window:
+        head += 1
+    return head, tail
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Compiled RSI kernel.
+
+Computes the same simple-moving-average RSI as the pandas implementation in
+RSIStrategy, in one pass over the close prices: the gain and loss window
+sums are updated incrementally and the per-bar deltas are recomputed from the
+prices instead of being stored. The output takes the dtype of the prices,
+so float32 input gives a float32 RSI; the window sums are always float64,
+since rounding in add/remove running sums accumulates over the series.
+"""
+
+import numpy as np
+
+from utils.jit import njit, prange, signatures
+
+@njit(cache=True)
+def _gain_loss(close, i):
+    """Gain and loss of bar i; a NaN delta (first bar, NaN price) counts as neither."""
+    if i == 0:
+        return 0.0, 0.0
+    delta = close[i] - close[i - 1]
+    if delta > 0.0:
+        return delta, 0.0
+    if delta < 0.0:
+        return 0.0, -delta
+    return 0.0, 0.0
+
+@njit(signatures("f8[::1](f8[::1], i8)", "f4[::1](f4[::1], i8)"), nogil=True, cache=True)
+def rsi(close, period):
+    """
+    Relative Strength Index over a rolling window of period bars.
+
+    Args:
+        close: float64 or float32 array of close prices
+        period: RSI window length
+
+    Returns:
+        Array of RSI values in the dtype of close, NaN for the first period - 1 bars
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=close.dtype)
+    out[:] = np.nan
+    gain_sum = 0.0
+    loss_sum = 0.0
+    # Counting non-zero terms lets all-zero windows give exactly 0 despite rounding in the sums
+    gain_count = 0
+    loss_count = 0
+
+    for i in range(n):
+        gain, loss = _gain_loss(close, i)
+        gain_sum += gain
+        loss_sum += loss
+        gain_count += gain > 0.0
+        loss_count += loss > 0.0
+
+        if i >= period:
+            gain, loss = _gain_loss(close, i - period)
+            gain_sum -= gain
+            loss_sum -= loss
+            gain_count -= gain > 0.0
+            loss_count -= loss > 0.0
+
+        if i >= period - 1:
+            avg_gain = gain_sum / period if gain_count > 0 else 0.0
+            avg_loss = loss_sum / period if loss_count > 0 else 0.0
+            if avg_loss == 0.0:
+                # Avoid division by zero
+                avg_loss = 1e-10
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+@njit(signatures("f8[:, ::1](f8[:, ::1], i8)"), parallel=True, nogil=True, cache=True)
+def rsi_batch(closes, period):
+    """
+    RSI for several symbols at once, one symbol per parallel task.
+
+    Args:
+        closes: C-contiguous float64 array of shape (symbols, bars)
+        period: RSI window length
+
+    Returns:
+        float64 array of RSI values with the same shape as closes
+    """
+    out = np.empty(closes.shape)
+    for j in prange(closes.shape[0]):
+        out[j] = rsi(closes[j], period)
+    return out
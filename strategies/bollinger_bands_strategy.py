@@ -4,12 +4,75 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, List, Union, Optional, Tuple
 
 from strategies.strategy_interface import Strategy
 
 logger = logging.getLogger(__name__)
 
+# Outputs per block of running sums; bounds how far rounding error can accumulate
+ROLLING_BLOCK_SIZE = 4096
+
+# Windows whose sum of squared deviations is below this fraction of the block's
+# total are recomputed exactly, bounding the relative error near 1e6 * eps
+ILL_CONDITIONED_RATIO = 1e-6
+
+def _rolling_mean_std(values: np.ndarray, window: int, block_size: int = ROLLING_BLOCK_SIZE):
+    """
+    Rolling mean and sample standard deviation (ddof=1) in one pass.
+    
+    Window sums come from running sums of the values and their squares.
+    The sums restart every block_size outputs, over the block plus the
+    window - 1 values before it, and are taken relative to that stretch's
+    mean. The error of a window difference therefore stays at the scale of
+    one block around its local price level, instead of growing with the
+    series length and price drift. Windows too flat for the sums to resolve
+    are recomputed from their values. The first window - 1 entries are NaN,
+    like pandas rolling. Inputs containing NaN use pandas rolling, whose NaN
+    handling the running sums cannot reproduce.
+    
+    Args:
+        values: 1-D float64 array
+        window: Rolling window length
+        block_size: Number of outputs computed from one set of running sums
+        
+    Returns:
+        Tuple of (mean, std) arrays with the length of values
+    """
+    n = len(values)
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if n < window:
+        return mean, std
+    if np.isnan(values).any():
+        rolling = pd.Series(values).rolling(window=window)
+        # Copies, as callers build the bands in place and to_numpy can be read-only
+        return rolling.mean().to_numpy(copy=True), rolling.std().to_numpy(copy=True)
+    
+    for start in range(window - 1, n, block_size):
+        stop = min(start + block_size, n)
+        segment = values[start - window + 1:stop]
+        anchor = segment.mean()
+        shifted = segment - anchor
+        sums = np.concatenate(([0.0], np.cumsum(shifted)))
+        squares = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+        window_sum = sums[window:] - sums[:-window]
+        window_squares = squares[window:] - squares[:-window]
+        
+        mean[start:stop] = window_sum / window + anchor
+        if window > 1:
+            # Rounding can leave a tiny negative variance for flat windows
+            variance = np.maximum((window_squares - window_sum * window_sum / window) / (window - 1), 0.0)
+            # The sums carry an absolute error of about eps * squares[-1]; windows whose
+            # spread is too small next to that would lose most of their digits to
+            # cancellation, so those are recomputed directly from their values
+            suspect = np.flatnonzero(variance * (window - 1) < squares[-1] * ILL_CONDITIONED_RATIO)
+            if suspect.size:
+                windows = np.lib.stride_tricks.sliding_window_view(segment, window)[suspect]
+                variance[suspect] = windows.var(axis=1, ddof=1)
+            std[start:stop] = np.sqrt(variance)
+    return mean, std
+
 class BollingerBandsStrategy(Strategy):
     """
     Bollinger Bands strategy.
@@ -55,34 +118,37 @@ class BollingerBandsStrategy(Strategy):
         # Calculate Bollinger Bands
         price = data[self.price_source]
         
-        # Calculate middle band (simple moving average)
-        middle_band = price.rolling(window=self.period).mean()
+        # Calculate middle band (simple moving average) and standard deviation together
+        middle_band, rolling_std = _rolling_mean_std(price.to_numpy(dtype=np.float64), self.period)
         
-        # Calculate standard deviation
-        rolling_std = price.rolling(window=self.period).std()
+        # Calculate upper and lower bands, reusing the std buffer for the band width
+        band_width = np.multiply(rolling_std, self.std_dev, out=rolling_std)
+        upper_band = middle_band + band_width
+        lower_band = np.subtract(middle_band, band_width, out=band_width)
         
-        # Calculate upper and lower bands
-        upper_band = middle_band + (rolling_std * self.std_dev)
-        lower_band = middle_band - (rolling_std * self.std_dev)
-        
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals['middle_band'] = middle_band
-        signals['upper_band'] = upper_band
-        signals['lower_band'] = lower_band
-        signals['price'] = price
+        # The bands are only displayed and compared against, so float32 is enough.
+        # Signals are computed from the stored float32 bands so they agree with them.
+        middle_band = middle_band.astype(np.float32, copy=False)
+        upper_band = upper_band.astype(np.float32, copy=False)
+        lower_band = lower_band.astype(np.float32, copy=False)
         
         # Generate signal: 1 for price below lower band (buy), -1 for price above upper band (sell), 0 for neutral
-        signals['signal'] = 0
-        signals.loc[price < lower_band, 'signal'] = 1  # Buy signal
-        signals.loc[price > upper_band, 'signal'] = -1  # Sell signal
-        
-        # Generate binary signal (1 for buy, 0 for sell/neutral)
-        signals['binary_signal'] = np.where(signals['signal'] > 0, 1, 0)
-        
-        # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+        price_values = price.to_numpy()
+        signal = np.where(price_values > upper_band, -1, np.where(price_values < lower_band, 1, 0)).astype(np.int8)
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame({
+            'middle_band': middle_band,
+            'upper_band': upper_band,
+            'lower_band': lower_band,
+            'price': price_values,
+            'signal': signal,
+            # Binary signal (1 for buy, 0 for sell/neutral)
+            'binary_signal': (signal > 0).astype(np.int8),
+            # Strategy metadata
+            'strategy': self._strategy_column(len(data)),
+            'weight': self.weight
+        }, index=data.index)
         
         # Store signals for later retrieval
         self.signals = signals
@@ -106,15 +172,16 @@ class BollingerBandsStrategy(Strategy):
             return
         
         # Calculate metrics only on valid signals (after warmup period)
-        valid_signals = signals.iloc[self.period:].copy()
+        signal = signals['signal'].to_numpy()[self.period:]
+        binary_signal = signals['binary_signal'].to_numpy()[self.period:]
         
         # Count number of buy and sell signals
-        buy_signals = (valid_signals['signal'] == 1).sum()
-        sell_signals = (valid_signals['signal'] == -1).sum()
+        buy_signals = np.count_nonzero(signal == 1)
+        sell_signals = np.count_nonzero(signal == -1)
         
         # Calculate percentage of time in market
-        total_periods = len(valid_signals)
-        in_market_periods = (valid_signals['binary_signal'] == 1).sum()
+        total_periods = len(signal)
+        in_market_periods = np.count_nonzero(binary_signal == 1)
         market_participation = (in_market_periods / total_periods) * 100 if total_periods > 0 else 0
         
         # Store metrics in metadata
@@ -126,6 +193,15 @@ class BollingerBandsStrategy(Strategy):
             "market_participation": float(market_participation)
         })
     
+    def required_columns(self) -> Tuple[str, ...]:
+        """
+        Get the market data columns process_data reads.
+        
+        Returns:
+            Tuple of column names
+        """
+        return (self.price_source,)
+    
     def get_signal_type(self) -> str:
         """
         Get the type of signals this strategy generates.
@@ -4,12 +4,48 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, List, Union, Optional, Tuple
 
 from strategies.strategy_interface import Strategy
+from utils.jit import njit, signatures, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+@njit(signatures("i1[::1](f8[::1], f8[::1], f8[::1], f8[::1], i8, i8, f8[::1], f8)"), nogil=True, cache=True)
+def _fibonacci_signals_nb(high, low, close, trend_ma, trend_period, lookback, levels, tolerance):
+    """
+    Scan the bars once and return the int8 signal array (1 buy, -1 sell).
+
+    Compiled counterpart of FibonacciRetracementStrategy._find_retracement_hits
+    that needs no (n, lookback) window copies. Levels at exactly zero never
+    count as a hit, like the inf/NaN distance of the vectorized path.
+    """
+    n = close.shape[0]
+    signal = np.zeros(n, dtype=np.int8)
+
+    for i in range(trend_period + lookback, n):
+        start = i - lookback
+        if trend_ma[i] > trend_ma[start]:
+            # Uptrend: swing low, then the highest high up to the current bar
+            swing = start + np.argmin(low[start:i])
+            base = high[swing:i + 1].max()
+            price_range = low[swing] - base
+            direction = 1
+        else:
+            # Downtrend: swing high, then the lowest low up to the current bar
+            swing = start + np.argmax(high[start:i])
+            base = low[swing:i + 1].min()
+            price_range = high[swing] - base
+            direction = -1
+
+        for k in range(levels.shape[0]):
+            price_level = base + levels[k] * price_range
+            if price_level != 0.0 and abs(close[i] - price_level) / price_level <= tolerance:
+                signal[i] = direction
+                break
+
+    return signal
+
 class FibonacciRetracementStrategy(Strategy):
     """
     Fibonacci Retracement strategy.
@@ -33,6 +69,9 @@ class FibonacciRetracementStrategy(Strategy):
         self.swing_lookback = self.parameters.get("swing_lookback", 20)
         self.retracement_levels = self.parameters.get("retracement_levels", [0.236, 0.382, 0.5, 0.618, 0.786])
         self.level_tolerance = self.parameters.get("level_tolerance", 0.01)
+        
+        # Contiguous copy of the levels for the vectorized and compiled signal paths
+        self._levels = np.asarray(self.retracement_levels, dtype=np.float64)
     
     def process_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -49,89 +88,45 @@ class FibonacciRetracementStrategy(Strategy):
             return pd.DataFrame()
         
         # Ensure we have the required columns
-        if 'high' not in data.columns or 'low' not in data.columns or 'close' not in data.columns:
+        if not all(col in data.columns for col in self.required_columns()):
             logger.error("Data missing required columns for Fibonacci Retracement calculation")
             return pd.DataFrame()
         
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0
-        signals['binary_signal'] = 0
-        
-        # Calculate trend direction using simple moving average
-        data['trend_ma'] = data['close'].rolling(window=self.trend_period).mean()
+        signal = np.zeros(len(data), dtype=np.int8)
+        binary_signal = np.zeros(len(data), dtype=np.int8)
         
         # We need at least trend_period + swing_lookback data points
         min_required = self.trend_period + self.swing_lookback
         if len(data) < min_required:
             logger.warning(f"Not enough data points for Fibonacci Retracement calculation. Need at least {min_required}")
-            return signals
-        
-        # Process each window of data starting from the minimum required data points
-        for i in range(min_required, len(data)):
-            # Determine trend direction
-            current_ma = data['trend_ma'].iloc[i]
-            prev_ma = data['trend_ma'].iloc[i - self.swing_lookback]
-            trend_direction = 1 if current_ma > prev_ma else -1
-            
-            # Find swing high/low points in the lookback period
-            window = data.iloc[i - self.swing_lookback:i]
-            
-            if trend_direction > 0:  # Uptrend - look for swing low to swing high
-                swing_low = window['low'].min()
-                swing_low_idx = window['low'].idxmin()
-                
-                # Find the highest high after the swing low
-                high_after_low = data.loc[swing_low_idx:data.index[i], 'high'].max()
-                
-                # Calculate Fibonacci retracement levels
-                price_range = high_after_low - swing_low
-                fib_levels = [high_after_low - level * price_range for level in self.retracement_levels]
-                
-                # Current price
-                current_price = data['close'].iloc[i]
-                
-                # Check if price is near any retracement level
-                for level, price_level in zip(self.retracement_levels, fib_levels):
-                    # Calculate percentage distance from the level
-                    level_distance = abs(current_price - price_level) / price_level
-                    
-                    # If price is within tolerance of a Fibonacci level
-                    if level_distance <= self.level_tolerance:
-                        # Generate buy signal in uptrend when price retraces to a Fibonacci level
-                        signals.loc[data.index[i], 'signal'] = 1
-                        signals.loc[data.index[i], 'binary_signal'] = 1
-                        break
-            
-            else:  # Downtrend - look for swing high to swing low
-                swing_high = window['high'].max()
-                swing_high_idx = window['high'].idxmax()
-                
-                # Find the lowest low after the swing high
-                low_after_high = data.loc[swing_high_idx:data.index[i], 'low'].min()
-                
-                # Calculate Fibonacci retracement levels
-                price_range = swing_high - low_after_high
-                fib_levels = [low_after_high + level * price_range for level in self.retracement_levels]
-                
-                # Current price
-                current_price = data['close'].iloc[i]
-                
-                # Check if price is near any retracement level
-                for level, price_level in zip(self.retracement_levels, fib_levels):
-                    # Calculate percentage distance from the level
-                    level_distance = abs(current_price - price_level) / price_level
-                    
-                    # If price is within tolerance of a Fibonacci level
-                    if level_distance <= self.level_tolerance:
-                        # Generate sell signal in downtrend when price retraces to a Fibonacci level
-                        signals.loc[data.index[i], 'signal'] = -1
-                        signals.loc[data.index[i], 'binary_signal'] = 0
-                        break
-        
-        # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+            return pd.DataFrame({'signal': signal, 'binary_signal': binary_signal}, index=data.index)
+        
+        # Buy in an uptrend / sell in a downtrend when price retraces to a Fibonacci level
+        if NUMBA_AVAILABLE:
+            signal = _fibonacci_signals_nb(
+                np.ascontiguousarray(data['high'].to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(data['low'].to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(data['close'].to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(data['close'].rolling(window=self.trend_period).mean().to_numpy(), dtype=np.float64),
+                int(self.trend_period),
+                int(self.swing_lookback),
+                self._levels,
+                float(self.level_tolerance)
+            )
+        else:
+            buy_hit, sell_hit = self._find_retracement_hits(data)
+            signal[buy_hit] = 1
+            signal[sell_hit] = -1
+        binary_signal[signal == 1] = 1
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame({
+            'signal': signal,
+            'binary_signal': binary_signal,
+            # Strategy metadata
+            'strategy': self._strategy_column(len(data)),
+            'weight': self.weight
+        }, index=data.index)
         
         # Store signals for later retrieval
         self.signals = signals
@@ -141,6 +136,64 @@ class FibonacciRetracementStrategy(Strategy):
         
         return signals
     
+    def _find_retracement_hits(self, data: pd.DataFrame):
+        """
+        Find the bars where price sits on a Fibonacci retracement level.
+        
+        For every bar i the swing extreme is taken from the previous
+        swing_lookback bars, and the opposite extreme from the swing bar up to
+        and including bar i. All windows are evaluated at once through strided
+        views of the price arrays.
+        
+        Args:
+            data: DataFrame containing market data (OHLCV)
+            
+        Returns:
+            Tuple of boolean arrays (buy_hit, sell_hit) aligned with data
+        """
+        lookback = self.swing_lookback
+        high = data['high'].to_numpy(dtype=np.float64)
+        low = data['low'].to_numpy(dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+        levels = self._levels
+        
+        # Trend direction using simple moving average
+        trend_ma = data['close'].rolling(window=self.trend_period).mean().to_numpy()
+        
+        # Bars min_required..n-1; bar i uses the lookback window starting at i - lookback
+        bars = np.arange(self.trend_period + lookback, len(data))
+        starts = bars - lookback
+        uptrend = trend_ma[bars] > trend_ma[starts]
+        
+        # Window rows of length lookback + 1 span the swing window plus the current bar
+        low_windows = np.lib.stride_tricks.sliding_window_view(low, lookback + 1)[starts]
+        high_windows = np.lib.stride_tricks.sliding_window_view(high, lookback + 1)[starts]
+        offsets = np.arange(lookback + 1)
+        rows = np.arange(len(bars))
+        
+        # Uptrend: swing low, then the highest high from the swing low onwards
+        swing_low_pos = low_windows[:, :lookback].argmin(axis=1)
+        swing_low = low_windows[rows, swing_low_pos]
+        high_after_low = np.where(offsets >= swing_low_pos[:, None], high_windows, -np.inf).max(axis=1)
+        up_levels = high_after_low[:, None] - levels * (high_after_low - swing_low)[:, None]
+        
+        # Downtrend: swing high, then the lowest low from the swing high onwards
+        swing_high_pos = high_windows[:, :lookback].argmax(axis=1)
+        swing_high = high_windows[rows, swing_high_pos]
+        low_after_high = np.where(offsets >= swing_high_pos[:, None], low_windows, np.inf).min(axis=1)
+        down_levels = low_after_high[:, None] + levels * (swing_high - low_after_high)[:, None]
+        
+        fib_levels = np.where(uptrend[:, None], up_levels, down_levels)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            level_distance = np.abs(close[bars, None] - fib_levels) / fib_levels
+        hit = (level_distance <= self.level_tolerance).any(axis=1)
+        
+        buy_hit = np.zeros(len(data), dtype=bool)
+        sell_hit = np.zeros(len(data), dtype=bool)
+        buy_hit[bars] = hit & uptrend
+        sell_hit[bars] = hit & ~uptrend
+        return buy_hit, sell_hit
+    
     def _calculate_performance_metrics(self, data: pd.DataFrame, signals: pd.DataFrame) -> None:
         """
         Calculate performance metrics for the strategy.
@@ -155,17 +208,14 @@ class FibonacciRetracementStrategy(Strategy):
             return
         
         # Calculate basic metrics
-        signal_changes = signals['signal'].diff().fillna(0)
-        num_trades = (signal_changes != 0).sum()
+        signal = signals['signal'].to_numpy()
+        num_trades = np.count_nonzero(signal[1:] != signal[:-1])
         
         # Calculate win rate (simplified)
         # A win is when a buy signal is followed by a price increase, or a sell signal is followed by a price decrease
-        wins = 0
-        for i in range(len(signals) - 1):
-            if signals['signal'].iloc[i] == 1 and data['close'].iloc[i+1] > data['close'].iloc[i]:
-                wins += 1
-            elif signals['signal'].iloc[i] == -1 and data['close'].iloc[i+1] < data['close'].iloc[i]:
-                wins += 1
+        signal = signals['signal'].to_numpy()[:-1]
+        price_change = np.diff(data['close'].to_numpy())
+        wins = int(((signal == 1) & (price_change > 0)).sum() + ((signal == -1) & (price_change < 0)).sum())
         
         win_rate = wins / num_trades if num_trades > 0 else 0
         
@@ -177,6 +227,15 @@ class FibonacciRetracementStrategy(Strategy):
             "parameters": self.parameters
         })
 
+    def required_columns(self) -> Tuple[str, ...]:
+        """
+        Get the market data columns process_data reads.
+        
+        Returns:
+            Tuple of column names
+        """
+        return ('high', 'low', 'close')
+    
     def get_signal_type(self) -> str:
         """
         Get the type of signals this strategy generates.
@@ -4,12 +4,102 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, List, Union, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Tuple, Union, Optional
 
 from strategies.strategy_interface import Strategy
+from strategies._ichimoku_kernels import ichimoku_lines
+from utils.jit import NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+def _push_extreme(window: deque, index: int, value: float, period: int, take_max: bool) -> None:
+    """Push a bar into a monotonic (index, price) deque and drop bars that left the window."""
+    if value == value:
+        if take_max:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((index, value))
+    while window and window[0][0] <= index - period:
+        window.popleft()
+
+@dataclass
+class IchimokuState:
+    """
+    Rolling state for updating the Ichimoku lines one bar at a time.
+    
+    Each window keeps a monotonic deque of (bar index, price) pairs with its
+    extreme at the left end, so a new bar costs amortized O(1) per window.
+    NaN prices are skipped by the deques and make the windows holding them
+    NaN, as with pandas rolling.
+    """
+    bars: int = 0
+    tenkan_max: deque = field(default_factory=deque)
+    tenkan_min: deque = field(default_factory=deque)
+    kijun_max: deque = field(default_factory=deque)
+    kijun_min: deque = field(default_factory=deque)
+    senkou_b_max: deque = field(default_factory=deque)
+    senkou_b_min: deque = field(default_factory=deque)
+    last_nan_high: int = -1
+    last_nan_low: int = -1
+    # (senkou_span_a, senkou_span_b) values waiting out the displacement
+    pending_spans: deque = field(default_factory=deque)
+    tenkan_sen: float = np.nan
+    kijun_sen: float = np.nan
+    
+    def _midpoint(self, maxes: deque, mins: deque, period: int) -> float:
+        """(highest high + lowest low) / 2 over the window ending at the latest bar, or NaN."""
+        start = self.bars - period
+        if start < 0 or self.last_nan_high >= start or self.last_nan_low >= start:
+            return np.nan
+        return (maxes[0][1] + mins[0][1]) / 2
+    
+    def update(self, high: float, low: float, tenkan_period: int, kijun_period: int,
+               senkou_b_period: int, displacement: int) -> Tuple[float, float, float, float]:
+        """
+        Add one bar and return the Ichimoku lines at that bar.
+        
+        Args:
+            high: High price of the new bar
+            low: Low price of the new bar
+            tenkan_period: Tenkan-sen window
+            kijun_period: Kijun-sen window
+            senkou_b_period: Senkou Span B window
+            displacement: Forward shift applied to both Senkou spans (>= 0)
+            
+        Returns:
+            Tuple of (tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b)
+        """
+        i = self.bars
+        if high != high:
+            self.last_nan_high = i
+        if low != low:
+            self.last_nan_low = i
+        _push_extreme(self.tenkan_max, i, high, tenkan_period, True)
+        _push_extreme(self.tenkan_min, i, low, tenkan_period, False)
+        _push_extreme(self.kijun_max, i, high, kijun_period, True)
+        _push_extreme(self.kijun_min, i, low, kijun_period, False)
+        _push_extreme(self.senkou_b_max, i, high, senkou_b_period, True)
+        _push_extreme(self.senkou_b_min, i, low, senkou_b_period, False)
+        self.bars += 1
+        
+        self.tenkan_sen = self._midpoint(self.tenkan_max, self.tenkan_min, tenkan_period)
+        self.kijun_sen = self._midpoint(self.kijun_max, self.kijun_min, kijun_period)
+        senkou_b_line = self._midpoint(self.senkou_b_max, self.senkou_b_min, senkou_b_period)
+        
+        # The spans computed now are plotted displacement bars ahead
+        self.pending_spans.append(((self.tenkan_sen + self.kijun_sen) / 2, senkou_b_line))
+        if len(self.pending_spans) > displacement:
+            senkou_span_a, senkou_span_b = self.pending_spans.popleft()
+        else:
+            senkou_span_a = senkou_span_b = np.nan
+        
+        return self.tenkan_sen, self.kijun_sen, senkou_span_a, senkou_span_b
+
 class IchimokuCloudStrategy(Strategy):
     """
     Ichimoku Cloud (Ichimoku Kinko Hyo) strategy.
@@ -37,6 +127,7 @@ class IchimokuCloudStrategy(Strategy):
         self.kijun_period = self.parameters.get("kijun_period", 26)
         self.senkou_b_period = self.parameters.get("senkou_b_period", 52)
         self.displacement = self.parameters.get("displacement", 26)
+        self.incremental_state = None
     
     def _calculate_ichimoku_components(self, data: pd.DataFrame) -> Dict[str, pd.Series]:
         """
@@ -53,6 +144,28 @@ class IchimokuCloudStrategy(Strategy):
         low = data['low']
         close = data['close']
         
+        # Calculate Chikou Span (Lagging Span): Current closing price shifted backwards 26 periods
+        chikou_span = close.shift(-self.displacement)
+        
+        if NUMBA_AVAILABLE:
+            # All rolling extrema and both displaced spans in one compiled sweep
+            lines = ichimoku_lines(
+                np.ascontiguousarray(high.to_numpy(), dtype=np.float64),
+                np.ascontiguousarray(low.to_numpy(), dtype=np.float64),
+                int(self.tenkan_period),
+                int(self.kijun_period),
+                int(self.senkou_b_period),
+                int(self.displacement)
+            )
+            tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b = (pd.Series(line, index=data.index) for line in lines)
+            return {
+                'tenkan_sen': tenkan_sen,
+                'kijun_sen': kijun_sen,
+                'senkou_span_a': senkou_span_a,
+                'senkou_span_b': senkou_span_b,
+                'chikou_span': chikou_span
+            }
+        
         # Calculate Tenkan-sen (Conversion Line): (highest high + lowest low)/2 for the past 9 periods
         tenkan_sen = (high.rolling(window=self.tenkan_period).max() + 
                       low.rolling(window=self.tenkan_period).min()) / 2
@@ -68,9 +181,6 @@ class IchimokuCloudStrategy(Strategy):
         senkou_span_b = ((high.rolling(window=self.senkou_b_period).max() + 
                           low.rolling(window=self.senkou_b_period).min()) / 2).shift(self.displacement)
         
-        # Calculate Chikou Span (Lagging Span): Current closing price shifted backwards 26 periods
-        chikou_span = close.shift(-self.displacement)
-        
         return {
             'tenkan_sen': tenkan_sen,
             'kijun_sen': kijun_sen,
@@ -94,59 +204,124 @@ class IchimokuCloudStrategy(Strategy):
             return pd.DataFrame()
         
         # Ensure we have the required columns
-        required_columns = ['high', 'low', 'close']
-        for col in required_columns:
+        for col in self.required_columns():
             if col not in data.columns:
                 logger.error(f"Data missing '{col}' column required for Ichimoku Cloud calculation")
                 return pd.DataFrame()
         
         # Calculate Ichimoku components
-        ichimoku = self._calculate_ichimoku_components(data)
-        
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        
-        # Add Ichimoku components to signals DataFrame
-        for key, value in ichimoku.items():
-            signals[key] = value
+        columns = {key: value.to_numpy() for key, value in self._calculate_ichimoku_components(data).items()}
         
         # Add price data
-        signals['close'] = data['close']
+        columns['close'] = data['close'].to_numpy()
         
-        # Generate signals based on Ichimoku rules
-        signals['signal'] = 0
+        close = columns['close']
+        tenkan = columns['tenkan_sen']
+        kijun = columns['kijun_sen']
+        span_a = columns['senkou_span_a']
+        span_b = columns['senkou_span_b']
         
         # Buy signal conditions (multiple conditions for stronger signal):
-        # 1. Price crosses above the cloud (close > senkou_span_a and close > senkou_span_b)
-        # 2. Tenkan-sen crosses above Kijun-sen (bullish TK cross)
-        buy_condition_1 = (data['close'] > signals['senkou_span_a']) & (data['close'] > signals['senkou_span_b'])
-        buy_condition_2 = (signals['tenkan_sen'] > signals['kijun_sen']) & (signals['tenkan_sen'].shift(1) <= signals['kijun_sen'].shift(1))
+        # 1. Tenkan-sen crosses above Kijun-sen (bullish TK cross), compared
+        #    against the previous bar by slicing rather than shifted copies
+        # 2. Price crosses above the cloud (close > senkou_span_a and close > senkou_span_b)
+        buy = np.zeros(len(data), dtype=bool)
+        buy[1:] = (tenkan[1:] > kijun[1:]) & (tenkan[:-1] <= kijun[:-1])
+        buy |= (close > span_a) & (close > span_b)
         
         # Sell signal conditions:
-        # 1. Price crosses below the cloud (close < senkou_span_a and close < senkou_span_b)
-        # 2. Tenkan-sen crosses below Kijun-sen (bearish TK cross)
-        sell_condition_1 = (data['close'] < signals['senkou_span_a']) & (data['close'] < signals['senkou_span_b'])
-        sell_condition_2 = (signals['tenkan_sen'] < signals['kijun_sen']) & (signals['tenkan_sen'].shift(1) >= signals['kijun_sen'].shift(1))
+        # 1. Tenkan-sen crosses below Kijun-sen (bearish TK cross)
+        # 2. Price crosses below the cloud (close < senkou_span_a and close < senkou_span_b)
+        sell = np.zeros(len(data), dtype=bool)
+        sell[1:] = (tenkan[1:] < kijun[1:]) & (tenkan[:-1] >= kijun[:-1])
+        sell |= (close < span_a) & (close < span_b)
         
-        # Apply signals
-        signals.loc[buy_condition_1 | buy_condition_2, 'signal'] = 1
-        signals.loc[sell_condition_1 | sell_condition_2, 'signal'] = -1
+        # Sell takes precedence when both fire on the same bar
+        buy &= ~sell
+        columns['signal'] = buy.view(np.int8) - sell.view(np.int8)
         
         # Generate binary signal (1 for buy, 0 for sell/neutral)
-        signals['binary_signal'] = np.where(signals['signal'] > 0, 1, 0)
+        columns['binary_signal'] = buy.view(np.int8)
         
         # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+        columns['strategy'] = self._strategy_column(len(data))
+        columns['weight'] = self.weight
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame(columns, index=data.index, copy=False)
         
         # Store signals for later retrieval
         self.signals = signals
         
+        # Seed the live-update state from the end of the history
+        if self.displacement >= 0:
+            self._seed_incremental(data)
+        
         # Calculate performance metrics
         self._calculate_performance_metrics(data, signals)
         
         return signals
     
+    def _seed_incremental(self, data: pd.DataFrame) -> None:
+        """
+        Rebuild the incremental state by replaying the tail of the history.
+        
+        Only the bars that can still reach a window or a pending Senkou span
+        are replayed, so seeding does not grow with the history length.
+        
+        Args:
+            data: DataFrame containing market data (OHLCV)
+        """
+        tail = max(self.tenkan_period, self.kijun_period, self.senkou_b_period) + self.displacement + 1
+        state = self.incremental_state = IchimokuState()
+        # Only the lines carry over, so replay highs and lows without building
+        # per-bar dicts or signals; tolist() hands update() plain Python floats
+        highs = data['high'].to_numpy()[-tail:].tolist()
+        lows = data['low'].to_numpy()[-tail:].tolist()
+        for high, low in zip(highs, lows):
+            state.update(high, low, self.tenkan_period, self.kijun_period,
+                         self.senkou_b_period, self.displacement)
+    
+    def process_incremental(self, bar: Dict[str, float]) -> Dict[str, float]:
+        """
+        Update the Ichimoku lines and signal with one new bar in O(1).
+        
+        Continues from the history of the last process_data call, or from an
+        empty history if there was none.
+        
+        Args:
+            bar: Mapping with the bar's 'high', 'low' and 'close' prices
+            
+        Returns:
+            Dictionary with the Ichimoku lines, signal and binary signal at the new bar
+        """
+        if self.displacement < 0:
+            raise ValueError("Incremental Ichimoku updates require a non-negative displacement")
+        if self.incremental_state is None:
+            self.incremental_state = IchimokuState()
+        state = self.incremental_state
+        
+        prev_tenkan, prev_kijun = state.tenkan_sen, state.kijun_sen
+        tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b = state.update(
+            bar['high'], bar['low'], self.tenkan_period, self.kijun_period,
+            self.senkou_b_period, self.displacement
+        )
+        close = bar['close']
+        
+        # Same rules as process_data: TK cross or price beyond the cloud, sell first
+        buy = (tenkan_sen > kijun_sen and prev_tenkan <= prev_kijun) or (close > senkou_span_a and close > senkou_span_b)
+        sell = (tenkan_sen < kijun_sen and prev_tenkan >= prev_kijun) or (close < senkou_span_a and close < senkou_span_b)
+        signal = -1 if sell else (1 if buy else 0)
+        
+        return {
+            'tenkan_sen': tenkan_sen,
+            'kijun_sen': kijun_sen,
+            'senkou_span_a': senkou_span_a,
+            'senkou_span_b': senkou_span_b,
+            'signal': signal,
+            'binary_signal': int(signal > 0)
+        }
+    
     def _calculate_performance_metrics(self, data: pd.DataFrame, signals: pd.DataFrame) -> None:
         """
         Calculate performance metrics for the strategy.
@@ -162,15 +337,16 @@ class IchimokuCloudStrategy(Strategy):
             return
         
         # Calculate metrics only on valid signals (after warmup period)
-        valid_signals = signals.iloc[min_periods:].copy()
+        signal = signals['signal'].to_numpy()[min_periods:]
+        binary_signal = signals['binary_signal'].to_numpy()[min_periods:]
         
         # Count number of buy and sell signals
-        buy_signals = (valid_signals['signal'] == 1).sum()
-        sell_signals = (valid_signals['signal'] == -1).sum()
+        buy_signals = np.count_nonzero(signal == 1)
+        sell_signals = np.count_nonzero(signal == -1)
         
         # Calculate percentage of time in market
-        total_periods = len(valid_signals)
-        in_market_periods = (valid_signals['binary_signal'] == 1).sum()
+        total_periods = len(signal)
+        in_market_periods = np.count_nonzero(binary_signal == 1)
         market_participation = (in_market_periods / total_periods) * 100 if total_periods > 0 else 0
         
         # Store metrics in metadata
@@ -182,6 +358,15 @@ class IchimokuCloudStrategy(Strategy):
             "market_participation": float(market_participation)
         })
     
+    def required_columns(self) -> Tuple[str, ...]:
+        """
+        Get the market data columns process_data reads.
+        
+        Returns:
+            Tuple of column names
+        """
+        return ('high', 'low', 'close')
+    
     def get_signal_type(self) -> str:
         """
         Get the type of signals this strategy generates.
@@ -7,6 +7,8 @@ import logging
 from typing import Dict, Any, List, Union, Optional
 
 from strategies.strategy_interface import Strategy
+from strategies._macd_kernel import macd, macd_batch
+from utils.jit import NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -52,29 +54,34 @@ class MACDStrategy(Strategy):
             logger.error("Data missing 'close' column required for MACD calculation")
             return pd.DataFrame()
         
-        # Calculate MACD components
-        exp1 = data['close'].ewm(span=self.fast_period, adjust=False).mean()
-        exp2 = data['close'].ewm(span=self.slow_period, adjust=False).mean()
-        macd_line = exp1 - exp2
-        signal_line = macd_line.ewm(span=self.signal_period, adjust=False).mean()
-        histogram = macd_line - signal_line
-        
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals['macd_line'] = macd_line
-        signals['signal_line'] = signal_line
-        signals['histogram'] = histogram
+        # Calculate MACD components as plain arrays
+        if NUMBA_AVAILABLE:
+            close = np.ascontiguousarray(data['close'].to_numpy(), dtype=np.float64)
+            macd_line, signal_line, histogram = macd(
+                close, int(self.fast_period), int(self.slow_period), int(self.signal_period)
+            )
+        else:
+            exp1 = data['close'].ewm(span=self.fast_period, adjust=False).mean()
+            exp2 = data['close'].ewm(span=self.slow_period, adjust=False).mean()
+            macd_line = np.subtract(exp1.to_numpy(), exp2.to_numpy())
+            signal_line = pd.Series(macd_line).ewm(span=self.signal_period, adjust=False).mean().to_numpy()
+            histogram = np.subtract(macd_line, signal_line)
         
         # Generate signal: 1 when MACD line crosses above signal line, -1 when crosses below
-        signals['signal'] = 0
-        signals['signal'] = np.where(macd_line > signal_line, 1, -1)
-        
-        # Generate binary signal (1 for buy, 0 for sell/neutral)
-        signals['binary_signal'] = np.where(signals['signal'] > 0, 1, 0)
-        
-        # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+        signal = np.where(macd_line > signal_line, np.int8(1), np.int8(-1))
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame({
+            'macd_line': macd_line,
+            'signal_line': signal_line,
+            'histogram': histogram,
+            'signal': signal,
+            # Generate binary signal (1 for buy, 0 for sell/neutral)
+            'binary_signal': (signal > 0).astype(np.int8),
+            # Strategy metadata
+            'strategy': self._strategy_column(len(data)),
+            'weight': self.weight
+        }, index=data.index, copy=False)
         
         # Store signals for later retrieval
         self.signals = signals
@@ -84,6 +91,25 @@ class MACDStrategy(Strategy):
         
         return signals
     
+    def process_batch(self, closes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Generate MACD signals for many symbols in one compiled call.
+        
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+            
+        Returns:
+            DataFrame of int8 signals with the same index and columns
+        """
+        if not NUMBA_AVAILABLE:
+            return super().process_batch(closes)
+        
+        macd_lines, signal_lines = macd_batch(
+            self._batch_closes(closes), int(self.fast_period), int(self.slow_period), int(self.signal_period)
+        )
+        signals = np.where(macd_lines > signal_lines, np.int8(1), np.int8(-1))
+        return pd.DataFrame(signals.T, index=closes.index, columns=closes.columns)
+    
     def _calculate_performance_metrics(self, data: pd.DataFrame, signals: pd.DataFrame) -> None:
         """
         Calculate performance metrics for the strategy.
@@ -98,10 +124,11 @@ class MACDStrategy(Strategy):
             return
         
         # Calculate signal changes (to identify entry/exit points)
-        signal_changes = signals['signal'].diff().fillna(0)
+        signal = signals['signal'].to_numpy()
+        signal_changes = np.count_nonzero(signal[1:] != signal[:-1])
         
         # Count number of trades
-        num_trades = (signal_changes != 0).sum() // 2  # Divide by 2 because each trade has entry and exit
+        num_trades = signal_changes // 2  # Divide by 2 because each trade has entry and exit
         
         # Store metadata
         self.metadata.update({
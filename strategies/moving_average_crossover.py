@@ -7,6 +7,8 @@ import logging
 from typing import Dict, Any, List, Union, Optional
 
 from strategies.strategy_interface import Strategy
+from strategies._ma_kernel import ma_crossover_batch, ma_crossover_diff
+from utils.jit import NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -52,25 +54,33 @@ class MovingAverageCrossover(Strategy):
             logger.error("Data missing 'close' column required for MA calculation")
             return pd.DataFrame()
         
-        # Calculate moving averages
-        fast_ma = data['close'].rolling(window=self.fast_period).mean()
-        slow_ma = data['close'].rolling(window=self.slow_period).mean()
-        
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        
-        # Calculate the difference between fast and slow MAs
-        signals['ma_diff'] = fast_ma - slow_ma
-        
-        # Generate signal: 1 when fast MA > slow MA, -1 when fast MA < slow MA
-        signals['signal'] = np.where(signals['ma_diff'] > self.signal_threshold, 1, -1)
-        
-        # Generate binary signal (1 for buy, 0 for sell/neutral)
-        signals['binary_signal'] = np.where(signals['signal'] > 0, 1, 0)
-        
-        # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+        if NUMBA_AVAILABLE:
+            # Both moving averages as running sums in one compiled pass
+            close = np.ascontiguousarray(data['close'].to_numpy(), dtype=np.float64)
+            ma_diff, signal = ma_crossover_diff(
+                close, int(self.fast_period), int(self.slow_period), float(self.signal_threshold)
+            )
+        else:
+            # Calculate moving averages
+            fast_ma = data['close'].rolling(window=self.fast_period).mean()
+            slow_ma = data['close'].rolling(window=self.slow_period).mean()
+            
+            # Calculate the difference between fast and slow MAs
+            ma_diff = (fast_ma - slow_ma).to_numpy()
+            
+            # Generate signal: 1 when fast MA > slow MA, -1 when fast MA < slow MA
+            signal = np.where(ma_diff > self.signal_threshold, np.int8(1), np.int8(-1))
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame({
+            'ma_diff': ma_diff,
+            'signal': signal,
+            # Generate binary signal (1 for buy, 0 for sell/neutral)
+            'binary_signal': (signal > 0).astype(np.int8),
+            # Strategy metadata
+            'strategy': self._strategy_column(len(data)),
+            'weight': self.weight
+        }, index=data.index, copy=False)
         
         # Store signals for later retrieval
         self.signals = signals
@@ -80,6 +90,24 @@ class MovingAverageCrossover(Strategy):
         
         return signals
     
+    def process_batch(self, closes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Generate crossover signals for many symbols in one compiled call.
+        
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+            
+        Returns:
+            DataFrame of int8 signals with the same index and columns
+        """
+        if not NUMBA_AVAILABLE:
+            return super().process_batch(closes)
+        
+        signals = ma_crossover_batch(
+            self._batch_closes(closes), int(self.fast_period), int(self.slow_period), float(self.signal_threshold)
+        )
+        return pd.DataFrame(signals.T, index=closes.index, columns=closes.columns)
+    
     def _calculate_performance_metrics(self, data: pd.DataFrame, signals: pd.DataFrame) -> None:
         """
         Calculate performance metrics for the strategy.
@@ -94,10 +122,11 @@ class MovingAverageCrossover(Strategy):
             return
         
         # Calculate signal changes (to identify entry/exit points)
-        signal_changes = signals['signal'].diff().fillna(0)
+        signal = signals['signal'].to_numpy()
+        signal_changes = np.count_nonzero(signal[1:] != signal[:-1])
         
         # Count number of trades
-        num_trades = (signal_changes != 0).sum() // 2  # Divide by 2 because each trade has entry and exit
+        num_trades = signal_changes // 2  # Divide by 2 because each trade has entry and exit
         
         # Store metadata
         self.metadata.update({
@@ -7,6 +7,8 @@ import logging
 from typing import Dict, Any, List, Union, Optional
 
 from strategies.strategy_interface import Strategy
+from strategies._rsi_kernel import rsi as rsi_kernel, rsi_batch
+from utils.jit import NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -52,32 +54,46 @@ class RSIStrategy(Strategy):
             logger.error("Data missing 'close' column required for RSI calculation")
             return pd.DataFrame()
         
-        # Calculate RSI
-        delta = data['close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        avg_gain = gain.rolling(window=self.period).mean()
-        avg_loss = loss.rolling(window=self.period).mean()
-        
-        rs = avg_gain / avg_loss.where(avg_loss != 0, 1e-10)  # Avoid division by zero
-        rsi = 100 - (100 / (1 + rs))
+        # Float32 prices (the data source 'dtype' option) give a float32 RSI
+        rsi_dtype = np.float32 if data['close'].dtype == np.float32 else np.float64
         
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals['rsi'] = rsi
+        # Calculate RSI
+        if NUMBA_AVAILABLE:
+            close = np.ascontiguousarray(data['close'].to_numpy(), dtype=rsi_dtype)
+            rsi = rsi_kernel(close, int(self.period))
+        else:
+            close = np.ascontiguousarray(data['close'].to_numpy(dtype=np.float64))
+            delta = np.empty_like(close)
+            delta[:1] = 0.0
+            np.subtract(close[1:], close[:-1], out=delta[1:])
+            # Branchless split; fmax maps NaN deltas to 0 like Series.where did
+            gain = pd.Series(np.fmax(delta, 0.0), index=data.index)
+            loss = pd.Series(np.fmax(-delta, 0.0), index=data.index)
+            
+            avg_gain = gain.rolling(window=self.period).mean().to_numpy()
+            avg_loss = loss.rolling(window=self.period).mean().to_numpy()
+            
+            # Avoid division by zero; the guarded buffer then holds rs and the RSI in place
+            rsi = np.where(avg_loss != 0, avg_loss, 1e-10)
+            np.divide(avg_gain, rsi, out=rsi)
+            rsi += 1
+            np.divide(100, rsi, out=rsi)
+            np.subtract(100, rsi, out=rsi)
+            rsi = rsi.astype(rsi_dtype, copy=False)
         
         # Generate signal: 1 for oversold (buy), -1 for overbought (sell), 0 for neutral
-        signals['signal'] = 0
-        signals.loc[rsi < self.oversold, 'signal'] = 1
-        signals.loc[rsi > self.overbought, 'signal'] = -1
-        
-        # Generate binary signal (1 for buy, 0 for sell/neutral)
-        signals['binary_signal'] = np.where(signals['signal'] > 0, 1, 0)
-        
-        # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+        signal = self._threshold_signal(rsi)
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame({
+            'rsi': rsi,
+            'signal': signal,
+            # Generate binary signal (1 for buy, 0 for sell/neutral)
+            'binary_signal': (signal > 0).astype(np.int8),
+            # Strategy metadata
+            'strategy': self._strategy_column(len(data)),
+            'weight': self.weight
+        }, index=data.index, copy=False)
         
         # Store signals for later retrieval
         self.signals = signals
@@ -87,6 +103,37 @@ class RSIStrategy(Strategy):
         
         return signals
     
+    def process_batch(self, closes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Generate RSI signals for many symbols in one compiled call.
+        
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+            
+        Returns:
+            DataFrame of int8 signals with the same index and columns
+        """
+        if not NUMBA_AVAILABLE:
+            return super().process_batch(closes)
+        
+        rsi = rsi_batch(self._batch_closes(closes), int(self.period))
+        return pd.DataFrame(self._threshold_signal(rsi).T, index=closes.index, columns=closes.columns)
+    
+    def _threshold_signal(self, rsi: np.ndarray) -> np.ndarray:
+        """
+        Map RSI values to signals: 1 when oversold, -1 when overbought, else 0.
+        
+        Args:
+            rsi: Array of RSI values
+            
+        Returns:
+            int8 array of signals with the same shape
+        """
+        signal = np.zeros(rsi.shape, dtype=np.int8)
+        signal[rsi < self.oversold] = 1
+        signal[rsi > self.overbought] = -1
+        return signal
+    
     def _calculate_performance_metrics(self, data: pd.DataFrame, signals: pd.DataFrame) -> None:
         """
         Calculate performance metrics for the strategy.
@@ -101,10 +148,11 @@ class RSIStrategy(Strategy):
             return
         
         # Calculate signal changes (to identify entry/exit points)
-        signal_changes = signals['signal'].diff().fillna(0)
+        signal = signals['signal'].to_numpy()
+        signal_changes = np.count_nonzero(signal[1:] != signal[:-1])
         
         # Count number of trades
-        num_trades = (signal_changes != 0).sum()
+        num_trades = signal_changes
         
         # Store metadata
         self.metadata.update({
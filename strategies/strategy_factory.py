@@ -3,13 +3,43 @@
 
 import importlib
 import logging
-from typing import Dict, Any, Optional, Type
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Type
+
+import pandas as pd
 
 from strategies.strategy_interface import Strategy
 from strategies.strategy_template import IndicatorBasedTemplate, PatternRecognitionTemplate, VolumeBasedTemplate
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _load_registry() -> Dict[str, Type[Strategy]]:
+    """
+    Import the built-in strategy classes once.
+    
+    Returns:
+        Dictionary mapping display names to strategy classes
+    """
+    from strategies.moving_average_crossover import MovingAverageCrossover
+    from strategies.macd_strategy import MACDStrategy
+    from strategies.rsi_strategy import RSIStrategy
+    from strategies.bollinger_bands_strategy import BollingerBandsStrategy
+    from strategies.ichimoku_cloud_strategy import IchimokuCloudStrategy
+    from strategies.volume_profile_strategy import VolumeProfileStrategy
+    from strategies.fibonacci_retracement_strategy import FibonacciRetracementStrategy
+    
+    return {
+        "Moving Average Crossover": MovingAverageCrossover,
+        "MACD": MACDStrategy,
+        "RSI": RSIStrategy,
+        "Bollinger Bands": BollingerBandsStrategy,
+        "Ichimoku Cloud": IchimokuCloudStrategy,
+        "Volume Profile": VolumeProfileStrategy,
+        "Fibonacci Retracement": FibonacciRetracementStrategy
+    }
+
 class StrategyFactory:
     """
     Factory class for creating strategy instances.
@@ -18,11 +48,16 @@ class StrategyFactory:
     strategy classes based on their name and parameters.
     """
     
-    def __init__(self):
+    def __init__(self, executor: Optional[Executor] = None):
         """
         Initialize the strategy factory.
+        
+        Args:
+            executor: Optional executor used by run_all; a temporary thread
+                pool is used when omitted
         """
         self.registered_strategies = {}
+        self.executor = executor
     
     def register_strategy(self, strategy_name: str, strategy_class: Type[Strategy]) -> None:
         """
@@ -49,6 +84,10 @@ class StrategyFactory:
         Returns:
             A new strategy instance or None if creation failed
         """
+        # Built-in strategies are resolved without going through importlib
+        if strategy_name not in self.registered_strategies and strategy_name in _load_registry():
+            self.register_strategy(strategy_name, _load_registry()[strategy_name])
+        
         # Check if strategy is already registered
         if strategy_name in self.registered_strategies:
             try:
@@ -83,27 +122,43 @@ class StrategyFactory:
         
         return None
         
+    def run_all(self, strategies: List[Strategy], data: pd.DataFrame) -> List[pd.DataFrame]:
+        """
+        Run process_data for several strategies concurrently on the same data.
+        
+        The compiled strategy kernels release the GIL, so threads overlap
+        their numerical work; only the pandas wrapping is serialized. The
+        kernels behind process_data are serial (not parallel=True), so they
+        are safe to call from several threads under any Numba threading
+        layer. The parallel batch kernels behind process_batch are not: under
+        Numba's default workqueue layer, concurrent launches abort the
+        process, so only call process_batch from several threads with the
+        TBB layer installed (see requirements.txt).
+        
+        Args:
+            strategies: Strategy instances to run
+            data: DataFrame containing market data (OHLCV)
+            
+        Returns:
+            List of signal DataFrames in the order of strategies
+        """
+        if not strategies:
+            return []
+        
+        if self.executor is not None:
+            futures = [self.executor.submit(strategy.process_data, data) for strategy in strategies]
+            return [future.result() for future in futures]
+        
+        with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            futures = [executor.submit(strategy.process_data, data) for strategy in strategies]
+            return [future.result() for future in futures]
+    
     def load_all_strategies(self) -> None:
         """
         Load all available strategy classes.
         """
-        # Import strategy modules
-        from strategies.moving_average_crossover import MovingAverageCrossover
-        from strategies.macd_strategy import MACDStrategy
-        from strategies.rsi_strategy import RSIStrategy
-        from strategies.bollinger_bands_strategy import BollingerBandsStrategy
-        from strategies.ichimoku_cloud_strategy import IchimokuCloudStrategy
-        from strategies.volume_profile_strategy import VolumeProfileStrategy
-        from strategies.fibonacci_retracement_strategy import FibonacciRetracementStrategy
-        
-        # Register strategies
-        self.register_strategy("Moving Average Crossover", MovingAverageCrossover)
-        self.register_strategy("MACD", MACDStrategy)
-        self.register_strategy("RSI", RSIStrategy)
-        self.register_strategy("Bollinger Bands", BollingerBandsStrategy)
-        self.register_strategy("Ichimoku Cloud", IchimokuCloudStrategy)
-        self.register_strategy("Volume Profile", VolumeProfileStrategy)
-        self.register_strategy("Fibonacci Retracement", FibonacciRetracementStrategy)
+        for strategy_name, strategy_class in _load_registry().items():
+            self.register_strategy(strategy_name, strategy_class)
         
         logger.info("Loaded all available strategies")
         
@@ -114,27 +169,21 @@ class StrategyFactory:
         Returns:
             Dictionary of strategy templates
         """
-        # Import strategy classes
-        from strategies.moving_average_crossover import MovingAverageCrossover
-        from strategies.macd_strategy import MACDStrategy
-        from strategies.rsi_strategy import RSIStrategy
-        from strategies.bollinger_bands_strategy import BollingerBandsStrategy
-        from strategies.volume_profile_strategy import VolumeProfileStrategy
-        from strategies.fibonacci_retracement_strategy import FibonacciRetracementStrategy
+        registry = _load_registry()
         
         # Create templates
         templates = {
-            "Indicator Based": IndicatorBasedTemplate(MovingAverageCrossover, {
+            "Indicator Based": IndicatorBasedTemplate(registry["Moving Average Crossover"], {
                 "fast_period": 20,
                 "slow_period": 50,
                 "signal_threshold": 0.0
             }),
-            "Volume Based": VolumeBasedTemplate(VolumeProfileStrategy, {
+            "Volume Based": VolumeBasedTemplate(registry["Volume Profile"], {
                 "num_bins": 20,
                 "lookback_period": 100,
                 "volume_threshold": 0.8
             }),
-            "Pattern Recognition": PatternRecognitionTemplate(FibonacciRetracementStrategy, {
+            "Pattern Recognition": PatternRecognitionTemplate(registry["Fibonacci Retracement"], {
                 "trend_period": 50,
                 "swing_lookback": 20,
                 "retracement_levels": [0.236, 0.382, 0.5, 0.618, 0.786]
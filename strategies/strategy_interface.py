@@ -2,8 +2,9 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, List, Union, Optional, Tuple
 
 from config.config_loader import get_strategy_defaults
 
@@ -93,19 +94,26 @@ class Strategy(ABC):
             data: Original market data
             signals: Generated signals
         """
-        from reports.performance_metrics import (
-            calculate_sharpe_ratio,
-            calculate_sortino_ratio,
-            calculate_max_drawdown,
-            calculate_profit_factor,
-        )
+        from reports.performance_metrics import calculate_all_metrics
 
         returns = data['close'].pct_change().dropna()
 
-        self.metadata['sharpe_ratio'] = calculate_sharpe_ratio(returns)
-        self.metadata['sortino_ratio'] = calculate_sortino_ratio(returns)
-        self.metadata['max_drawdown'] = calculate_max_drawdown(returns)
-        self.metadata['profit_factor'] = calculate_profit_factor(returns)
+        self.metadata.update(calculate_all_metrics(returns))
+    
+    def _strategy_column(self, length: int) -> pd.Categorical:
+        """
+        Build the constant 'strategy' signals column.
+        
+        A single-category Categorical stores one int8 code per row instead
+        of a Python string object per row.
+        
+        Args:
+            length: Number of rows in the signals DataFrame
+            
+        Returns:
+            Categorical holding the strategy name in every row
+        """
+        return pd.Categorical.from_codes(np.zeros(length, dtype=np.int8), categories=[self.name])
     
     @abstractmethod
     def process_data(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -120,6 +128,61 @@ class Strategy(ABC):
         """
         pass
     
+    def required_columns(self) -> Tuple[str, ...]:
+        """
+        Get the market data columns process_data reads.
+        
+        Returns:
+            Tuple of column names
+        """
+        return ('close',)
+    
+    def process_batch(self, closes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Generate signals for many symbols from a wide frame of close prices.
+        
+        The default runs process_data once per column, which leaves the last
+        symbol's signals and metadata on the strategy. Strategies with a
+        table-wise kernel override this to process all columns in one call.
+        
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+            
+        Returns:
+            DataFrame of int8 signals with the same index and columns
+            
+        Raises:
+            ValueError: If the strategy needs columns other than close, or
+                produces no signals for a symbol
+        """
+        missing = [column for column in self.required_columns() if column != 'close']
+        if missing:
+            raise ValueError(
+                f"{self.__class__.__name__} needs {', '.join(missing)} in addition to close prices "
+                f"and cannot run on a close-only batch; call process_data per symbol instead"
+            )
+        
+        signals = {}
+        for symbol in closes.columns:
+            result = self.process_data(closes[[symbol]].set_axis(['close'], axis=1))
+            if 'signal' not in result.columns:
+                raise ValueError(f"{self.__class__.__name__} produced no signals for symbol {symbol}")
+            signals[symbol] = result['signal']
+        return pd.DataFrame(signals, index=closes.index, columns=closes.columns)
+    
+    @staticmethod
+    def _batch_closes(closes: pd.DataFrame) -> np.ndarray:
+        """
+        Lay out a wide close-price frame for the batch kernels.
+        
+        Args:
+            closes: DataFrame of close prices, one column per symbol
+            
+        Returns:
+            C-contiguous float64 array of shape (symbols, bars)
+        """
+        return np.ascontiguousarray(closes.to_numpy(dtype=np.float64).T)
+    
     @abstractmethod
     def get_signal_type(self) -> str:
         """
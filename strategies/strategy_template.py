@@ -1,16 +1,33 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
 import pandas as pd
 import numpy as np
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Union, Optional, Type
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from strategies.strategy_interface import Strategy
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _strategy_prototype(strategy_class: Type[Strategy], name: str, params_key: tuple) -> Strategy:
+    """
+    Build (once) the prototype strategy for a class, name and parameter set.
+    
+    Args:
+        strategy_class: The strategy class to instantiate
+        name: The name of the strategy
+        params_key: Sorted tuple of the merged (parameter, value) pairs
+        
+    Returns:
+        The shared prototype instance; callers must copy it
+    """
+    return strategy_class(name, dict(params_key))
+
 class StrategyTemplate(ABC):
     """
     Abstract base class for strategy templates.
@@ -19,11 +36,16 @@ class StrategyTemplate(ABC):
     by implementing common patterns and reducing boilerplate code.
     """
     
-    @abstractmethod
+    # Empty so that subclasses can declare slots without regaining a __dict__
+    __slots__ = ()
+    
     def create_strategy(self, name: str, parameters: Dict[str, Any] = None) -> Strategy:
         """
         Create a new strategy instance based on this template.
         
+        Subclasses set strategy_class and default_parameters; the provided
+        parameters override the template defaults.
+        
         Args:
             name: The name of the strategy
             parameters: Dictionary of strategy-specific parameters
@@ -31,7 +53,40 @@ class StrategyTemplate(ABC):
         Returns:
             A new strategy instance
         """
-        pass
+        # Merge default parameters with provided parameters
+        merged_parameters = self.default_parameters.copy()
+        if parameters:
+            merged_parameters.update(parameters)
+        
+        # Create and return the strategy instance
+        return self._instantiate(name, merged_parameters)
+    
+    def _instantiate(self, name: str, parameters: Dict[str, Any]) -> Strategy:
+        """
+        Create a strategy from merged parameters, reusing a cached prototype.
+        
+        Repeated requests for the same class, name and parameters copy a shared
+        prototype instead of running the strategy's __init__ again. Each copy
+        gets its own parameters and metadata dicts. Parameter values must be
+        hashable to be cached; anything else (e.g. a list of levels) falls back
+        to a fresh instance.
+        
+        Args:
+            name: The name of the strategy
+            parameters: Merged strategy parameters
+            
+        Returns:
+            A new strategy instance
+        """
+        try:
+            prototype = _strategy_prototype(self.strategy_class, name, tuple(sorted(parameters.items())))
+        except TypeError:
+            return self.strategy_class(name, parameters)
+        
+        strategy = copy.copy(prototype)
+        strategy.parameters = dict(prototype.parameters)
+        strategy.metadata = {}
+        return strategy
 
 
 class IndicatorBasedTemplate(StrategyTemplate):
@@ -42,6 +97,8 @@ class IndicatorBasedTemplate(StrategyTemplate):
     based on technical indicators crossing thresholds.
     """
     
+    __slots__ = ('strategy_class', 'default_parameters')
+    
     def __init__(self, strategy_class: Type[Strategy], default_parameters: Dict[str, Any] = None):
         """
         Initialize the indicator-based template.
@@ -52,25 +109,6 @@ class IndicatorBasedTemplate(StrategyTemplate):
         """
         self.strategy_class = strategy_class
         self.default_parameters = default_parameters or {}
-    
-    def create_strategy(self, name: str, parameters: Dict[str, Any] = None) -> Strategy:
-        """
-        Create a new indicator-based strategy instance.
-        
-        Args:
-            name: The name of the strategy
-            parameters: Dictionary of strategy-specific parameters
-            
-        Returns:
-            A new strategy instance
-        """
-        # Merge default parameters with provided parameters
-        merged_parameters = self.default_parameters.copy()
-        if parameters:
-            merged_parameters.update(parameters)
-        
-        # Create and return the strategy instance
-        return self.strategy_class(name, merged_parameters)
 
 
 class PatternRecognitionTemplate(StrategyTemplate):
@@ -81,6 +119,8 @@ class PatternRecognitionTemplate(StrategyTemplate):
     based on chart patterns like head and shoulders, triangles, etc.
     """
     
+    __slots__ = ('strategy_class', 'default_parameters')
+    
     def __init__(self, strategy_class: Type[Strategy], default_parameters: Dict[str, Any] = None):
         """
         Initialize the pattern recognition template.
@@ -95,25 +135,6 @@ class PatternRecognitionTemplate(StrategyTemplate):
             "confirmation_threshold": 0.7,
             "signal_threshold": 0.0
         }
-    
-    def create_strategy(self, name: str, parameters: Dict[str, Any] = None) -> Strategy:
-        """
-        Create a new pattern recognition strategy instance.
-        
-        Args:
-            name: The name of the strategy
-            parameters: Dictionary of strategy-specific parameters
-            
-        Returns:
-            A new strategy instance
-        """
-        # Merge default parameters with provided parameters
-        merged_parameters = self.default_parameters.copy()
-        if parameters:
-            merged_parameters.update(parameters)
-        
-        # Create and return the strategy instance
-        return self.strategy_class(name, merged_parameters)
 
 
 class VolumeBasedTemplate(StrategyTemplate):
@@ -124,6 +145,8 @@ class VolumeBasedTemplate(StrategyTemplate):
     based on volume patterns and price-volume relationships.
     """
     
+    __slots__ = ('strategy_class', 'default_parameters')
+    
     def __init__(self, strategy_class: Type[Strategy], default_parameters: Dict[str, Any] = None):
         """
         Initialize the volume-based template.
@@ -138,22 +161,3 @@ class VolumeBasedTemplate(StrategyTemplate):
             "volume_threshold": 1.5,
             "price_threshold": 0.0
         }
-    
-    def create_strategy(self, name: str, parameters: Dict[str, Any] = None) -> Strategy:
-        """
-        Create a new volume-based strategy instance.
-        
-        Args:
-            name: The name of the strategy
-            parameters: Dictionary of strategy-specific parameters
-            
-        Returns:
-            A new strategy instance
-        """
-        # Merge default parameters with provided parameters
-        merged_parameters = self.default_parameters.copy()
-        if parameters:
-            merged_parameters.update(parameters)
-        
-        # Create and return the strategy instance
-        return self.strategy_class(name, merged_parameters)
\ No newline at end of file
@@ -4,12 +4,294 @@
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, Any, List, Union, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, Any, List, Tuple, Union, Optional
 
+from strategies._rolling_kernels import push_extreme
 from strategies.strategy_interface import Strategy
+from utils.jit import njit, signatures, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
+# Trailing windows histogrammed per vectorized block
+WINDOW_BLOCK_SIZE = 4096
+
+# Fallbacks for parameters missing from both the given parameters and the config defaults
+DEFAULT_PARAMETERS = {
+    "num_bins": 20,
+    "lookback_period": 100,
+    "volume_threshold": 0.8,
+    "signal_lookback": 5
+}
+
+@njit(cache=True)
+def _block_sum(values, start, count):
+    """Unrolled sum of at most 128 values, in np.sum's order."""
+    if count < 8:
+        total = -0.0
+        for i in range(start, start + count):
+            total += values[i]
+        return total
+    r0 = values[start]
+    r1 = values[start + 1]
+    r2 = values[start + 2]
+    r3 = values[start + 3]
+    r4 = values[start + 4]
+    r5 = values[start + 5]
+    r6 = values[start + 6]
+    r7 = values[start + 7]
+    blocked = count - count % 8
+    for i in range(start + 8, start + blocked, 8):
+        r0 += values[i]
+        r1 += values[i + 1]
+        r2 += values[i + 2]
+        r3 += values[i + 3]
+        r4 += values[i + 4]
+        r5 += values[i + 5]
+        r6 += values[i + 6]
+        r7 += values[i + 7]
+    total = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+    for i in range(start + blocked, start + count):
+        total += values[i]
+    return total
+
+@njit(cache=True)
+def _pairwise_sum(values):
+    """
+    Sum values in the same pairwise order as np.sum, so totals match bit for bit.
+    
+    NumPy halves the array until blocks hold at most 128 values. The halving
+    tree is walked without recursion (which numba cannot cache): blocks are
+    summed left to right and a partial sum is merged with its sibling as soon
+    as both halves are done.
+    """
+    n = values.shape[0]
+    if n <= 128:
+        return _block_sum(values, 0, n)
+    # Pending (start, count, depth) ranges, and finished partial sums by depth
+    starts = np.empty(64, dtype=np.int64)
+    counts = np.empty(64, dtype=np.int64)
+    depths = np.empty(64, dtype=np.int64)
+    partials = np.empty(64)
+    partial_depths = np.empty(64, dtype=np.int64)
+    starts[0], counts[0], depths[0] = 0, n, 0
+    pending = 1
+    done = 0
+    while pending > 0:
+        pending -= 1
+        start, count, depth = starts[pending], counts[pending], depths[pending]
+        if count > 128:
+            half = count // 2
+            half -= half % 8
+            # Right half goes on first so the left half is summed first
+            starts[pending], counts[pending], depths[pending] = start + half, count - half, depth + 1
+            starts[pending + 1], counts[pending + 1], depths[pending + 1] = start, half, depth + 1
+            pending += 2
+            continue
+        total = _block_sum(values, start, count)
+        while done > 0 and partial_depths[done - 1] == depth:
+            done -= 1
+            total = partials[done] + total
+            depth -= 1
+        partials[done] = total
+        partial_depths[done] = depth
+        done += 1
+    return partials[0]
+
+@njit(cache=True)
+def _select(values, k):
+    """Move the k-th smallest of NaN-free values to values[k] in place (quickselect)."""
+    lo = 0
+    hi = values.shape[0] - 1
+    while lo < hi:
+        pivot = values[(lo + hi) // 2]
+        i = lo
+        j = hi
+        while i <= j:
+            while values[i] < pivot:
+                i += 1
+            while values[j] > pivot:
+                j -= 1
+            if i <= j:
+                values[i], values[j] = values[j], values[i]
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j
+        elif k >= i:
+            lo = i
+        else:
+            break
+    return values[k]
+
+@njit(cache=True)
+def _linear_percentile(values, quantile):
+    """
+    np.percentile's default linear interpolation, by selection instead of a sort.
+    
+    values is used as scratch space and left partially reordered.
+    """
+    n = values.shape[0]
+    for i in range(n):
+        if values[i] != values[i]:
+            return np.nan
+    virtual = (n - 1) * quantile
+    if virtual >= n - 1:
+        return _select(values, n - 1)
+    if virtual < 0:
+        return _select(values, 0)
+    previous = int(np.floor(virtual))
+    gamma = virtual - previous
+    below = _select(values, previous)
+    # Selection leaves only values >= below after it; the next order statistic is their minimum
+    above = values[previous + 1]
+    for i in range(previous + 2, n):
+        if values[i] < above:
+            above = values[i]
+    diff = above - below
+    if gamma >= 0.5:
+        return above - diff * (1 - gamma)
+    return below + diff * gamma
+
+@njit(cache=True)
+def _price_bin(price, bins, num_bins):
+    """Bin of price as np.digitize would place it, clipped to the profile; NaN goes last."""
+    last = num_bins - 1
+    scaled = (price - bins[0]) / (bins[num_bins] - bins[0]) * num_bins
+    if scaled != scaled:
+        return last
+    b = int(min(max(np.floor(scaled), 0.0), last))
+    # One comparison against the actual edges absorbs rounding at bin boundaries
+    if b > 0 and price < bins[b]:
+        b -= 1
+    if b < last and price >= bins[b + 1]:
+        b += 1
+    return b
+
+@njit(signatures("i1[::1](f8[::1], f8[::1], f8[::1], f8[::1], i8, i8, f8, i8)"), nogil=True, cache=True)
+def _vp_kernel(high, low, close, volume, lookback, num_bins, quantile, signal_lookback):
+    """
+    Score every bar against the volume profile of its trailing window.
+    
+    Compiled counterpart of VolumeProfileStrategy._find_hvn_signals. The
+    window's low and high are tracked with monotonic deques, and while they
+    stay put the bins do too, so the profile is rolled forward by removing
+    the bar that left and adding the one that entered. It is rebuilt from
+    scratch only when an extreme changes. A bin whose last bar leaves is reset
+    to exactly zero so removals leave no rounding residue in empty bins.
+    Totals and percentiles follow NumPy's own evaluation order. No fastmath:
+    the NaN checks must survive compilation.
+    
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes
+        lookback: Bars in each trailing window
+        num_bins: Price bins per profile
+        quantile: HVN threshold as a fraction in [0, 1]
+        signal_lookback: Bars back used to tell rising from falling prices
+        
+    Returns:
+        int8 signal array (1 buy, -1 sell, 0 hold)
+    """
+    n = close.shape[0]
+    signal = np.zeros(n, dtype=np.int8)
+    bins = np.empty(num_bins + 1)
+    midpoints = np.empty(num_bins)
+    profile = np.empty(num_bins)
+    members = np.empty(num_bins, dtype=np.int64)
+    shares = np.empty(num_bins)
+    scratch = np.empty(num_bins)
+    
+    # Indices only grow, so length-n deques never wrap
+    low_deque = np.empty(n, dtype=np.int64)
+    high_deque = np.empty(n, dtype=np.int64)
+    low_head = low_tail = high_head = high_tail = 0
+    for j in range(lookback - 1):
+        low_head, low_tail = push_extreme(low, j, lookback, low_deque, low_head, low_tail, False)
+        high_head, high_tail = push_extreme(high, j, lookback, high_deque, high_head, high_tail, True)
+    
+    # Whether the previous window's profile can be rolled forward
+    built = False
+    built_min = built_max = np.nan
+    
+    for i in range(lookback, n):
+        start = i - lookback
+        low_head, low_tail = push_extreme(low, i - 1, lookback, low_deque, low_head, low_tail, False)
+        high_head, high_tail = push_extreme(high, i - 1, lookback, high_deque, high_head, high_tail, True)
+        
+        # Price range of the window, skipping NaN prices
+        price_min = low[low_deque[low_head]] if low_tail > low_head else np.nan
+        price_max = high[high_deque[high_head]] if high_tail > high_head else np.nan
+        if not price_max - price_min >= 0.001:
+            built = False
+            continue
+        
+        # Same extremes, same bins: swap the leaving bar for the entering one.
+        # A non-finite volume cannot be subtracted back out, so it forces a rebuild
+        leaving = start - 1
+        if built and price_min == built_min and price_max == built_max and np.isfinite(volume[leaving]):
+            b = _price_bin(close[leaving], bins, num_bins)
+            members[b] -= 1
+            if members[b] == 0:
+                profile[b] = 0.0
+            else:
+                profile[b] -= volume[leaving]
+            b = _price_bin(close[i - 1], bins, num_bins)
+            members[b] += 1
+            profile[b] += volume[i - 1]
+        else:
+            # Uniform bin edges, as np.linspace lays them out
+            step = (price_max - price_min) / num_bins
+            for b in range(num_bins):
+                bins[b] = b * step + price_min
+            bins[num_bins] = price_max
+            # HVN price levels only change with the bins
+            for b in range(num_bins):
+                midpoints[b] = (bins[b] + bins[b + 1]) / 2
+            
+            # Each candle's volume goes to the bin of its close
+            profile[:] = 0.0
+            members[:] = 0
+            for j in range(start, i):
+                b = _price_bin(close[j], bins, num_bins)
+                members[b] += 1
+                profile[b] += volume[j]
+            built = True
+            built_min = price_min
+            built_max = price_max
+        
+        shares[:] = profile
+        total_volume = _pairwise_sum(shares)
+        if total_volume > 0:
+            for b in range(num_bins):
+                shares[b] /= total_volume
+        
+        scratch[:] = shares
+        threshold = _linear_percentile(scratch, quantile)
+        
+        # Bars before signal_lookback compare against the end, like negative indexing
+        previous = i - signal_lookback
+        if previous < 0:
+            previous += n
+        current_price = close[i]
+        rising = current_price > close[previous]
+        
+        # Price close to a HVN (within 0.5%): buy when rising towards it from
+        # below, sell when falling towards it from above
+        for b in range(num_bins):
+            hvn_price = midpoints[b]
+            if not (shares[b] >= threshold and abs(current_price - hvn_price) / current_price < 0.005):
+                continue
+            if rising and current_price < hvn_price:
+                signal[i] = 1
+                break
+            if not rising and current_price > hvn_price:
+                signal[i] = -1
+                break
+    return signal
+
 class VolumeProfileStrategy(Strategy):
     """
     Volume Profile strategy.
@@ -29,11 +311,12 @@ class VolumeProfileStrategy(Strategy):
         """
         super().__init__(name, parameters)
         
-        # Extract parameters
-        self.num_bins = self.parameters.get("num_bins", 20)
-        self.lookback_period = self.parameters.get("lookback_period", 100)
-        self.volume_threshold = self.parameters.get("volume_threshold", 0.8)
-        self.signal_lookback = self.parameters.get("signal_lookback", 5)
+        # Complete the parameters once, then extract them
+        self.parameters = {**DEFAULT_PARAMETERS, **self.parameters}
+        self.num_bins = self.parameters["num_bins"]
+        self.lookback_period = self.parameters["lookback_period"]
+        self.volume_threshold = self.parameters["volume_threshold"]
+        self.signal_lookback = self.parameters["signal_lookback"]
     
     def process_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -50,115 +333,181 @@ class VolumeProfileStrategy(Strategy):
             return pd.DataFrame()
         
         # Ensure we have the required columns
-        required_columns = ['high', 'low', 'close', 'volume']
+        required_columns = self.required_columns()
         if not all(col in data.columns for col in required_columns):
             logger.error(f"Data missing required columns for Volume Profile calculation")
             return pd.DataFrame()
         
-        # Create signals DataFrame
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0
-        signals['binary_signal'] = 0
+        signal = np.zeros(len(data), dtype=np.int8)
+        binary_signal = np.zeros(len(data), dtype=np.int8)
         
-        # Process each window of data
-        for i in range(self.lookback_period, len(data)):
-            # Get the current window
-            window = data.iloc[i-self.lookback_period:i]
-            
-            # Calculate price range for the window
-            price_min = window['low'].min()
-            price_max = window['high'].max()
-            price_range = price_max - price_min
-            
-            # Skip if price range is too small
-            if price_range < 0.001:
-                continue
-            
-            # Create price bins
-            bins = np.linspace(price_min, price_max, self.num_bins + 1)
-            
-            # Calculate volume profile
-            volume_profile = np.zeros(self.num_bins)
-            
-            # Distribute volume across price levels
-            for _, row in window.iterrows():
-                # Determine which bins this candle spans
-                low_bin = max(0, np.digitize(row['low'], bins) - 1)
-                high_bin = min(self.num_bins - 1, np.digitize(row['high'], bins) - 1)
-                
-                # Assign volume to the bin of the closing price
-                close_bin = max(0, np.digitize(row['close'], bins) - 1)
-                volume_profile[close_bin] += row['volume']
-            
-            # Normalize volume profile
-            total_volume = np.sum(volume_profile)
-            if total_volume > 0:
-                volume_profile = volume_profile / total_volume
-            
-            # Find high volume nodes (HVNs)
-            hvn_threshold = np.percentile(volume_profile, self.volume_threshold * 100)
-            hvn_bins = np.where(volume_profile >= hvn_threshold)[0]
-            
-            # Convert bin indices to price levels
-            hvn_prices = [(bins[idx] + bins[idx + 1]) / 2 for idx in hvn_bins]
-            
-            # Current price and recent price movement
-            current_price = data.iloc[i]['close']
-            price_direction = 1 if current_price > data.iloc[i-self.signal_lookback]['close'] else -1
-            
-            # Generate signals based on proximity to HVNs
-            for hvn_price in hvn_prices:
-                price_distance = abs(current_price - hvn_price)
-                price_percent = price_distance / current_price
-                
-                # If price is close to a HVN (within 0.5%)
-                if price_percent < 0.005:
-                    # Buy signal if approaching HVN from below
-                    if price_direction > 0 and current_price < hvn_price:
-                        signals.loc[data.index[i], 'signal'] = 1
-                        signals.loc[data.index[i], 'binary_signal'] = 1
-                    # Sell signal if approaching HVN from above
-                    elif price_direction < 0 and current_price > hvn_price:
-                        signals.loc[data.index[i], 'signal'] = -1
-                        signals.loc[data.index[i], 'binary_signal'] = 0
-        
-        # Add strategy metadata
-        signals['strategy'] = self.name
-        signals['weight'] = self.weight
+        # Bar i is judged against the profile of the lookback_period bars before it
+        if len(data) > self.lookback_period:
+            prices = [np.ascontiguousarray(data[column].to_numpy(dtype=np.float64))
+                      for column in required_columns]
+            if NUMBA_AVAILABLE:
+                signal = _vp_kernel(
+                    *prices, int(self.lookback_period), int(self.num_bins),
+                    float(np.true_divide(self.volume_threshold * 100, 100)), int(self.signal_lookback)
+                )
+                binary_signal = (signal == 1).view(np.int8)
+            else:
+                buy, sell = self._find_hvn_signals(*prices)
+                signal[buy] = 1
+                binary_signal[buy] = 1
+                signal[sell] = -1
+        
+        # Create signals DataFrame in one construction from the finished columns
+        signals = pd.DataFrame({
+            'signal': signal,
+            'binary_signal': binary_signal,
+            # Strategy metadata
+            'strategy': self._strategy_column(len(data)),
+            'weight': self.weight
+        }, index=data.index, copy=False)
         
         # Store signals for later retrieval
         self.signals = signals
         
         # Calculate performance metrics
-        self._calculate_performance_metrics(data, signals)
+        self._calculate_performance_metrics(data, signal)
         
         return signals
     
-    def _calculate_performance_metrics(self, data: pd.DataFrame, signals: pd.DataFrame) -> None:
+    def _find_hvn_signals(self, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                          volume: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find bars approaching a high volume node of their trailing volume profile.
+        
+        Every trailing window is viewed at once with sliding_window_view, and
+        the price ranges, bin edges, volume histograms, HVN thresholds and
+        proximity tests are all vectorized across windows.
+        
+        Args:
+            high: High prices
+            low: Low prices
+            close: Close prices
+            volume: Volumes
+            
+        Returns:
+            Tuple of (buy, sell) boolean masks over all bars
+        """
+        n = len(close)
+        lookback = self.lookback_period
+        bars = np.arange(lookback, n)
+        
+        # Window k covers bars [k, k + lookback) and scores bar k + lookback.
+        # Rolling min/max run in O(n) and, with min_periods=1, skip NaN prices
+        # like the pandas min/max of each window
+        price_min = pd.Series(low[:-1]).rolling(lookback, min_periods=1).min().to_numpy()[lookback - 1:]
+        price_max = pd.Series(high[:-1]).rolling(lookback, min_periods=1).max().to_numpy()[lookback - 1:]
+        price_range = price_max - price_min
+        
+        # Skip windows whose price range is too small (or undefined), and
+        # stop before any binning when no window is left
+        valid = price_range >= 0.001
+        windows = np.flatnonzero(valid)
+        buy = np.zeros(n, dtype=bool)
+        sell = np.zeros(n, dtype=bool)
+        if not windows.size:
+            return buy, sell
+        bars = bars[valid]
+        
+        # Price bins per window, one row each
+        bins = np.linspace(price_min[valid], price_max[valid], self.num_bins + 1, axis=1)
+        
+        # Volume profile: each candle's volume goes to the bin of its close,
+        # built a block of windows at a time to bound the (windows, lookback) temporaries
+        close_windows = sliding_window_view(close[:-1], lookback)
+        volume_windows = sliding_window_view(volume[:-1], lookback)
+        volume_profile = np.empty((len(windows), self.num_bins))
+        for start in range(0, len(windows), WINDOW_BLOCK_SIZE):
+            block = slice(start, start + WINDOW_BLOCK_SIZE)
+            close_bin = self._close_bins(close_windows[windows[block]], bins[block])
+            # Offset each window's bins so one bincount fills every profile row
+            close_bin += np.arange(close_bin.shape[0])[:, None] * self.num_bins
+            volume_profile[block] = np.bincount(
+                close_bin.ravel(),
+                weights=volume_windows[windows[block]].ravel(),
+                minlength=close_bin.shape[0] * self.num_bins
+            ).reshape(-1, self.num_bins)
+        
+        # Normalize volume profile
+        total_volume = volume_profile.sum(axis=1, keepdims=True)
+        np.divide(volume_profile, total_volume, out=volume_profile, where=total_volume > 0)
+        
+        # High volume nodes (HVNs) and their price levels
+        hvn_threshold = np.percentile(volume_profile, self.volume_threshold * 100, axis=1, keepdims=True)
+        hvn = volume_profile >= hvn_threshold
+        hvn_prices = np.add(bins[:, :-1], bins[:, 1:])
+        hvn_prices /= 2
+        
+        # Current price and recent price movement
+        current_price = close[bars][:, None]
+        rising = close[bars] > close[bars - self.signal_lookback]
+        
+        # A window can only signal towards the side the price is moving: HVNs
+        # above a rising price (buy) or below a falling one (sell)
+        distance = np.subtract(hvn_prices, current_price, out=hvn_prices)
+        candidate = np.where(rising[:, None], distance > 0, distance < 0)
+        candidate &= hvn
+        
+        # ... that are close to the price (within 0.5%)
+        np.abs(distance, out=distance)
+        distance /= current_price
+        candidate &= distance < 0.005
+        hit = candidate.any(axis=1)
+        
+        buy[bars] = rising & hit
+        sell[bars] = ~rising & hit
+        return buy, sell
+    
+    def _close_bins(self, closes: np.ndarray, bins: np.ndarray) -> np.ndarray:
+        """
+        Price bin of each close, as np.digitize would place it, clipped to the profile.
+        
+        The bins are uniform, so the bin is found by rescaling the price in
+        constant time; one comparison against the actual edges on either side
+        then absorbs floating-point rounding at bin boundaries.
+        
+        Args:
+            closes: (windows, lookback) close prices
+            bins: (windows, num_bins + 1) bin edges of each window
+            
+        Returns:
+            (windows, lookback) integer bin indices in [0, num_bins)
+        """
+        last = self.num_bins - 1
+        with np.errstate(invalid='ignore'):
+            scaled = (closes - bins[:, :1]) / (bins[:, -1:] - bins[:, :1]) * self.num_bins
+        # NaN prices land past the last edge, like np.digitize
+        close_bin = np.clip(np.nan_to_num(np.floor(scaled), nan=last), 0, last).astype(np.intp)
+        
+        close_bin -= (closes < np.take_along_axis(bins, close_bin, axis=1)) & (close_bin > 0)
+        close_bin += (closes >= np.take_along_axis(bins, close_bin + 1, axis=1)) & (close_bin < last)
+        return close_bin
+    
+    def _calculate_performance_metrics(self, data: pd.DataFrame, signal: np.ndarray) -> None:
         """
         Calculate performance metrics for the strategy.
         
         Args:
             data: Original market data
-            signals: Generated signals
+            signal: Generated int8 signal array
         """
-        super()._calculate_performance_metrics(data, signals)
+        super()._calculate_performance_metrics(data, signal)
         # Skip if we don't have enough data
-        if len(signals) < self.lookback_period + 10:
+        if len(signal) < self.lookback_period + 10:
             return
         
         # Calculate basic metrics
-        signal_changes = signals['signal'].diff().fillna(0)
-        num_trades = (signal_changes != 0).sum()
+        num_trades = int(np.count_nonzero(signal[1:] != signal[:-1]))
         
         # Calculate win rate (simplified)
         # A win is when a buy signal is followed by a price increase, or a sell signal is followed by a price decrease
-        wins = 0
-        for i in range(len(signals) - 1):
-            if signals['signal'].iloc[i] == 1 and data['close'].iloc[i+1] > data['close'].iloc[i]:
-                wins += 1
-            elif signals['signal'].iloc[i] == -1 and data['close'].iloc[i+1] < data['close'].iloc[i]:
-                wins += 1
+        delta = np.diff(data['close'].to_numpy())
+        held = signal[:-1]
+        wins = int(np.count_nonzero((held == 1) & (delta > 0)) + np.count_nonzero((held == -1) & (delta < 0)))
         
         win_rate = wins / num_trades if num_trades > 0 else 0
         
@@ -170,6 +519,15 @@ class VolumeProfileStrategy(Strategy):
             "parameters": self.parameters
         })
 
+    def required_columns(self) -> Tuple[str, ...]:
+        """
+        Get the market data columns process_data reads.
+        
+        Returns:
+            Tuple of column names
+        """
+        return ('high', 'low', 'close', 'volume')
+    
     def get_signal_type(self) -> str:
         """
         Get the type of signals this strategy generates.
@@ -0,0 +1,101 @@
+import copy
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Render headless: matplotlib reads MPLBACKEND when it is first imported, so
+# setting it here keeps every test off GUI backends without importing
+# matplotlib for sessions that never plot.
+os.environ["MPLBACKEND"] = "Agg"
+
+CONFIG_PATH = os.path.join('config', 'config.json')
+
+# In-memory copy of the strategy defaults in config/config.json
+# (test_frozen_config_matches_config_file keeps the two in sync)
+FROZEN_CONFIG = {
+    "strategy_defaults": {
+        "BollingerBandsStrategy": {"period": 20, "std_dev": 2.0, "price_source": "close"},
+        "FibonacciRetracementStrategy": {
+            "trend_period": 50,
+            "swing_lookback": 20,
+            "retracement_levels": [0.236, 0.382, 0.5, 0.618, 0.786],
+            "level_tolerance": 0.01
+        },
+        "IchimokuCloudStrategy": {"tenkan_period": 9, "kijun_period": 26, "senkou_b_period": 52, "displacement": 26},
+        "VolumeProfileStrategy": {"num_bins": 20, "lookback_period": 100, "volume_threshold": 0.8, "signal_lookback": 5},
+        "MACDStrategy": {"fast_period": 12, "slow_period": 26, "signal_period": 9},
+        "MovingAverageCrossover": {"fast_period": 20, "slow_period": 50},
+        "RSIStrategy": {"period": 14, "overbought": 70, "oversold": 30}
+    }
+}
+
+@pytest.fixture(scope="session")
+def strategy_defaults():
+    """Fixture for the strategy_defaults section of config/config.json, loaded once per session."""
+    if not os.path.exists(CONFIG_PATH):
+        pytest.skip(f"{CONFIG_PATH} not found")
+    with open(CONFIG_PATH, 'r') as f:
+        return json.load(f)['strategy_defaults']
+
+@pytest.fixture
+def frozen_config(mocker):
+    """Fixture serving FROZEN_CONFIG to the config loader instead of reading config/config.json."""
+    config = copy.deepcopy(FROZEN_CONFIG)
+    mocker.patch("config.config_loader.load_config", return_value=config)
+    return config
+
+
+@lru_cache(maxsize=None)
+def _sample_dates(periods):
+    """Daily DatetimeIndex from 2023-01-01; indexes are immutable, so one per length is shared."""
+    return pd.date_range(start="2023-01-01", periods=periods)
+
+@pytest.fixture(scope="session")
+def sample_dates():
+    """Fixture for a cached index factory: sample_dates(periods) returns the shared daily index."""
+    return _sample_dates
+
+
+# Column order and uniform (low, high) bounds of the sample market data
+MARKET_DATA_COLUMNS = ["open", "high", "low", "close", "volume"]
+MARKET_DATA_BOUNDS = np.array([[95, 105], [100, 110], [90, 100], [98, 108], [10000, 50000]], dtype=np.float64)
+
+def _make_market_data(periods):
+    """Build a seeded OHLCV DataFrame backed by one read-only float64 block."""
+    rng = np.random.default_rng(0)
+    # One draw for every column; each row of the (columns, periods) block is contiguous
+    values = rng.uniform(MARKET_DATA_BOUNDS[:, :1], MARKET_DATA_BOUNDS[:, 1:], size=(len(MARKET_DATA_COLUMNS), periods))
+    # Shared across the session, so no test may write into it
+    values.setflags(write=False)
+    # pandas stores 2-D input transposed, so the (periods, columns) view becomes
+    # a single block over values itself, with no copy and contiguous columns
+    return pd.DataFrame(
+        values.T,
+        columns=MARKET_DATA_COLUMNS,
+        index=_sample_dates(periods),
+        copy=False
+    )
+
+@pytest.fixture(scope="session")
+def market_data_100():
+    """Fixture for 100 bars of sample market data, built once per session."""
+    return _make_market_data(100)
+
+@pytest.fixture(scope="session")
+def market_data_200():
+    """Fixture for 200 bars of sample market data, built once per session."""
+    return _make_market_data(200)
+
+@pytest.fixture(scope="session")
+def close_only_market_data(market_data_100):
+    """Fixture for just the close column of the 100-bar sample data, for close-based strategies."""
+    return market_data_100[["close"]]
+
+@pytest.fixture
+def market_data(market_data_100):
+    """Fixture for sample market data."""
+    return market_data_100
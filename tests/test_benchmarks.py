@@ -0,0 +1,14 @@
+import pytest
+
+# Timing guard rails only run where the pytest-benchmark plugin is installed
+pytest.importorskip("pytest_benchmark")
+
+from strategies.strategy_factory import _load_registry
+
+@pytest.mark.slow
+@pytest.mark.parametrize("strategy_name", sorted(_load_registry()))
+def test_process_data_benchmark(benchmark, market_data_200, strategy_name):
+    """Benchmark each strategy's process_data on 200 bars, checking it still produces signals."""
+    strategy = _load_registry()[strategy_name](name=strategy_name)
+    signals = benchmark(strategy.process_data, market_data_200)
+    assert len(signals) == len(market_data_200)
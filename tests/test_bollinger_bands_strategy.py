@@ -2,30 +2,12 @@ import pytest
 import pandas as pd
 import numpy as np
 
-from strategies.bollinger_bands_strategy import BollingerBandsStrategy
+from strategies.bollinger_bands_strategy import BollingerBandsStrategy, _rolling_mean_std
 
-@pytest.fixture
-def market_data():
-    """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=100)
-    data = {
-        "open": np.random.uniform(95, 105, size=100),
-        "high": np.random.uniform(100, 110, size=100),
-        "low": np.random.uniform(90, 100, size=100),
-        "close": np.random.uniform(98, 108, size=100),
-        "volume": np.random.uniform(10000, 50000, size=100),
-    }
-    return pd.DataFrame(data, index=dates)
-
-
-import json
-
-def test_bollinger_bands_strategy_init_defaults():
+def test_bollinger_bands_strategy_init_defaults(frozen_config):
     """Test BollingerBandsStrategy initialization with default parameters."""
     strategy = BollingerBandsStrategy(name="BollingerBands_default")
-    with open('config/config.json', 'r') as f:
-        config = json.load(f)
-    defaults = config['strategy_defaults']['BollingerBandsStrategy']
+    defaults = frozen_config['strategy_defaults']['BollingerBandsStrategy']
 
     assert strategy.name == "BollingerBands_default"
     assert strategy.period == defaults['period']
@@ -88,3 +70,78 @@ def test_bollinger_bands_strategy_process_empty_data():
     strategy = BollingerBandsStrategy(name="BollingerBands")
     signals = strategy.process_data(pd.DataFrame())
     assert signals.empty
+
+
+@pytest.mark.parametrize("window", [1, 20, 100])
+def test_rolling_mean_std_matches_pandas(window):
+    """Test that the one-pass rolling mean/std matches pandas rolling."""
+    values = 1000 + np.cumsum(np.random.default_rng(7).normal(0, 1, 5000))
+    values[::50] = values[1::50]
+    mean, std = _rolling_mean_std(values, window)
+    rolling = pd.Series(values).rolling(window=window)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-10)
+    np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-6, atol=1e-9)
+
+    values[10] = np.nan
+    mean, std = _rolling_mean_std(values, window)
+    rolling = pd.Series(values).rolling(window=window)
+    np.testing.assert_array_equal(mean, rolling.mean().to_numpy())
+    np.testing.assert_array_equal(std, rolling.std().to_numpy())
+
+
+def test_rolling_mean_std_long_low_variance_series():
+    """Test that the running sums do not drift over a long, slowly moving series."""
+    values = 100 + np.cumsum(np.random.default_rng(1).normal(0, 0.01, 500_000))
+    mean, std = _rolling_mean_std(values, 20)
+    # Exact two-pass statistics per window (pandas' own online rolling std drifts here too)
+    windows = np.lib.stride_tricks.sliding_window_view(values, 20)
+    np.testing.assert_allclose(mean[19:], windows.mean(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(std[19:], windows.std(axis=1, ddof=1), rtol=1e-8)
+    assert np.isnan(std[:19]).all()
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 4096])
+@pytest.mark.parametrize("window", [2, 3, 100])
+def test_rolling_mean_std_flat_and_short_windows(block_size, window):
+    """Test short and flat windows far from the block mean, where the sums cancel."""
+    values = 1000 + np.cumsum(np.random.default_rng(3).normal(0, 1, 3000))
+    values[100:150] = values[100]
+    mean, std = _rolling_mean_std(values, window, block_size)
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    np.testing.assert_allclose(mean[window - 1:], windows.mean(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(std[window - 1:], windows.std(axis=1, ddof=1), rtol=1e-9, atol=0)
+
+@pytest.mark.parametrize("nan_rows", [slice(40, 41), slice(0, 3)])
+def test_bollinger_bands_process_data_with_nan_close(market_data, nan_rows):
+    """Test that a gap or leading NaNs in the price give NaN bands instead of failing."""
+    data = market_data.copy()
+    data.iloc[nan_rows, data.columns.get_loc("close")] = np.nan
+    strategy = BollingerBandsStrategy(name="BollingerBands", parameters={"period": 10, "std_dev": 2.0})
+    signals = strategy.process_data(data)
+
+    rolling = data["close"].rolling(window=10)
+    expected_upper = (rolling.mean() + 2.0 * rolling.std()).astype(np.float32)
+    np.testing.assert_allclose(signals["upper_band"].to_numpy(), expected_upper.to_numpy(), rtol=1e-6)
+    assert signals["upper_band"].isna().equals(expected_upper.isna())
+    assert (signals["signal"][signals["upper_band"].isna()] == 0).all()
+
+
+def test_bollinger_bands_strategy_column_is_categorical(market_data):
+    """Test that the constant strategy column is stored as a single category."""
+    strategy = BollingerBandsStrategy(name="BollingerBands")
+    signals = strategy.process_data(market_data)
+    assert isinstance(signals["strategy"].dtype, pd.CategoricalDtype)
+    assert list(signals["strategy"].cat.categories) == ["BollingerBands"]
+    assert (signals["strategy"] == "BollingerBands").all()
+
+
+def test_bollinger_bands_column_dtypes(market_data):
+    """Test that bands are stored as float32 and signals as int8, consistently with each other."""
+    strategy = BollingerBandsStrategy(name="BollingerBands", parameters={"period": 10, "std_dev": 1.0})
+    signals = strategy.process_data(market_data)
+    for column in ("middle_band", "upper_band", "lower_band"):
+        assert signals[column].dtype == np.float32
+    assert signals["signal"].dtype == np.int8
+    assert signals["binary_signal"].dtype == np.int8
+    assert signals["price"].dtype == np.float64
+    assert ((signals["price"] < signals["lower_band"]) == (signals["signal"] == 1)).all()
@@ -66,3 +66,14 @@ def test_set_report_config_makes_dirty(config_controller):
     """Test that set_report_config sets the dirty flag to True."""
     config_controller.set_report_config({})
     assert config_controller.is_dirty()
+
+def test_save_and_load_config_round_trip(config_controller, tmp_path):
+    """Test that a saved configuration loads back unchanged."""
+    config = config_controller.create_default_config()
+    config_path = str(tmp_path / "config.json")
+
+    assert config_controller.save_config(config_path)
+
+    loaded = ConfigController()
+    assert loaded.load_config(config_path)
+    assert loaded.get_config() == config
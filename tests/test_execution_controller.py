@@ -0,0 +1,214 @@
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from gui.controllers.config_controller import ConfigController
+from gui.controllers.execution_controller import ExecutionController, build_pipeline
+from strategies.moving_average_crossover import MovingAverageCrossover
+
+@pytest.fixture
+def execution_controller(tmp_path):
+    """Fixture for an ExecutionController writing reports and cache files to a temp directory."""
+    config_controller = ConfigController()
+    config_controller.create_default_config()
+    config_controller.set_data_source_config({
+        "type": "sample",
+        "start_date": "2023-01-01",
+        "end_date": "2023-12-31"
+    })
+    config_controller.set_report_config({
+        "output_dir": str(tmp_path / "reports"),
+        "format": "csv",
+        "include_plots": False
+    })
+    return ExecutionController(config_controller, cache_dir=str(tmp_path / "cache"))
+
+def test_run_analysis(execution_controller):
+    """Test that a full analysis run produces signals for every configured strategy."""
+    success, message = execution_controller.run_analysis()
+    assert success, message
+    assert len(execution_controller.get_strategy_signals()) == 3
+    assert len(execution_controller.get_strategy_metadata()) == 3
+
+def test_run_analysis_reports_import_failures(execution_controller, mocker):
+    """Test that a failing deferred import is reported through the return value, not raised."""
+    import builtins
+
+    real_import = builtins.__import__
+
+    def failing_import(name, *args, **kwargs):
+        if name == "data.data_loader":
+            raise ImportError("data loader unavailable")
+        return real_import(name, *args, **kwargs)
+
+    mocker.patch("builtins.__import__", side_effect=failing_import)
+    success, message = execution_controller.run_analysis()
+    assert not success
+    assert "data loader unavailable" in message
+
+def test_signal_cache_skips_unchanged_strategies(execution_controller, mocker):
+    """Test that strategies whose config and data did not change are served from the cache."""
+    success, _ = execution_controller.run_analysis()
+    assert success
+    first_signals = execution_controller.get_strategy_signals()
+
+    spy = mocker.spy(MovingAverageCrossover, "process_data")
+    success, _ = execution_controller.run_analysis()
+    assert success
+    assert spy.call_count == 0
+    assert execution_controller.get_strategy_signals()[0].equals(first_signals[0])
+
+def test_signal_cache_returns_copies(execution_controller):
+    """Test that modifying served signals or metadata leaves the cached entries intact."""
+    execution_controller.run_analysis()
+    signals = execution_controller.get_strategy_signals()[0]
+    expected = signals.copy()
+    signals["signal"] = 99
+    execution_controller.get_strategy_metadata()[0]["num_trades"] = -1
+
+    execution_controller.run_analysis()
+    assert execution_controller.get_strategy_signals()[0].equals(expected)
+    assert execution_controller.get_strategy_metadata()[0]["num_trades"] != -1
+
+def test_signal_cache_key_tracks_strategy_code(execution_controller, mocker):
+    """Test that signals cached by other strategy code or cache layout versions are not reused."""
+    from gui.controllers import execution_controller as module
+
+    strategy_config = execution_controller.config_controller.get_strategies_config()[0]
+    key = execution_controller._compute_signal_key("data", strategy_config)
+
+    mocker.patch.object(module, "_strategies_code_version", return_value="other")
+    assert execution_controller._compute_signal_key("data", strategy_config) != key
+    mocker.stopall()
+    mocker.patch.object(module, "SIGNAL_CACHE_VERSION", module.SIGNAL_CACHE_VERSION + 1)
+    assert execution_controller._compute_signal_key("data", strategy_config) != key
+
+def test_signal_cache_recomputes_changed_strategy(execution_controller, mocker):
+    """Test that changing a strategy's parameters invalidates its cache entry only."""
+    execution_controller.run_analysis()
+
+    strategies = execution_controller.config_controller.get_strategies_config()
+    strategies[0]["parameters"]["fast_period"] = 10
+
+    spy = mocker.spy(MovingAverageCrossover, "process_data")
+    success, _ = execution_controller.run_analysis()
+    assert success
+    assert spy.call_count == 1
+
+def test_signal_cache_persists_to_disk(execution_controller, tmp_path):
+    """Test that cached signals survive a new controller instance."""
+    execution_controller.run_analysis()
+    assert any((tmp_path / "cache").iterdir())
+
+    fresh = ExecutionController(execution_controller.config_controller, cache_dir=str(tmp_path / "cache"))
+    data_key = fresh._compute_data_key(execution_controller.get_market_data())
+    strategy_config = execution_controller.config_controller.get_strategies_config()[0]
+    cached = fresh._get_cached_signals(fresh._compute_signal_key(data_key, strategy_config))
+    assert cached is not None
+    assert cached[0].equals(execution_controller.get_strategy_signals()[0])
+
+def test_signal_cache_prunes_disk_files(execution_controller, tmp_path, mocker):
+    """Test that the least recently used cache files are deleted beyond the disk cap."""
+    mocker.patch("gui.controllers.execution_controller.SIGNAL_DISK_CACHE_SIZE", 2)
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    stale = cache_dir / "sig_stale.pkl"
+    pd.to_pickle((pd.DataFrame(), {}), stale)
+    os.utime(stale, (0, 0))
+
+    signals = pd.DataFrame({"signal": [0, 1]})
+    for sig_key in ("first", "second"):
+        execution_controller._store_cached_signals(sig_key, signals, {})
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["sig_first.pkl", "sig_second.pkl"]
+
+def test_prepare_strategy_data_float64_is_passthrough(execution_controller):
+    """Test that strategies get the market data itself when no dtype change is configured."""
+    execution_controller.run_analysis()
+    market_data = execution_controller.get_market_data()
+    assert execution_controller._prepare_strategy_data(market_data) is market_data
+
+def test_prepare_strategy_data_float32_prices(execution_controller):
+    """Test that the dtype option narrows price columns only and keeps every column."""
+    execution_controller.run_analysis()
+    market_data = execution_controller.get_market_data().assign(symbol="TEST")
+    data = execution_controller._prepare_strategy_data(market_data, np.float32)
+
+    assert list(data.columns) == list(market_data.columns)
+    assert data.index.equals(market_data.index)
+    for column in ("open", "high", "low", "close"):
+        assert data[column].dtype == np.float32
+    assert data["volume"].dtype == market_data["volume"].dtype
+    assert (data["symbol"] == "TEST").all()
+
+def test_run_analysis_passes_float32_prices_to_strategies(execution_controller, mocker):
+    """Test that strategies receive the price columns in the configured dtype."""
+    config_controller = execution_controller.config_controller
+    config_controller.set_data_source_config({**config_controller.get_config()["data_source"], "dtype": "float32"})
+    spy = mocker.spy(MovingAverageCrossover, "process_data")
+
+    success, message = execution_controller.run_analysis()
+    assert success, message
+    assert spy.call_args.args[1]["close"].dtype == np.float32
+
+def test_get_results_combines_signals(execution_controller):
+    """Test that get_results exposes one signal column per strategy and reuses it."""
+    execution_controller.run_analysis()
+    results = execution_controller.get_results()
+
+    signals = results["signals"]
+    assert list(signals.columns) == ["Strategy_1", "Strategy_2", "Strategy_3"]
+    assert signals.index.equals(execution_controller.get_market_data().index)
+    pd.testing.assert_series_equal(
+        signals["Strategy_2"],
+        execution_controller.get_strategy_signals()[1]["signal"],
+        check_names=False
+    )
+    assert execution_controller.get_results()["signals"] is signals
+
+def test_pipeline_resolved_once_per_config(execution_controller, mocker):
+    """Test that each run gets fresh strategy instances from a memoized resolution."""
+    from strategies.strategy_factory import StrategyFactory
+
+    strategy_configs = execution_controller.config_controller.get_strategies_config()
+    spy = mocker.spy(StrategyFactory, "create_strategy")
+
+    pipeline = build_pipeline(execution_controller._pipeline_spec(strategy_configs))
+    assert len(pipeline) == 3
+    assert pipeline[1].get_weight() == 0.8
+    resolve_calls = spy.call_count
+
+    again = build_pipeline(execution_controller._pipeline_spec(strategy_configs))
+    assert spy.call_count == resolve_calls
+    assert all(first is not second for first, second in zip(pipeline, again))
+    assert [type(strategy) for strategy in again] == [type(strategy) for strategy in pipeline]
+    assert again[1].get_weight() == 0.8
+
+    strategy_configs[0]["parameters"]["fast_period"] = 10
+    changed = build_pipeline(execution_controller._pipeline_spec(strategy_configs))
+    assert changed[0].fast_period == 10
+    assert pipeline[0].fast_period != 10
+
+def test_pipeline_instances_do_not_share_state(execution_controller):
+    """Test that one run's signals and metadata do not leak into another run's strategies."""
+    spec = execution_controller._pipeline_spec(execution_controller.config_controller.get_strategies_config())
+    first = build_pipeline(spec)
+    first[0].process_data(pd.DataFrame({"close": np.linspace(100.0, 120.0, 100)}))
+    first[0].metadata["leaked"] = True
+
+    second = build_pipeline(spec)
+    assert "leaked" not in second[0].get_metadata()
+    assert second[0].signals is None
+    assert second[0].parameters is not first[0].parameters
+
+def test_pipeline_failures_not_memoized(mocker):
+    """Test that a strategy that failed to resolve is retried on the next build."""
+    from strategies.strategy_factory import StrategyFactory
+
+    spy = mocker.spy(StrategyFactory, "create_strategy")
+    spec = (("NoSuchStrategy", b"{}", 1.0),)
+    assert build_pipeline(spec) == (None,)
+    assert build_pipeline(spec) == (None,)
+    assert spy.call_count == 2
@@ -4,28 +4,10 @@ import numpy as np
 
 from strategies.fibonacci_retracement_strategy import FibonacciRetracementStrategy
 
-@pytest.fixture
-def market_data():
-    """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=100)
-    data = {
-        "open": np.random.uniform(95, 105, size=100),
-        "high": np.random.uniform(100, 110, size=100),
-        "low": np.random.uniform(90, 100, size=100),
-        "close": np.random.uniform(98, 108, size=100),
-        "volume": np.random.uniform(10000, 50000, size=100),
-    }
-    return pd.DataFrame(data, index=dates)
-
-
-import json
-
-def test_fibonacci_retracement_strategy_init_defaults():
+def test_fibonacci_retracement_strategy_init_defaults(frozen_config):
     """Test FibonacciRetracementStrategy initialization with default parameters."""
     strategy = FibonacciRetracementStrategy(name="FibonacciRetracement_default")
-    with open('config/config.json', 'r') as f:
-        config = json.load(f)
-    defaults = config['strategy_defaults']['FibonacciRetracementStrategy']
+    defaults = frozen_config['strategy_defaults']['FibonacciRetracementStrategy']
 
     assert strategy.name == "FibonacciRetracement_default"
     assert strategy.trend_period == defaults['trend_period']
@@ -94,3 +76,40 @@ def test_fibonacci_signal_correctness():
 
     # Check for a buy signal at a retracement level
     assert 1 in signals['signal'].values
+
+
+def test_fibonacci_process_data_leaves_input_unchanged(market_data):
+    """Test that signal generation does not add helper columns to the caller's data."""
+    strategy = FibonacciRetracementStrategy(name="FibonacciRetracement")
+    columns = list(market_data.columns)
+    strategy.process_data(market_data)
+    assert list(market_data.columns) == columns
+
+
+@pytest.mark.parametrize("trend_period, swing_lookback", [(50, 20), (10, 5), (5, 1)])
+def test_fibonacci_kernel_matches_vectorized(trend_period, swing_lookback):
+    """Test that the compiled scan and the vectorized NumPy path give the same signals."""
+    from strategies import fibonacci_retracement_strategy as module
+
+    rng = np.random.default_rng(42)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, 300)), 1)
+    data = pd.DataFrame({
+        "close": close,
+        "high": close + np.round(rng.uniform(0, 2, 300), 1),
+        "low": close - np.round(rng.uniform(0, 2, 300), 1),
+    }, index=pd.date_range(start="2023-01-01", periods=300))
+    strategy = FibonacciRetracementStrategy(
+        name="Fibonacci_test",
+        parameters={"trend_period": trend_period, "swing_lookback": swing_lookback}
+    )
+
+    buy_hit, sell_hit = strategy._find_retracement_hits(data)
+    signal = module._fibonacci_signals_nb(
+        data["high"].to_numpy(), data["low"].to_numpy(), data["close"].to_numpy(),
+        data["close"].rolling(window=trend_period).mean().to_numpy(),
+        trend_period, swing_lookback,
+        np.asarray(strategy.retracement_levels, dtype=np.float64), strategy.level_tolerance
+    )
+    assert buy_hit.any() and sell_hit.any()
+    np.testing.assert_array_equal(signal == 1, buy_hit)
+    np.testing.assert_array_equal(signal == -1, sell_hit)
@@ -4,28 +4,17 @@ import numpy as np
 
 from strategies.ichimoku_cloud_strategy import IchimokuCloudStrategy
 
-@pytest.fixture
-def market_data():
-    """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=100)
-    data = {
-        "open": np.random.uniform(95, 105, size=100),
-        "high": np.random.uniform(100, 110, size=100),
-        "low": np.random.uniform(90, 100, size=100),
-        "close": np.random.uniform(98, 108, size=100),
-        "volume": np.random.uniform(10000, 50000, size=100),
-    }
-    return pd.DataFrame(data, index=dates)
-
-
-import json
-
-def test_ichimoku_cloud_strategy_init_defaults():
+# Known dataset for test_ichimoku_signal_correctness: a steady uptrend, built once at import
+_KNOWN_CLOSE = np.linspace(100, 150, 60)
+KNOWN_TREND_DATA = pd.DataFrame(
+    {"close": _KNOWN_CLOSE, "high": _KNOWN_CLOSE * 1.01, "low": _KNOWN_CLOSE * 0.99},
+    index=pd.date_range(start="2023-01-01", periods=len(_KNOWN_CLOSE))
+)
+
+def test_ichimoku_cloud_strategy_init_defaults(frozen_config):
     """Test IchimokuCloudStrategy initialization with default parameters."""
     strategy = IchimokuCloudStrategy(name="IchimokuCloud_default")
-    with open('config/config.json', 'r') as f:
-        config = json.load(f)
-    defaults = config['strategy_defaults']['IchimokuCloudStrategy']
+    defaults = frozen_config['strategy_defaults']['IchimokuCloudStrategy']
 
     assert strategy.name == "IchimokuCloud_default"
     assert strategy.tenkan_period == defaults['tenkan_period']
@@ -50,17 +39,28 @@ def test_ichimoku_cloud_strategy_init_custom():
     assert strategy.displacement == 30
 
 
-def test_ichimoku_cloud_strategy_process_data(market_data):
+@pytest.fixture(scope="module")
+def ichimoku_signals(market_data_100):
+    """Fixture for default Ichimoku signals on the sample market data, computed once per module."""
+    return IchimokuCloudStrategy(name="IchimokuCloud").process_data(market_data_100)
+
+
+def test_ichimoku_cloud_strategy_process_data(ichimoku_signals):
     """Test IchimokuCloudStrategy signal generation."""
-    strategy = IchimokuCloudStrategy(name="IchimokuCloud")
-    signals = strategy.process_data(market_data)
-    assert isinstance(signals, pd.DataFrame)
-    assert "signal" in signals.columns
-    assert "tenkan_sen" in signals.columns
-    assert "kijun_sen" in signals.columns
-    assert "senkou_span_a" in signals.columns
-    assert "senkou_span_b" in signals.columns
-    assert "chikou_span" in signals.columns
+    assert isinstance(ichimoku_signals, pd.DataFrame)
+    assert "signal" in ichimoku_signals.columns
+    assert "tenkan_sen" in ichimoku_signals.columns
+    assert "kijun_sen" in ichimoku_signals.columns
+    assert "senkou_span_a" in ichimoku_signals.columns
+    assert "senkou_span_b" in ichimoku_signals.columns
+    assert "chikou_span" in ichimoku_signals.columns
+
+
+def test_ichimoku_chikou_span_lags_close(ichimoku_signals, market_data_100):
+    """Test that the Chikou span is the close shifted back by the displacement."""
+    pd.testing.assert_series_equal(
+        ichimoku_signals["chikou_span"], market_data_100["close"].shift(-26), check_names=False
+    )
 
 
 def test_ichimoku_cloud_strategy_process_empty_data():
@@ -72,13 +72,6 @@ def test_ichimoku_cloud_strategy_process_empty_data():
 
 def test_ichimoku_signal_correctness():
     """Test Ichimoku Cloud signal correctness with a known dataset."""
-    # Create a dataset with a clear bullish crossover
-    close_prices = np.linspace(100, 150, 60)
-    high_prices = close_prices * 1.01
-    low_prices = close_prices * 0.99
-    dates = pd.date_range(start="2023-01-01", periods=len(close_prices))
-    data = pd.DataFrame({"close": close_prices, "high": high_prices, "low": low_prices}, index=dates)
-
     strategy = IchimokuCloudStrategy(
         name="Ichimoku_test",
         parameters={
@@ -89,10 +82,72 @@ def test_ichimoku_signal_correctness():
         }
     )
 
-    signals = strategy.process_data(data)
+    signals = strategy.process_data(KNOWN_TREND_DATA)
 
     # Find the first point where Tenkan-sen crosses above Kijun-sen
     buy_signal_day = signals[(signals['tenkan_sen'] > signals['kijun_sen']) & (signals['tenkan_sen'].shift(1) <= signals['kijun_sen'].shift(1))].index
 
     if not buy_signal_day.empty:
         assert signals.loc[buy_signal_day[0]]['signal'] == 1
+
+
+@pytest.mark.parametrize("displacement", [26, 0, -5])
+def test_ichimoku_kernel_matches_pandas(market_data, mocker, displacement):
+    """Test that the compiled Ichimoku lines match the pandas rolling implementation."""
+    from strategies import ichimoku_cloud_strategy as module
+
+    data = market_data.copy()
+    data.iloc[40, data.columns.get_loc("high")] = np.nan
+    strategy = IchimokuCloudStrategy(name="IchimokuCloud", parameters={"displacement": displacement})
+
+    mocker.patch.object(module, "NUMBA_AVAILABLE", True)
+    compiled = strategy._calculate_ichimoku_components(data)
+    mocker.patch.object(module, "NUMBA_AVAILABLE", False)
+    expected = strategy._calculate_ichimoku_components(data)
+
+    for key, values in expected.items():
+        pd.testing.assert_series_equal(compiled[key], values, check_names=False)
+
+
+def test_ichimoku_signal_dtypes(market_data):
+    """Test that signal columns are stored as narrow integers."""
+    strategy = IchimokuCloudStrategy(
+        name="IchimokuCloud",
+        parameters={"tenkan_period": 2, "kijun_period": 3, "senkou_b_period": 5, "displacement": 2}
+    )
+    signals = strategy.process_data(market_data)
+
+    assert signals["signal"].dtype == np.int8
+    assert signals["binary_signal"].dtype == np.int8
+    assert set(signals["signal"].unique()) <= {-1, 0, 1}
+    np.testing.assert_array_equal(signals["binary_signal"], signals["signal"] > 0)
+
+
+@pytest.mark.parametrize("split", [0, 80])
+def test_ichimoku_incremental_matches_process_data(market_data, split):
+    """Test that bar-by-bar updates reproduce the batch lines and signals."""
+    parameters = {"tenkan_period": 3, "kijun_period": 5, "senkou_b_period": 8, "displacement": 4}
+    data = market_data.copy()
+    data.iloc[20, data.columns.get_loc("high")] = np.nan
+
+    expected = IchimokuCloudStrategy(name="IchimokuCloud", parameters=parameters).process_data(data)
+
+    strategy = IchimokuCloudStrategy(name="IchimokuCloud", parameters=parameters)
+    if split:
+        strategy.process_data(data.iloc[:split])
+    updates = pd.DataFrame(
+        [strategy.process_incremental(bar) for bar in data.iloc[split:].to_dict("records")],
+        index=data.index[split:]
+    )
+
+    for column in ("tenkan_sen", "kijun_sen", "senkou_span_a", "senkou_span_b"):
+        np.testing.assert_array_equal(updates[column], expected[column].iloc[split:])
+    np.testing.assert_array_equal(updates["signal"], expected["signal"].iloc[split:])
+    np.testing.assert_array_equal(updates["binary_signal"], expected["binary_signal"].iloc[split:])
+
+
+def test_ichimoku_incremental_rejects_negative_displacement():
+    """Test that incremental updates refuse look-ahead displacements."""
+    strategy = IchimokuCloudStrategy(name="IchimokuCloud", parameters={"displacement": -2})
+    with pytest.raises(ValueError):
+        strategy.process_incremental({"high": 1.0, "low": 0.5, "close": 0.8})
@@ -4,28 +4,19 @@ import numpy as np
 
 from strategies.macd_strategy import MACDStrategy
 
-@pytest.fixture
-def market_data():
-    """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=100)
-    data = {
-        "open": np.random.uniform(95, 105, size=100),
-        "high": np.random.uniform(100, 110, size=100),
-        "low": np.random.uniform(90, 100, size=100),
-        "close": np.random.uniform(98, 108, size=100),
-        "volume": np.random.uniform(10000, 50000, size=100),
-    }
-    return pd.DataFrame(data, index=dates)
-
-
-import json
-
-def test_macd_strategy_init_defaults():
+# Known dataset for test_macd_signal_correctness: a rise then a fall, built once at import
+KNOWN_CLOSE_DATA = pd.DataFrame(
+    {"close": [
+        100, 101, 102, 103, 104, 105, 106, 107, 108, 109,
+        110, 109, 108, 107, 106, 105, 104, 103, 102, 101
+    ]},
+    index=pd.date_range(start="2023-01-01", periods=20)
+)
+
+def test_macd_strategy_init_defaults(frozen_config):
     """Test MACDStrategy initialization with default parameters."""
     strategy = MACDStrategy(name="MACD_default")
-    with open('config/config.json', 'r') as f:
-        config = json.load(f)
-    defaults = config['strategy_defaults']['MACDStrategy']
+    defaults = frozen_config['strategy_defaults']['MACDStrategy']
 
     assert strategy.name == "MACD_default"
     assert strategy.fast_period == defaults['fast_period']
@@ -43,37 +34,46 @@ def test_macd_strategy_init_custom():
     assert strategy.signal_period == 5
 
 
-def test_macd_strategy_process_data(market_data):
-    """Test MACDStrategy signal generation."""
+@pytest.fixture(scope="module")
+def macd_signals(close_only_market_data):
+    """Fixture for MACD(12, 26, 9) signals on the sample market data, computed once per module."""
     strategy = MACDStrategy(name="MACD", parameters={"fast_period": 12, "slow_period": 26, "signal_period": 9})
-    signals = strategy.process_data(market_data)
-    assert isinstance(signals, pd.DataFrame)
-    assert "signal" in signals.columns
-    assert "macd_line" in signals.columns
-    assert "signal_line" in signals.columns
-    assert "histogram" in signals.columns
-    assert not signals["signal"].empty
+    return strategy.process_data(close_only_market_data)
+
+
+def test_macd_strategy_process_data(macd_signals):
+    """Test MACDStrategy signal generation."""
+    assert isinstance(macd_signals, pd.DataFrame)
+    assert "signal" in macd_signals.columns
+    assert "macd_line" in macd_signals.columns
+    assert "signal_line" in macd_signals.columns
+    assert "histogram" in macd_signals.columns
+    assert not macd_signals["signal"].empty
+
+
+def test_macd_histogram_and_signal_values(macd_signals):
+    """Test that the histogram is the MACD/signal line spread and signals stay in {-1, 0, 1}."""
+    np.testing.assert_array_equal(
+        macd_signals["histogram"], macd_signals["macd_line"] - macd_signals["signal_line"]
+    )
+    assert set(macd_signals["signal"].unique()) <= {-1, 0, 1}
 
 def test_macd_signal_correctness():
     """Test MACD signal correctness with a known dataset."""
-    close_prices = [
-        100, 101, 102, 103, 104, 105, 106, 107, 108, 109,
-        110, 109, 108, 107, 106, 105, 104, 103, 102, 101
-    ]
-    dates = pd.date_range(start="2023-01-01", periods=len(close_prices))
-    data = pd.DataFrame({"close": close_prices}, index=dates)
-
     strategy = MACDStrategy(name="MACD_test", parameters={"fast_period": 5, "slow_period": 10, "signal_period": 4})
-    signals = strategy.process_data(data)
+    signals = strategy.process_data(KNOWN_CLOSE_DATA)
 
-    # Check for a crossover event
-    # Find the first point where MACD is above the signal line
-    buy_signal_day = signals[(signals['macd_line'] > signals['signal_line'])].index[0]
-    # Find the first point where MACD is below the signal line after the buy signal
-    sell_signal_day = signals[(signals.index > buy_signal_day) & (signals['macd_line'] < signals['signal_line'])].index[0]
+    # Check for a crossover event: one pass over the sign of the MACD/signal spread,
+    # where step k -> k + 1 moving up is a bullish cross and moving down a bearish one
+    crosses = np.diff(np.sign(signals['macd_line'].to_numpy() - signals['signal_line'].to_numpy()))
+    assert (crosses > 0).any()
+    buy_signal_bar = np.argmax(crosses > 0) + 1
+    # First bearish cross after the buy signal
+    assert (crosses[buy_signal_bar:] < 0).any()
+    sell_signal_bar = buy_signal_bar + np.argmax(crosses[buy_signal_bar:] < 0) + 1
 
-    assert signals.loc[buy_signal_day]['signal'] == 1
-    assert signals.loc[sell_signal_day]['signal'] == -1
+    assert signals['signal'].iloc[buy_signal_bar] == 1
+    assert signals['signal'].iloc[sell_signal_bar] == -1
 
 
 def test_macd_strategy_process_empty_data():
@@ -81,3 +81,26 @@ def test_macd_strategy_process_empty_data():
     strategy = MACDStrategy(name="MACD")
     signals = strategy.process_data(pd.DataFrame())
     assert signals.empty
+
+
+@pytest.mark.parametrize("periods", [(12, 26, 9), (5, 35, 5), (1, 2, 1)])
+def test_macd_kernel_matches_pandas(close_only_market_data, mocker, periods):
+    """Test that the compiled MACD lines match the pandas EWM implementation."""
+    from strategies import macd_strategy as module
+
+    data = close_only_market_data.copy()
+    data.iloc[:2, data.columns.get_loc("close")] = np.nan
+    data.iloc[40:43, data.columns.get_loc("close")] = np.nan
+    fast_period, slow_period, signal_period = periods
+    strategy = MACDStrategy(name="MACD", parameters={
+        "fast_period": fast_period, "slow_period": slow_period, "signal_period": signal_period
+    })
+
+    mocker.patch.object(module, "NUMBA_AVAILABLE", True)
+    compiled = strategy.process_data(data)
+    mocker.patch.object(module, "NUMBA_AVAILABLE", False)
+    expected = strategy.process_data(data)
+
+    for column in ("macd_line", "signal_line", "histogram"):
+        np.testing.assert_allclose(compiled[column], expected[column], rtol=1e-12, atol=1e-12)
+    pd.testing.assert_series_equal(compiled["signal"], expected["signal"])
@@ -7,12 +7,13 @@ from reports.performance_metrics import (
     calculate_sortino_ratio,
     calculate_max_drawdown,
     calculate_profit_factor,
+    calculate_all_metrics,
 )
 
 @pytest.fixture
 def returns_data():
     """Fixture for sample returns data."""
-    returns = np.random.normal(0.001, 0.02, 252)
+    returns = np.random.default_rng(42).normal(0.001, 0.02, 252)
     return pd.Series(returns)
 
 def test_calculate_sharpe_ratio(returns_data):
@@ -36,3 +37,100 @@ def test_calculate_profit_factor(returns_data):
     profit_factor = calculate_profit_factor(returns_data)
     assert isinstance(profit_factor, float)
     assert profit_factor >= 0
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_calculate_all_metrics_matches_individual(returns_data, use_numba, mocker):
+    """Test that the fused metrics agree with the individual metric functions."""
+    if not use_numba:
+        mocker.patch("reports.performance_metrics.NUMBA_AVAILABLE", False)
+    metrics = calculate_all_metrics(returns_data)
+    assert metrics["sharpe_ratio"] == pytest.approx(calculate_sharpe_ratio(returns_data))
+    assert metrics["sortino_ratio"] == pytest.approx(calculate_sortino_ratio(returns_data))
+    assert metrics["max_drawdown"] == pytest.approx(calculate_max_drawdown(returns_data))
+    assert metrics["profit_factor"] == pytest.approx(calculate_profit_factor(returns_data))
+
+def test_calculate_all_metrics_edge_cases():
+    """Test that the fused metrics handle constant and loss-free returns like the individual ones."""
+    flat = pd.Series([0.01, 0.01, 0.01])
+    metrics = calculate_all_metrics(flat)
+    assert np.isnan(metrics["sortino_ratio"]) and np.isnan(calculate_sortino_ratio(flat))
+    assert metrics["profit_factor"] == np.inf
+    assert metrics["max_drawdown"] == 0.0
+
+    falling = pd.Series([-0.02, 0.01, -0.03])
+    assert calculate_all_metrics(falling)["max_drawdown"] == pytest.approx(calculate_max_drawdown(falling))
+
+@pytest.mark.parametrize("use_numba", [True, False])
+@pytest.mark.parametrize("values,expected", [
+    ([np.nan, -0.01, 0.02], 0.0),
+    ([np.nan, np.nan, 0.02, -0.01], -0.01),
+    ([0.01, np.nan, -0.02, np.nan], -0.02),
+])
+def test_max_drawdown_with_nan_returns(values, expected, use_numba, mocker):
+    """Test that NaN returns, leading ones included, are skipped the same way on every path."""
+    if not use_numba:
+        mocker.patch("reports.performance_metrics.NUMBA_AVAILABLE", False)
+    returns = pd.Series(values)
+    # Reference: the pandas cumprod / expanding max formulation
+    cumulative = (1 + returns).cumprod()
+    reference = ((cumulative - cumulative.expanding(min_periods=1).max()) / cumulative.expanding(min_periods=1).max()).min()
+
+    assert calculate_max_drawdown(returns) == pytest.approx(expected)
+    assert calculate_max_drawdown(returns) == pytest.approx(reference)
+    assert calculate_all_metrics(returns)["max_drawdown"] == pytest.approx(expected)
+    np.testing.assert_allclose(calculate_max_drawdown(np.array([values, values])), [expected, expected])
+
+def test_calculate_profit_factor_known_values():
+    """Test profit factor on a hand-computed example."""
+    returns = pd.Series([0.02, -0.01, 0.03, -0.04, np.nan])
+    assert calculate_profit_factor(returns) == pytest.approx(0.05 / 0.05)
+    assert calculate_profit_factor(np.array([0.01, 0.02])) == np.inf
+
+def test_metrics_on_degenerate_returns_do_not_warn():
+    """Test that constant, empty and single-value returns give inf/NaN without warnings."""
+    import warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert calculate_sharpe_ratio(pd.Series([0.01, 0.01, 0.01])) == np.inf
+        assert calculate_sharpe_ratio(pd.Series([-0.01, -0.01])) == -np.inf
+        assert np.isnan(calculate_sharpe_ratio(pd.Series([0.01])))
+        assert calculate_sortino_ratio(pd.Series([0.02, -0.01, -0.01])) == np.inf
+        assert np.isnan(calculate_sortino_ratio(pd.Series([], dtype=float)))
+        assert calculate_profit_factor(pd.Series([], dtype=float)) == np.inf
+
+def test_metrics_batched_over_strategies():
+    """Test that a (strategies, time) matrix gives the same values as per-strategy calls."""
+    returns_matrix = np.random.default_rng(42).normal(0.001, 0.02, size=(3, 100))
+
+    for metric in (calculate_sharpe_ratio, calculate_sortino_ratio, calculate_max_drawdown, calculate_profit_factor):
+        batched = metric(returns_matrix)
+        assert batched.shape == (3,)
+        expected = [metric(pd.Series(row)) for row in returns_matrix]
+        np.testing.assert_allclose(batched, expected)
+        np.testing.assert_allclose(metric(returns_matrix.T, axis=0), expected)
+
+def test_metrics_dataframe_per_column():
+    """Test that a (time, strategies) DataFrame still gives one value per column."""
+    returns_frame = pd.DataFrame(np.random.default_rng(7).normal(0.001, 0.02, size=(50, 3)),
+                                 columns=["a", "b", "c"])
+
+    # Column-wise pandas formulas, as the metrics were computed before the array rewrite
+    cumulative = (1 + returns_frame).cumprod()
+    np.testing.assert_allclose(calculate_sharpe_ratio(returns_frame),
+                               returns_frame.mean() / returns_frame.std())
+    np.testing.assert_allclose(calculate_max_drawdown(returns_frame),
+                               ((cumulative - cumulative.cummax()) / cumulative.cummax()).min())
+
+    for metric in (calculate_sharpe_ratio, calculate_sortino_ratio, calculate_max_drawdown, calculate_profit_factor):
+        result = metric(returns_frame)
+        assert result.shape == (3,)
+        np.testing.assert_allclose(result, [metric(returns_frame[column]) for column in returns_frame])
+
+def test_metrics_float32_opt_in():
+    """Test that float32 working precision stays close to the float64 results."""
+    returns = np.random.default_rng(42).normal(0.001, 0.02, size=5000)
+
+    for metric in (calculate_sharpe_ratio, calculate_sortino_ratio, calculate_profit_factor):
+        result = metric(returns, dtype=np.float32)
+        assert result.dtype == np.float32
+        assert result == pytest.approx(metric(returns), rel=1e-4)
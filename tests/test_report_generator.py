@@ -1,35 +1,45 @@
+import importlib.util
+
 import pytest
 import pandas as pd
 import os
 from unittest.mock import patch, MagicMock
 
+from reports import report_generator
 from reports.report_generator import ReportGenerator
 
+# ReportGenerator imports matplotlib only when it draws, so just the plotting
+# tests need it; find_spec checks for it without importing it at collection
+requires_matplotlib = pytest.mark.skipif(
+    importlib.util.find_spec("matplotlib") is None, reason="matplotlib is not installed"
+)
+
 @pytest.fixture
-def sample_market_data():
+def sample_market_data(sample_dates):
     """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=10)
+    dates = sample_dates(10)
     return pd.DataFrame({
         "close": [100 + i for i in range(10)]
     }, index=dates)
 
 @pytest.fixture
-def sample_strategy_signals():
+def sample_strategy_signals(sample_dates):
     """Fixture for sample strategy signals."""
-    dates = pd.date_range(start="2023-01-01", periods=10)
+    dates = sample_dates(10)
     signals1 = pd.DataFrame({
         "signal": [0.8, 0.6, 0.4, 0.2, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9],
         "binary_signal": [1, 1, 0, 0, 0, 0, 0, 1, 1, 1],
-        "strategy": ["MACD"] * 10,
-        "weight": [1.0] * 10,
-        "signal_type": ["trend_following"] * 10
+        # Constant columns are broadcast from scalars
+        "strategy": "MACD",
+        "weight": 1.0,
+        "signal_type": "trend_following"
     }, index=dates)
     return [signals1]
 
 @pytest.fixture
-def sample_aggregated_signal():
+def sample_aggregated_signal(sample_dates):
     """Fixture for sample aggregated signal."""
-    dates = pd.date_range(start="2023-01-01", periods=10)
+    dates = sample_dates(10)
     return pd.DataFrame({
         "signal": [0.4, 0.3, 0.2, 0.1, 0.0, 0.05, 0.15, 0.25, 0.35, 0.45],
         "binary_signal": [0, 0, 0, 0, 0, 0, 0, 1, 1, 1]
@@ -40,17 +50,31 @@ def sample_strategy_metadata():
     """Fixture for sample strategy metadata."""
     return [{"strategy_name": "MACD", "weight": 1.0, "num_trades": 5}]
 
-def test_report_generator_init(tmpdir):
+@pytest.fixture(autouse=True)
+def empty_plot_cache():
+    """Fixture clearing the module-level plot cache so each test renders its own plots."""
+    report_generator._plot_cache.clear()
+    yield
+    report_generator._plot_cache.clear()
+
+@pytest.fixture(scope="module")
+def report_dir(tmp_path_factory):
+    """Fixture for a report output directory shared by this module's tests, created once."""
+    # Each test writes under distinct or timestamped names and reads its files back right away
+    return str(tmp_path_factory.mktemp("reports"))
+
+def test_report_generator_init(report_dir):
     """Test ReportGenerator initialization."""
-    config = {"output_dir": str(tmpdir)}
+    config = {"output_dir": report_dir}
     generator = ReportGenerator(config)
-    assert generator.output_dir == str(tmpdir)
-    assert os.path.exists(str(tmpdir))
+    assert generator.output_dir == report_dir
+    assert os.path.exists(report_dir)
 
-@patch("matplotlib.pyplot.savefig")
-def test_generate_html_report(mock_savefig, tmpdir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, sample_strategy_metadata):
+@requires_matplotlib
+@patch("matplotlib.figure.Figure")
+def test_generate_html_report(mock_figure, report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, sample_strategy_metadata):
     """Test HTML report generation."""
-    config = {"output_dir": str(tmpdir), "format": "html", "include_plots": True}
+    config = {"output_dir": report_dir, "format": "html", "include_plots": True}
     generator = ReportGenerator(config)
     report_path = generator.generate_report(
         market_data=sample_market_data,
@@ -64,12 +88,13 @@ def test_generate_html_report(mock_savefig, tmpdir, sample_market_data, sample_s
         content = f.read()
     assert "<h1>Trading Strategy Report</h1>" in content
     assert "<h2>Strategy Summary</h2>" in content
-    assert mock_savefig.called
+    assert mock_figure.return_value.savefig.called
 
-@patch("matplotlib.pyplot.savefig")
-def test_generate_csv_report(mock_savefig, tmpdir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, sample_strategy_metadata):
+@requires_matplotlib
+@patch("matplotlib.figure.Figure.savefig")
+def test_generate_csv_report(mock_savefig, report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, sample_strategy_metadata):
     """Test CSV report generation."""
-    config = {"output_dir": str(tmpdir), "format": "csv", "include_plots": False}
+    config = {"output_dir": report_dir, "format": "csv", "include_plots": False}
     generator = ReportGenerator(config)
     report_path = generator.generate_report(
         market_data=sample_market_data,
@@ -83,3 +108,113 @@ def test_generate_csv_report(mock_savefig, tmpdir, sample_market_data, sample_st
     assert "aggregated_signal" in df.columns
     assert "MACD_signal" in df.columns
     assert not mock_savefig.called
+
+def test_write_csv_matches_pandas_format(report_dir, sample_market_data, sample_aggregated_signal):
+    """Test that the CSV writer keeps pandas' index header, date and number formatting."""
+    frame = sample_market_data.assign(
+        aggregated_signal=sample_aggregated_signal["signal"],
+        aggregated_binary=sample_aggregated_signal["binary_signal"].astype("int8")
+    )
+    path = os.path.join(report_dir, "format_check.csv")
+    ReportGenerator._write_csv(frame, path)
+    with open(path, "r", newline="") as f:
+        content = f.read()
+    assert content == frame.to_csv()
+    assert content.startswith(",close,aggregated_signal,aggregated_binary\n2023-01-01,100,0.4,0\n")
+
+@requires_matplotlib
+@patch("matplotlib.figure.Figure")
+def test_html_report_embeds_generated_plots(mock_figure, report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, sample_strategy_metadata):
+    """Test that the HTML report links exactly the plots generated for it."""
+    for include_plots, expected_images in ((True, 2), (False, 0)):
+        config = {"output_dir": report_dir, "format": "html", "include_plots": include_plots}
+        report_path = ReportGenerator(config).generate_report(
+            market_data=sample_market_data,
+            strategy_signals=sample_strategy_signals,
+            aggregated_signal=sample_aggregated_signal,
+            strategy_metadata=sample_strategy_metadata
+        )
+        with open(report_path, "r") as f:
+            content = f.read()
+        assert content.count("<img src='plots/") == expected_images
+
+@requires_matplotlib
+@pytest.mark.slow
+def test_generate_plots_without_index_frequency(report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal):
+    """Test that the price chart is produced for an index without a fixed frequency."""
+    dates = sample_market_data.index.delete(3)
+    generator = ReportGenerator({"output_dir": report_dir})
+    plot_paths = generator._generate_plots(
+        sample_market_data.loc[dates],
+        [signals.loc[dates] for signals in sample_strategy_signals],
+        sample_aggregated_signal.loc[dates],
+        "report"
+    )
+    assert [os.path.basename(path) for path in plot_paths] == ["report_price_signals.png", "report_strategy_signals.png"]
+    assert all(os.path.exists(path) for path in plot_paths)
+
+@requires_matplotlib
+@pytest.mark.slow
+def test_generate_plots_reuses_identical_plots(report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal):
+    """Test that re-plotting identical data copies the existing files instead of redrawing."""
+    generator = ReportGenerator({"output_dir": report_dir})
+    first = generator._generate_plots(sample_market_data, sample_strategy_signals, sample_aggregated_signal, "first")
+
+    with patch("matplotlib.figure.Figure.savefig") as mock_savefig:
+        second = generator._generate_plots(sample_market_data, sample_strategy_signals, sample_aggregated_signal, "second")
+        assert not mock_savefig.called
+    assert [os.path.basename(path) for path in second] == ["second_price_signals.png", "second_strategy_signals.png"]
+    for first_path, second_path in zip(first, second):
+        with open(first_path, "rb") as f1, open(second_path, "rb") as f2:
+            assert f1.read() == f2.read()
+
+    changed = sample_aggregated_signal.assign(signal=sample_aggregated_signal["signal"] * 2)
+    with patch("matplotlib.figure.Figure.savefig") as mock_savefig:
+        generator._generate_plots(sample_market_data, sample_strategy_signals, changed, "third")
+        assert mock_savefig.call_count == 2
+
+@requires_matplotlib
+@pytest.mark.slow
+def test_plot_cache_shared_across_generators(report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal):
+    """Test that a new ReportGenerator reuses plots rendered by an earlier one."""
+    ReportGenerator({"output_dir": report_dir})._generate_plots(
+        sample_market_data, sample_strategy_signals, sample_aggregated_signal, "shared_first"
+    )
+    with patch("matplotlib.figure.Figure.savefig") as mock_savefig:
+        paths = ReportGenerator({"output_dir": report_dir})._generate_plots(
+            sample_market_data, sample_strategy_signals, sample_aggregated_signal, "shared_second"
+        )
+        assert not mock_savefig.called
+    assert all(os.path.exists(path) for path in paths)
+
+def test_plot_cache_skips_partial_failures(report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, mocker):
+    """Test that a plot set with a failed chart is not cached."""
+    mocker.patch.object(ReportGenerator, "_plot_price_chart", return_value=None)
+    mocker.patch.object(ReportGenerator, "_plot_strategy_signals", side_effect=lambda signals, aggregated, path: path)
+    generator = ReportGenerator({"output_dir": report_dir})
+    assert len(generator._generate_plots(sample_market_data, sample_strategy_signals, sample_aggregated_signal, "partial")) == 1
+    assert not report_generator._plot_cache
+
+@requires_matplotlib
+@patch("matplotlib.figure.Figure.savefig")
+def test_html_report_without_signal_type(mock_savefig, report_dir, sample_market_data, sample_strategy_signals, sample_aggregated_signal, sample_strategy_metadata):
+    """Test that signals without a signal_type column report the type as Unknown."""
+    signals = [s.drop(columns=["signal_type"]) for s in sample_strategy_signals]
+    generator = ReportGenerator({"output_dir": report_dir, "format": "html", "include_plots": False})
+    report_path = generator.generate_report(
+        market_data=sample_market_data,
+        strategy_signals=signals,
+        aggregated_signal=sample_aggregated_signal,
+        strategy_metadata=sample_strategy_metadata
+    )
+    assert report_path
+    with open(report_path, "r") as f:
+        assert "<tr><td>MACD</td><td>Unknown</td>" in f.read()
+
+@pytest.mark.slow
+def test_report_generator_import_skips_matplotlib():
+    """Test that importing the report generator does not import matplotlib."""
+    import subprocess
+    import sys
+    code = "import sys, reports.report_generator; sys.exit('matplotlib' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
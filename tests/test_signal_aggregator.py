@@ -4,10 +4,10 @@ import numpy as np
 
 from aggregator.signal_aggregator import SignalAggregator
 
-@pytest.fixture
-def sample_signals():
-    """Fixture for a list of sample signal DataFrames."""
-    dates = pd.date_range(start="2023-01-01", periods=5)
+@pytest.fixture(scope="module")
+def sample_signals(sample_dates):
+    """Fixture for a list of sample signal DataFrames, shared read-only by this module's tests."""
+    dates = sample_dates(5)
     signals1 = pd.DataFrame({
         "signal": [0.8, 0.6, 0.4, 0.2, 0.0],
         "binary_signal": [1, 1, 0, 0, 0],
@@ -27,38 +27,32 @@ def test_signal_aggregator_init():
     assert aggregator.method == "weighted_average"
     assert aggregator.threshold == 0.6
 
-def test_weighted_average_aggregation(sample_signals):
-    """Test weighted_average aggregation method."""
-    aggregator = SignalAggregator(config={"method": "weighted_average"})
-    aggregated = aggregator.aggregate(sample_signals)
+@pytest.mark.parametrize("config,binary_signals,column,expected", [
+    # Weighted mean per bar, e.g. the first: (0.8 * 1.0 + 0.1 * 0.5) / (1.0 + 0.5) = 0.85 / 1.5 = 0.5666...
+    ({"method": "weighted_average"}, None, "signal",
+     [0.85 / 1.5, 0.75 / 1.5, 0.65 / 1.5, 0.55 / 1.5, 0.45 / 1.5]),
+    # Weighted vote above the threshold, e.g. the first: (1 * 1.0 + 0 * 0.5) / 1.5 = 0.666... > 0.5 -> 1
+    # and the third: (0 * 1.0 + 1 * 0.5) / 1.5 = 0.333... < 0.5 -> 0
+    ({"method": "majority_vote", "threshold": 0.5}, None, "binary_signal", [1, 1, 0, 0, 0]),
+    # Buy and sell need every strategy to agree; disagreement gives 0.5
+    ({"method": "consensus"}, ([1, 0, 1, 0, 1], [1, 0, 0, 1, 1]), "binary_signal", [1.0, 0.0, 0.5, 0.5, 1.0]),
+])
+def test_aggregation_methods(sample_signals, config, binary_signals, column, expected):
+    """Test each aggregation method's output column against hand-computed values."""
+    if binary_signals is not None:
+        sample_signals = [
+            signals.assign(binary_signal=binary)
+            for signals, binary in zip(sample_signals, binary_signals)
+        ]
+    aggregated = SignalAggregator(config=config).aggregate(sample_signals)
     assert isinstance(aggregated, pd.DataFrame)
-    assert "signal" in aggregated.columns
-    # Manual calculation for the first element: (0.8 * 1.0 + 0.1 * 0.5) / (1.0 + 0.5) = 0.85 / 1.5 = 0.5666...
-    assert np.isclose(aggregated["signal"].iloc[0], 0.56666666)
-
-def test_majority_vote_aggregation(sample_signals):
-    """Test majority_vote aggregation method."""
-    aggregator = SignalAggregator(config={"method": "majority_vote", "threshold": 0.5})
-    aggregated = aggregator.aggregate(sample_signals)
-    assert isinstance(aggregated, pd.DataFrame)
-    assert "binary_signal" in aggregated.columns
-    # Manual calculation for the first element: (1 * 1.0 + 0 * 0.5) / (1.0 + 0.5) = 1.0 / 1.5 = 0.666... > 0.5 -> 1
-    assert aggregated["binary_signal"].iloc[0] == 1
-    # Manual calculation for the third element: (0 * 1.0 + 1 * 0.5) / (1.0 + 0.5) = 0.5 / 1.5 = 0.333... < 0.5 -> 0
-    assert aggregated["binary_signal"].iloc[2] == 0
+    assert column in aggregated.columns
+    expected = pd.Series(expected, index=sample_signals[0].index, name=column)
+    pd.testing.assert_series_equal(aggregated[column], expected, check_dtype=False, check_exact=False, rtol=1e-6)
 
 
-def test_consensus_aggregation(sample_signals):
-    """Test consensus aggregation method."""
-    aggregator = SignalAggregator(config={"method": "consensus"})
-    # Modify signals to have a consensus
-    sample_signals[0]["binary_signal"] = [1, 0, 1, 0, 1]
-    sample_signals[1]["binary_signal"] = [1, 0, 0, 1, 1]
-    aggregated = aggregator.aggregate(sample_signals)
-    assert isinstance(aggregated, pd.DataFrame)
-    assert "binary_signal" in aggregated.columns
-    assert aggregated["binary_signal"].iloc[0] == 1.0 # Consensus buy
-    assert aggregated["binary_signal"].iloc[1] == 0.0 # Consensus sell
-    assert aggregated["binary_signal"].iloc[2] == 0.5 # No consensus
-    assert aggregated["binary_signal"].iloc[3] == 0.5 # No consensus
-    assert aggregated["binary_signal"].iloc[4] == 1.0 # Consensus buy
+@pytest.mark.parametrize("method", ["weighted_average", "majority_vote"])
+def test_aggregated_binary_signal_is_int8(sample_signals, method):
+    """Test that thresholded binary signals are stored as int8."""
+    aggregated = SignalAggregator(config={"method": method}).aggregate(sample_signals)
+    assert aggregated["binary_signal"].dtype == np.int8
@@ -4,19 +4,11 @@ import numpy as np
 
 from strategies.moving_average_crossover import MovingAverageCrossover
 from strategies.rsi_strategy import RSIStrategy
+from utils.jit import NUMBA_AVAILABLE
 
-@pytest.fixture
-def market_data():
-    """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=100)
-    data = {
-        "open": np.random.uniform(95, 105, size=100),
-        "high": np.random.uniform(100, 110, size=100),
-        "low": np.random.uniform(90, 100, size=100),
-        "close": np.random.uniform(98, 108, size=100),
-        "volume": np.random.uniform(10000, 50000, size=100),
-    }
-    return pd.DataFrame(data, index=dates)
+def test_frozen_config_matches_config_file(frozen_config, strategy_defaults):
+    """Test that the in-memory test config mirrors the defaults in config/config.json."""
+    assert frozen_config["strategy_defaults"] == strategy_defaults
 
 
 def test_moving_average_crossover_init():
@@ -28,10 +20,10 @@ def test_moving_average_crossover_init():
     assert strategy.slow_period == 30
 
 
-def test_moving_average_crossover_process_data(market_data):
+def test_moving_average_crossover_process_data(close_only_market_data):
     """Test MovingAverageCrossover signal generation."""
     strategy = MovingAverageCrossover(name="MACrossover", parameters={"fast_period": 10, "slow_period": 30})
-    signals = strategy.process_data(market_data)
+    signals = strategy.process_data(close_only_market_data)
     assert isinstance(signals, pd.DataFrame)
     assert "signal" in signals.columns
     assert not signals["signal"].empty
@@ -47,11 +39,285 @@ def test_rsi_strategy_init():
     assert strategy.oversold == 30
 
 
-def test_rsi_strategy_process_data(market_data):
+def test_rsi_strategy_process_data(close_only_market_data):
     """Test RSIStrategy signal generation."""
     strategy = RSIStrategy(name="RSI", parameters={"period": 14})
-    signals = strategy.process_data(market_data)
+    signals = strategy.process_data(close_only_market_data)
     assert isinstance(signals, pd.DataFrame)
     assert "signal" in signals.columns
     assert "rsi" in signals.columns
     assert not signals["signal"].empty
+
+
+@pytest.mark.parametrize("period", [1, 14, 150])
+def test_rsi_kernel_matches_pandas(close_only_market_data, mocker, period):
+    """Test that the compiled RSI matches the pandas rolling-mean RSI."""
+    from strategies import rsi_strategy as module
+
+    data = close_only_market_data.copy()
+    data.iloc[30:35, data.columns.get_loc("close")] = 100.0
+    data.iloc[50, data.columns.get_loc("close")] = np.nan
+    strategy = RSIStrategy(name="RSI", parameters={"period": period})
+
+    mocker.patch.object(module, "NUMBA_AVAILABLE", True)
+    compiled = strategy.process_data(data)
+    mocker.patch.object(module, "NUMBA_AVAILABLE", False)
+    expected = strategy.process_data(data)
+
+    np.testing.assert_allclose(compiled["rsi"], expected["rsi"], rtol=1e-9)
+    pd.testing.assert_series_equal(compiled["signal"], expected["signal"])
+
+
+@pytest.mark.parametrize("fast_period,slow_period", [(20, 50), (5, 1), (1, 1)])
+def test_ma_kernel_matches_pandas(close_only_market_data, mocker, fast_period, slow_period):
+    """Test that the compiled MA crossover matches the pandas rolling means."""
+    from strategies import moving_average_crossover as module
+
+    data = close_only_market_data.copy()
+    data.iloc[30:80, data.columns.get_loc("close")] = 100.0
+    data.iloc[90, data.columns.get_loc("close")] = np.nan
+    strategy = MovingAverageCrossover(
+        name="MA", parameters={"fast_period": fast_period, "slow_period": slow_period}
+    )
+
+    mocker.patch.object(module, "NUMBA_AVAILABLE", True)
+    compiled = strategy.process_data(data)
+    mocker.patch.object(module, "NUMBA_AVAILABLE", False)
+    expected = strategy.process_data(data)
+
+    pd.testing.assert_series_equal(compiled["ma_diff"], expected["ma_diff"], check_exact=True)
+    pd.testing.assert_series_equal(compiled["signal"], expected["signal"])
+
+
+def test_factory_resolves_builtin_without_import(mocker):
+    """Test that built-in strategies are created from the cached registry."""
+    from strategies import strategy_factory
+
+    import_module = mocker.spy(strategy_factory.importlib, "import_module")
+    factory = strategy_factory.StrategyFactory()
+    strategy = factory.create_strategy("RSI", {"period": 10})
+
+    assert isinstance(strategy, RSIStrategy)
+    assert strategy.period == 10
+    assert factory.registered_strategies["RSI"] is RSIStrategy
+    assert import_module.call_count == 0
+    assert strategy_factory._load_registry() is strategy_factory._load_registry()
+
+
+def test_template_reuses_prototype(mocker, market_data):
+    """Test that templates copy a cached prototype for repeated parameter sets."""
+    from strategies.strategy_template import IndicatorBasedTemplate, PatternRecognitionTemplate
+
+    template = IndicatorBasedTemplate(MovingAverageCrossover, {"fast_period": 5, "slow_period": 15})
+    init = mocker.spy(MovingAverageCrossover, "__init__")
+    first = template.create_strategy("MA_proto", {"slow_period": 12})
+    second = template.create_strategy("MA_proto", {"slow_period": 12})
+
+    assert init.call_count <= 1
+    assert first is not second
+    assert second.slow_period == 12
+    assert first.parameters == second.parameters and first.parameters is not second.parameters
+    first.process_data(market_data)
+    assert second.metadata == {} and second.signals is None
+
+    # Unhashable parameter values skip the cache
+    from strategies.fibonacci_retracement_strategy import FibonacciRetracementStrategy
+    levels = PatternRecognitionTemplate(FibonacciRetracementStrategy).create_strategy(
+        "Fib", {"retracement_levels": [0.5, 0.618]}
+    )
+    assert levels.retracement_levels == [0.5, 0.618]
+
+
+def test_templates_use_slots():
+    """Test that template instances carry no per-instance __dict__."""
+    from strategies.strategy_factory import StrategyFactory
+
+    for template in StrategyFactory().get_strategy_templates().values():
+        assert not hasattr(template, "__dict__")
+        with pytest.raises(AttributeError):
+            template.unexpected = 1
+
+
+def test_all_strategies_emit_int8_signals(market_data):
+    """Test that every built-in strategy stores its signal columns as int8."""
+    from strategies.strategy_factory import StrategyFactory
+
+    factory = StrategyFactory()
+    factory.load_all_strategies()
+    for name in factory.registered_strategies:
+        signals = factory.create_strategy(name, {}).process_data(market_data)
+        assert signals["signal"].dtype == np.int8, name
+        assert signals["binary_signal"].dtype == np.int8, name
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("strategy_class,module_name", [
+    (MovingAverageCrossover, "moving_average_crossover"),
+    (RSIStrategy, "rsi_strategy"),
+    ("MACDStrategy", "macd_strategy"),
+])
+def test_process_batch_matches_process_data(mocker, strategy_class, module_name, compiled):
+    """Test that batch signals match running process_data on each symbol."""
+    import importlib
+
+    module = importlib.import_module(f"strategies.{module_name}")
+    if isinstance(strategy_class, str):
+        strategy_class = getattr(module, strategy_class)
+    mocker.patch.object(module, "NUMBA_AVAILABLE", compiled)
+
+    rng = np.random.default_rng(7)
+    dates = pd.date_range(start="2023-01-01", periods=120)
+    closes = pd.DataFrame(
+        100 + np.cumsum(rng.normal(0, 1, size=(120, 3)), axis=0),
+        index=dates, columns=["AAA", "BBB", "CCC"]
+    )
+    closes.iloc[40, 1] = np.nan
+    strategy = strategy_class(name="Batch", parameters={})
+
+    batch = strategy.process_batch(closes)
+    expected = pd.DataFrame({
+        symbol: strategy.process_data(closes[[symbol]].set_axis(["close"], axis=1))["signal"]
+        for symbol in closes.columns
+    })
+
+    assert batch.dtypes.eq(np.int8).all()
+    pd.testing.assert_frame_equal(batch, expected)
+
+
+def _batch_closes_frame():
+    """Three random-walk close series for the batch tests."""
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        100 + np.cumsum(rng.normal(0, 1, size=(120, 3)), axis=0),
+        index=pd.date_range(start="2023-01-01", periods=120), columns=["AAA", "BBB", "CCC"]
+    )
+
+def test_process_batch_close_based_default():
+    """Test the per-column default batch path with a close-based strategy that has no batch kernel."""
+    from strategies.bollinger_bands_strategy import BollingerBandsStrategy
+
+    closes = _batch_closes_frame()
+    closes.iloc[40, 1] = np.nan
+    strategy = BollingerBandsStrategy(name="Batch", parameters={"period": 10, "std_dev": 1.0})
+    batch = strategy.process_batch(closes)
+    for symbol in closes.columns:
+        expected = strategy.process_data(closes[[symbol]].set_axis(["close"], axis=1))["signal"]
+        pd.testing.assert_series_equal(batch[symbol], expected, check_names=False)
+
+@pytest.mark.parametrize("class_name,module_name", [
+    ("IchimokuCloudStrategy", "ichimoku_cloud_strategy"),
+    ("VolumeProfileStrategy", "volume_profile_strategy"),
+    ("FibonacciRetracementStrategy", "fibonacci_retracement_strategy"),
+])
+def test_process_batch_rejects_ohlcv_strategies(class_name, module_name):
+    """Test that strategies needing more than close prices refuse a close-only batch clearly."""
+    import importlib
+
+    strategy_class = getattr(importlib.import_module(f"strategies.{module_name}"), class_name)
+    strategy = strategy_class(name="Batch", parameters={})
+    assert set(strategy.required_columns()) > {"close"}
+    with pytest.raises(ValueError, match="close-only batch"):
+        strategy.process_batch(_batch_closes_frame())
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_rsi_float32_prices(close_only_market_data, mocker, compiled):
+    """Test that float32 prices give a float32 RSI close to the float64 one."""
+    from strategies import rsi_strategy as module
+
+    mocker.patch.object(module, "NUMBA_AVAILABLE", compiled)
+    strategy = RSIStrategy(name="RSI", parameters={"period": 14})
+    expected = strategy.process_data(close_only_market_data)
+    result = strategy.process_data(close_only_market_data.astype(np.float32))
+
+    assert result["rsi"].dtype == np.float32
+    np.testing.assert_allclose(result["rsi"], expected["rsi"], rtol=1e-4)
+
+
+def test_all_strategies_use_categorical_strategy_column(market_data):
+    """Test that the constant strategy name column is stored as a one-category Categorical."""
+    from strategies.strategy_factory import StrategyFactory
+
+    factory = StrategyFactory()
+    factory.load_all_strategies()
+    for name in factory.registered_strategies:
+        signals = factory.create_strategy(name, {}).process_data(market_data)
+        assert isinstance(signals["strategy"].dtype, pd.CategoricalDtype), name
+        assert list(signals["strategy"].cat.categories) == [name]
+        assert signals["strategy"].iloc[0] == name
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+def test_kernels_compiled_eagerly(market_data):
+    """Test that strategy kernels keep exactly their declared signatures."""
+    from strategies._ma_kernel import ma_crossover_diff
+    from strategies._macd_kernel import macd
+    from strategies._rsi_kernel import rsi
+    from strategies.macd_strategy import MACDStrategy
+
+    kernels = {ma_crossover_diff: 1, macd: 1, rsi: 2}
+    for strategy in (MovingAverageCrossover("MA", {}), MACDStrategy("MACD", {}), RSIStrategy("RSI", {})):
+        strategy.process_data(market_data)
+        strategy.process_data(market_data.astype(np.float32))
+
+    for kernel, count in kernels.items():
+        assert len(kernel.signatures) == count
+        assert len(kernel.overloads) == count
+
+
+@pytest.mark.parametrize("shared_executor", [False, True])
+def test_factory_run_all_matches_sequential(market_data, shared_executor):
+    """Test that run_all returns the same signals as sequential process_data calls, in order."""
+    from concurrent.futures import ThreadPoolExecutor
+    from strategies.strategy_factory import StrategyFactory
+
+    executor = ThreadPoolExecutor(max_workers=4) if shared_executor else None
+    factory = StrategyFactory(executor=executor)
+    factory.load_all_strategies()
+    names = list(factory.registered_strategies)
+    strategies = [factory.create_strategy(name, {}) for name in names]
+
+    results = factory.run_all(strategies, market_data)
+    if executor is not None:
+        executor.shutdown()
+
+    assert len(results) == len(names)
+    for name, result in zip(names, results):
+        expected = factory.create_strategy(name, {}).process_data(market_data)
+        pd.testing.assert_frame_equal(result, expected)
+    assert factory.run_all([], market_data) == []
+
+
+@pytest.mark.slow
+def test_factory_run_all_concurrent_kernels_under_workqueue():
+    """Test that concurrent run_all calls survive Numba's non-threadsafe workqueue layer."""
+    import os
+    import subprocess
+    import sys
+
+    # In a subprocess, as a concurrent parallel launch would abort the whole interpreter
+    script = """
+import numpy as np, pandas as pd
+from strategies.strategy_factory import StrategyFactory
+from strategies.ichimoku_cloud_strategy import IchimokuCloudStrategy
+from strategies.rsi_strategy import RSIStrategy
+n = 4000
+close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n))
+data = pd.DataFrame({"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1e4},
+                    index=pd.date_range("2000-01-01", periods=n))
+strategies = [IchimokuCloudStrategy("Ichimoku_1", {}), IchimokuCloudStrategy("Ichimoku_2", {}), RSIStrategy("RSI", {})]
+factory = StrategyFactory()
+for _ in range(10):
+    results = factory.run_all(strategies, data)
+for strategy, result in zip(strategies, results):
+    pd.testing.assert_frame_equal(result, type(strategy)(strategy.name, {}).process_data(data))
+print("ok")
+"""
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True, text=True, env=env, timeout=600,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
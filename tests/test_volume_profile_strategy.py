@@ -4,28 +4,10 @@ import numpy as np
 
 from strategies.volume_profile_strategy import VolumeProfileStrategy
 
-@pytest.fixture
-def market_data():
-    """Fixture for sample market data."""
-    dates = pd.date_range(start="2023-01-01", periods=200)
-    data = {
-        "open": np.random.uniform(95, 105, size=200),
-        "high": np.random.uniform(100, 110, size=200),
-        "low": np.random.uniform(90, 100, size=200),
-        "close": np.random.uniform(98, 108, size=200),
-        "volume": np.random.uniform(10000, 50000, size=200),
-    }
-    return pd.DataFrame(data, index=dates)
-
-
-import json
-
-def test_volume_profile_strategy_init_defaults():
+def test_volume_profile_strategy_init_defaults(frozen_config):
     """Test VolumeProfileStrategy initialization with default parameters."""
     strategy = VolumeProfileStrategy(name="VolumeProfile_default")
-    with open('config/config.json', 'r') as f:
-        config = json.load(f)
-    defaults = config['strategy_defaults']['VolumeProfileStrategy']
+    defaults = frozen_config['strategy_defaults']['VolumeProfileStrategy']
 
     assert strategy.name == "VolumeProfile_default"
     assert strategy.num_bins == defaults['num_bins']
@@ -50,10 +32,20 @@ def test_volume_profile_strategy_init_custom():
     assert strategy.signal_lookback == 10
 
 
-def test_volume_profile_strategy_process_data(market_data):
+
+def test_volume_profile_strategy_partial_parameters():
+    """Test that missing parameters are filled in from the built-in defaults."""
+    params = {"num_bins": 12}
+    strategy = VolumeProfileStrategy(name="VolumeProfile_partial", parameters=params)
+    assert strategy.num_bins == 12
+    assert strategy.lookback_period == 100
+    assert strategy.parameters == {"num_bins": 12, "lookback_period": 100, "volume_threshold": 0.8, "signal_lookback": 5}
+    assert params == {"num_bins": 12}
+
+def test_volume_profile_strategy_process_data(market_data_200):
     """Test VolumeProfileStrategy signal generation."""
     strategy = VolumeProfileStrategy(name="VolumeProfile")
-    signals = strategy.process_data(market_data)
+    signals = strategy.process_data(market_data_200)
     assert isinstance(signals, pd.DataFrame)
     assert "signal" in signals.columns
 
@@ -107,3 +99,148 @@ def test_volume_profile_signal_correctness():
     # Check that the strategy runs without errors and returns the correct columns
     assert isinstance(signals, pd.DataFrame)
     assert "signal" in signals.columns
+
+
+def _reference_signals(data, num_bins, lookback_period, volume_threshold, signal_lookback):
+    """Per-window reference implementation of the Volume Profile signal rules."""
+    close = data["close"].to_numpy()
+    signal = np.zeros(len(data), dtype=np.int8)
+    for i in range(lookback_period, len(data)):
+        window = data.iloc[i - lookback_period:i]
+        price_min, price_max = window["low"].min(), window["high"].max()
+        if price_max - price_min < 0.001:
+            continue
+        bins = np.linspace(price_min, price_max, num_bins + 1)
+        profile = np.zeros(num_bins)
+        for price, volume in zip(window["close"], window["volume"]):
+            profile[min(max(0, np.digitize(price, bins) - 1), num_bins - 1)] += volume
+        if profile.sum() > 0:
+            profile = profile / profile.sum()
+        threshold = np.percentile(profile, volume_threshold * 100)
+        direction = 1 if close[i] > close[i - signal_lookback] else -1
+        for idx in np.where(profile >= threshold)[0]:
+            hvn_price = (bins[idx] + bins[idx + 1]) / 2
+            if abs(close[i] - hvn_price) / close[i] < 0.005:
+                if direction > 0 and close[i] < hvn_price:
+                    signal[i] = 1
+                elif direction < 0 and close[i] > hvn_price:
+                    signal[i] = -1
+    return signal
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compiled", [True, False])
+@pytest.mark.parametrize("block_size", [4096, 7])
+@pytest.mark.parametrize("parameters", [
+    {"num_bins": 20, "lookback_period": 100, "volume_threshold": 0.8, "signal_lookback": 5},
+    {"num_bins": 7, "lookback_period": 30, "volume_threshold": 0.5, "signal_lookback": 3},
+])
+def test_volume_profile_matches_reference(mocker, parameters, block_size, compiled):
+    """Test that the compiled and vectorized paths reproduce the per-window signal rules."""
+    from strategies import volume_profile_strategy as module
+
+    mocker.patch.object(module, "WINDOW_BLOCK_SIZE", block_size)
+    mocker.patch.object(module, "NUMBA_AVAILABLE", compiled)
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, size=300))
+    data = pd.DataFrame({
+        "high": close + rng.uniform(0.05, 1, size=300),
+        "low": close - rng.uniform(0.05, 1, size=300),
+        "close": close,
+        "volume": rng.uniform(10000, 50000, size=300),
+    }, index=pd.date_range(start="2023-01-01", periods=300))
+
+    signals = VolumeProfileStrategy(name="VolumeProfile", parameters=parameters).process_data(data)
+
+    expected = _reference_signals(data, **parameters)
+    assert (expected != 0).any()
+    np.testing.assert_array_equal(signals["signal"], expected)
+    np.testing.assert_array_equal(signals["binary_signal"], expected == 1)
+
+
+def test_close_bins_match_digitize():
+    """Test that rescaled bin indices agree with np.digitize at and around bin edges."""
+    rng = np.random.default_rng(5)
+    low = rng.uniform(0, 100, size=40)
+    high = low + rng.choice([1e-3, 0.1, 3.3, 1e6], size=40)
+    bins = np.linspace(low, high, 11, axis=1)
+    closes = np.concatenate([
+        bins[:, rng.integers(0, 11, size=6)],
+        np.nextafter(bins[:, 3:4], -np.inf),
+        rng.uniform(low[:, None] - 1, high[:, None] + 1, size=(40, 6)),
+        np.full((40, 1), np.nan),
+    ], axis=1)
+
+    strategy = VolumeProfileStrategy(name="VolumeProfile", parameters={"num_bins": 10})
+    expected = np.stack([np.clip(np.digitize(row, edges) - 1, 0, 9) for row, edges in zip(closes, bins)])
+    np.testing.assert_array_equal(strategy._close_bins(closes, bins), expected)
+
+
+@pytest.mark.parametrize("num_bins", [5, 20, 300])
+def test_vp_kernel_matches_vectorized(num_bins):
+    """Test that the kernel agrees with the vectorized path, NaN bars and wide profiles included."""
+    from strategies.volume_profile_strategy import _vp_kernel
+
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, size=400))
+    high = close + rng.uniform(0.05, 1, size=400)
+    low = close - rng.uniform(0.05, 1, size=400)
+    volume = rng.uniform(10000, 50000, size=400)
+    close[[50, 51, 200]] = np.nan
+    high[120] = np.nan
+    volume[300] = np.nan
+
+    strategy = VolumeProfileStrategy(name="VolumeProfile", parameters={
+        "num_bins": num_bins, "lookback_period": 40, "volume_threshold": 0.7, "signal_lookback": 60
+    })
+    buy, sell = strategy._find_hvn_signals(high, low, close, volume)
+    expected = buy.astype(np.int8) - sell.astype(np.int8)
+    np.testing.assert_array_equal(_vp_kernel(high, low, close, volume, 40, num_bins, 0.7, 60), expected)
+
+
+def test_volume_profile_win_rate_metrics():
+    """Test that win rate counts signals followed by a move in their direction."""
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 0.3, size=300))
+    data = pd.DataFrame({"close": close}, index=pd.date_range(start="2023-01-01", periods=300))
+    signal = rng.choice(np.array([-1, 0, 1], dtype=np.int8), size=300)
+
+    strategy = VolumeProfileStrategy(name="VolumeProfile", parameters={"lookback_period": 30})
+    strategy._calculate_performance_metrics(data, signal)
+
+    wins = sum(
+        (signal[i] == 1 and close[i + 1] > close[i]) or (signal[i] == -1 and close[i + 1] < close[i])
+        for i in range(len(signal) - 1)
+    )
+    num_trades = sum(signal[i] != signal[i - 1] for i in range(1, len(signal)))
+    assert strategy.metadata["num_trades"] == num_trades
+    assert isinstance(strategy.metadata["num_trades"], int)
+    assert strategy.metadata["win_rate"] == pytest.approx(wins / num_trades)
+
+
+@pytest.mark.parametrize("quantile", [0.0, 0.25, 0.5, 0.8, 0.95, 1.0])
+def test_linear_percentile_matches_numpy(quantile):
+    """Test that the selection-based percentile reproduces np.percentile exactly."""
+    from strategies.volume_profile_strategy import _linear_percentile
+
+    rng = np.random.default_rng(13)
+    for values in (rng.uniform(0, 1, 20), rng.integers(0, 3, 20).astype(float), np.zeros(1), np.append(rng.uniform(0, 1, 5), np.nan)):
+        expected = np.percentile(values, quantile * 100)
+        np.testing.assert_equal(_linear_percentile(values.copy(), quantile), expected)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_volume_profile_flat_prices_emit_no_signals(mocker, compiled):
+    """Test that windows without a usable price range are skipped on both paths."""
+    from strategies import volume_profile_strategy as module
+
+    mocker.patch.object(module, "NUMBA_AVAILABLE", compiled)
+    data = pd.DataFrame({
+        "high": np.full(150, 100.0),
+        "low": np.full(150, 100.0),
+        "close": np.full(150, 100.0),
+        "volume": np.full(150, 1000.0),
+    }, index=pd.date_range(start="2023-01-01", periods=150))
+
+    signals = VolumeProfileStrategy(name="VolumeProfile").process_data(data)
+    assert not signals["signal"].any()
@@ -0,0 +1 @@
+# Trading Strategy Aggregation System - Utilities Package
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+JSON encoding helpers backed by orjson when it is installed.
+
+Both implementations emit the same layout: sorted keys, compact separators,
+or a two-space indent when requested. Output is always bytes.
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Parse JSON from a str or bytes object."""
+        return orjson.loads(data)
+
+    def dumps(obj, indent=False, default=None) -> bytes:
+        """Serialize an object to JSON bytes with sorted keys."""
+        option = orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Parse JSON from a str or bytes object."""
+        return json.loads(data)
+
+    def dumps(obj, indent=False, default=None) -> bytes:
+        """Serialize an object to JSON bytes with sorted keys."""
+        if indent:
+            text = json.dumps(obj, sort_keys=True, indent=2, default=default)
+        else:
+            text = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=default)
+        return text.encode()
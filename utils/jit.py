@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Optional Numba support for the compiled numerical kernels.
+
+Numba is an optional dependency. When it is not installed, ``njit`` becomes
+a no-op decorator and ``NUMBA_AVAILABLE`` is False, so callers can pick a
+vectorized NumPy/pandas path instead of running the kernels as plain Python.
+"""
+
+try:
+    from numba import njit, prange, types
+    from numba.core.sigutils import normalize_signature
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+def signatures(*specs):
+    """
+    Build eager-compilation signatures for njit from signature strings.
+
+    Array arguments are typed read-only: a read-only signature also accepts
+    writable arrays, while pandas hands out read-only buffers under
+    copy-on-write, so one signature per dtype layout covers both.
+
+    Args:
+        *specs: Numba signature strings, e.g. "f8[::1](f8[::1], i8)"
+
+    Returns:
+        List of signatures for njit, or the strings unchanged without numba
+    """
+    if not NUMBA_AVAILABLE:
+        return list(specs)
+
+    compiled = []
+    for spec in specs:
+        args, return_type = normalize_signature(spec)
+        args = [arg.copy(readonly=True) if isinstance(arg, types.Array) else arg for arg in args]
+        compiled.append(return_type(*args))
+    return compiled
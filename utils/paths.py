@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Filesystem layout shared by the command-line and GUI entry points.
+"""
+
+import os
+
+# Directories the application expects to exist (relative to the working directory)
+REQUIRED_DIRS = (
+    "data",
+    "strategies",
+    "aggregator",
+    "reports",
+    "config",
+    "logs",
+    "reports/output",
+    "reports/output/plots"
+)
+
+_dirs_created = False
+
+
+def ensure_directories() -> None:
+    """
+    Create the required directories once per process.
+    
+    Subsequent calls are no-ops, so callers can invoke this on every run
+    without repeating the filesystem checks.
+    """
+    global _dirs_created
+    if _dirs_created:
+        return
+    
+    # os.makedirs creates parents, so only the deepest paths need a call
+    leaves = {
+        directory for directory in REQUIRED_DIRS
+        if not any(other.startswith(directory + "/") for other in REQUIRED_DIRS)
+    }
+    for directory in sorted(leaves):
+        os.makedirs(directory, exist_ok=True)
+    _dirs_created = True